@@ -0,0 +1,153 @@
+"""
+Compares building earthquake lists over the shared session with building
+them over a new session each time (the behavior before connections were
+shared). The page is served by a local HTTPS server with a throwaway CA,
+so each list pays for a real TLS handshake unless the connection is reused,
+but none of the network latency to PHIVOLCS (which would only widen the
+gap). Needs the openssl command line tool to create the certificates.
+
+    python -m benchmarks.https_connections [construction_count]
+"""
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+import requests
+from eqdatatools import EarthquakeList
+from eqdatatools.scraper._session import ConnectionManager
+from benchmarks.snapshot_cold_start import SOURCE_URLS, create_phivolcs_page
+
+DEFAULT_CONSTRUCTION_COUNT = 100
+ENTRY_COUNT = 50
+
+SERVER_CERT_EXTENSIONS = """\
+basicConstraints = CA:FALSE
+keyUsage = critical, digitalSignature
+extendedKeyUsage = serverAuth
+subjectAltName = IP:127.0.0.1
+"""
+
+
+def create_test_certificates(directory):
+    """
+    Creates a CA and a certificate for 127.0.0.1 signed by it, and returns
+    the paths of the CA certificate, server certificate and server key.
+    """
+    ca_file, ca_key = os.path.join(directory, "ca.pem"), os.path.join(directory, "ca.key")
+    cert_file, key_file = os.path.join(directory, "server.pem"), os.path.join(directory, "server.key")
+    request_file, extensions_file = os.path.join(directory, "server.csr"), os.path.join(directory, "server.ext")
+    key_options = ["-newkey", "ec", "-pkeyopt", "ec_paramgen_curve:prime256v1", "-nodes"]
+
+    with open(extensions_file, "w") as file:
+        file.write(SERVER_CERT_EXTENSIONS)
+
+    commands = [
+        ["openssl", "req", "-x509", *key_options, "-keyout", ca_key, "-out", ca_file, "-days", "1",
+         "-subj", "/CN=eqdatatools test CA",
+         "-addext", "basicConstraints = critical, CA:TRUE",
+         "-addext", "keyUsage = critical, keyCertSign, cRLSign"],
+        ["openssl", "req", "-new", *key_options, "-keyout", key_file, "-out", request_file, "-subj", "/CN=127.0.0.1"],
+        ["openssl", "x509", "-req", "-in", request_file, "-CA", ca_file, "-CAkey", ca_key, "-CAcreateserial",
+         "-out", cert_file, "-days", "1", "-extfile", extensions_file],
+    ]
+
+    for command in commands:
+        subprocess.run(command, check=True, capture_output=True)
+
+    return ca_file, cert_file, key_file
+
+
+def start_https_server(cert_file, key_file, pages):
+    """
+    Serves the pages over HTTPS with keep-alive connections. The server's
+    `connection_count` is the number of TLS connections it has accepted.
+    """
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Otherwise the body waits for the client to acknowledge the headers
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            body = pages.get(self.path)
+
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    class StubServer(ThreadingHTTPServer):
+        daemon_threads = True
+        connection_count = 0
+
+        def get_request(self):
+            request = super().get_request()
+            self.connection_count += 1
+
+            return request
+
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    server = StubServer(("127.0.0.1", 0), StubHandler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def measure_constructions(construction_count, fetch_page):
+    """Returns the total time (in milliseconds) of building the lists."""
+    with mock.patch("eqdatatools.scraper.phivolcs.fetch", fetch_page):
+        start = time.perf_counter()
+
+        for _ in range(construction_count):
+            EarthquakeList(SOURCE_URLS["PHIVOLCS"])
+
+        return (time.perf_counter() - start) * 1000
+
+
+def main():
+    construction_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CONSTRUCTION_COUNT
+
+    with tempfile.TemporaryDirectory() as directory:
+        ca_file, cert_file, key_file = create_test_certificates(directory)
+        server = start_https_server(cert_file, key_file, {"/": create_phivolcs_page(ENTRY_COUNT)})
+        stub_url = f"https://127.0.0.1:{server.server_address[1]}/"
+        manager = ConnectionManager(ca_file=ca_file, ca_url=stub_url)
+
+        def fetch_with_shared_session(_url):
+            return manager.get_session().get(stub_url)
+
+        def fetch_with_new_session(_url):
+            with requests.Session() as session:
+                return session.get(stub_url, verify=ca_file)
+
+        print(f"{construction_count} sequential constructions of a {ENTRY_COUNT}-entry list")
+        print(f"{'session':<10}{'total (ms)':>12}{'per list (ms)':>15}{'handshakes':>12}")
+
+        for name, fetch_page in [("shared", fetch_with_shared_session), ("new", fetch_with_new_session)]:
+            connection_count = server.connection_count
+            total_time = measure_constructions(construction_count, fetch_page)
+            handshakes = server.connection_count - connection_count
+            print(f"{name:<10}{total_time:>12.1f}{total_time / construction_count:>15.2f}{handshakes:>12}")
+
+        manager.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measures the decode time and peak memory of JMA's list.json for each JSON
+backend, compared with decoding response.text into full dicts as the
+scraper used to. Backends that aren't installed are skipped (install the
+"fast-json" extra to include msgspec and orjson).
+
+    python -m benchmarks.jma_json_decoding [entry_count]
+"""
+import json
+import sys
+import time
+import tracemalloc
+from eqdatatools.scraper._json import decode_jma_entries, msgspec, orjson
+
+DEFAULT_ENTRY_COUNT = 20000
+REPEATS = 5
+
+
+def create_payload(entry_count):
+    """
+    Returns a list.json payload with entries shaped like JMA's, including
+    the per-prefecture intensities that the scraper never reads.
+    """
+    entries = []
+
+    for index in range(entry_count):
+        entries.append({
+            "ctt": f"2024081002{index % 60:02d}00",
+            "eid": f"20240810023{index:07d}",
+            "rdt": "2024-08-10T02:38:00+09:00",
+            "ttl": "震源・震度情報",
+            "ift": "発表",
+            "ser": "1",
+            "at": "2024-08-10T02:34:00+09:00",
+            "anm": "千葉県東方沖",
+            "acd": "350",
+            "cod": "+35.1+139.2-10000/",
+            "mag": "3.5",
+            "maxi": "5-",
+            "int": [
+                {"code": "12", "maxi": "2", "city": [{"code": "1220100", "maxi": "2"}, {"code": "1220200", "maxi": "1"}]},
+                {"code": "13", "maxi": "1", "city": [{"code": "1310100", "maxi": "1"}]},
+            ],
+            "json": f"20240810023800_20240810023400_VXSE5k_1_{index}.json",
+            "en_ttl": "Earthquake and Seismic Intensity Information",
+            "en_anm": "Off the East Coast of Chiba",
+        })
+
+    return json.dumps(entries, ensure_ascii=False).encode("utf-8")
+
+
+def decode_full_text(content):
+    return json.loads(content.decode("utf-8"))
+
+
+def measure(decode, content):
+    """Returns the best decode time (in seconds) and the peak memory (in bytes)."""
+    best_time = None
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        decode(content)
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    tracemalloc.start()
+    entries = decode(content)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del entries
+
+    return best_time, peak
+
+
+def main():
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRY_COUNT
+    content = create_payload(entry_count)
+    decoders = [("json, full text (previous)", decode_full_text), ("json", lambda data: decode_jma_entries(data, "json"))]
+
+    if orjson:
+        decoders.append(("orjson", lambda data: decode_jma_entries(data, "orjson")))
+    if msgspec:
+        decoders.append(("msgspec", lambda data: decode_jma_entries(data, "msgspec")))
+
+    print(f"{entry_count} entries, {len(content) / 1e6:.1f} MB payload")
+    print(f"{'backend':<28}{'decode (ms)':>14}{'peak (MB)':>12}")
+
+    for name, decode in decoders:
+        elapsed, peak = measure(decode, content)
+        print(f"{name:<28}{elapsed * 1000:>14.1f}{peak / 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Builds large PHIVOLCS and JMA lists with memory profiling enabled, prints
+the retained and peak memory of each stage, and exits with status 1 if the
+memory retained per entry goes over budget (e.g. because parse trees are
+kept alive again), so it can run as a regression check.
+
+    python -m benchmarks.memory_profile [entry_count]
+"""
+import sys
+from types import SimpleNamespace
+from unittest import mock
+from eqdatatools import EarthquakeList
+from benchmarks.snapshot_cold_start import SOURCE_URLS, create_jma_payload, create_phivolcs_page
+
+DEFAULT_ENTRY_COUNT = 20000
+
+# Budget for the memory retained per entry of a built list. Entries take
+# about 1.4 KB each at the time of writing.
+MAX_BYTES_PER_ENTRY = 3000
+
+
+def build_profiled_list(source, entry_count):
+    if source == "PHIVOLCS":
+        page = create_phivolcs_page(entry_count)
+        response = SimpleNamespace(text=page.decode("utf-8"), content=page)
+    else:
+        response = SimpleNamespace(content=create_jma_payload(entry_count))
+
+    with mock.patch(f"eqdatatools.scraper.{source.lower()}.fetch", return_value=response):
+        return EarthquakeList(SOURCE_URLS[source], profile=True)
+
+
+def main():
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRY_COUNT
+    over_budget = []
+
+    for source in SOURCE_URLS:
+        report = build_profiled_list(source, entry_count).get_memory_profile()
+
+        print(f"{source}: {report['entries']} entries, {report['bytes_per_entry']:.0f} bytes per entry, "
+              f"{report['peak_bytes'] / 1e6:.1f} MB peak")
+        print(f"  {'stage':<10}{'retained (KB)':>15}{'peak (KB)':>12}")
+
+        for stage in report["stages"]:
+            print(f"  {stage['stage']:<10}{stage['retained_bytes'] / 1000:>15.1f}{stage['peak_bytes'] / 1000:>12.1f}")
+
+        if report["bytes_per_entry"] > MAX_BYTES_PER_ENTRY:
+            over_budget.append(source)
+
+    if over_budget:
+        print(f"Over the budget of {MAX_BYTES_PER_ENTRY} bytes per entry: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Compares the cold start of an earthquake list built from its source with
+one restored from a snapshot. The source pages are served by a local HTTP
+server, so the build includes a real fetch, HTML/JSON parsing and the stats
+pass, but none of the network latency to PHIVOLCS or JMA (which would only
+widen the gap).
+
+    python -m benchmarks.snapshot_cold_start [entry_count]
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from eqdatatools import EarthquakeList
+from eqdatatools.scraper import get_session
+
+DEFAULT_ENTRY_COUNT = 5000
+REPEATS = 5
+
+SOURCE_URLS = {
+    "PHIVOLCS": "https://earthquake.phivolcs.dost.gov.ph/",
+    "JMA": "https://www.jma.go.jp/bosai/quake/data/list.json",
+}
+
+
+def create_phivolcs_page(entry_count):
+    rows = "".join(
+        f"<tr><td>{1 + index % 28:02d} August 2024 - {1 + index % 12:02d}:{index % 60:02d} AM</td><td>12.1</td>"
+        f"<td>121.5</td><td>{index % 300}</td><td>{2 + index % 50 / 10:.1f}</td>"
+        f"<td><a href='2024_Files/{index}.html'>010 km N 45° W of Town (Bohol)</a></td></tr>"
+        for index in range(entry_count)
+    )
+
+    return f"<html><table></table><table></table><table><tr><th>Date</th></tr>{rows}</table></html>".encode("utf-8")
+
+
+def create_jma_payload(entry_count):
+    entries = [
+        {
+            "at": f"2024-08-{1 + index // 1440 % 28:02d}T{index // 60 % 24:02d}:{index % 60:02d}:00+09:00",
+            "rdt": "2024-08-10T02:38:00+09:00",
+            "anm": "千葉県東方沖",
+            "en_anm": "Off the East Coast of Chiba",
+            "mag": f"{2 + index % 50 / 10:.1f}",
+            "maxi": "3",
+            "cod": "+35.1+139.2-10000/",
+            "ctt": str(index),
+            "int": [{"code": "12", "maxi": "3", "city": [{"code": "1220100", "maxi": "3"}]}],
+        }
+        for index in reversed(range(entry_count))
+    ]
+
+    return json.dumps(entries, ensure_ascii=False).encode("utf-8")
+
+
+def start_stub_server(pages):
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = pages[self.path]
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def measure(function):
+    """Returns the median time (in milliseconds) of running the function."""
+    times = []
+
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(times)
+
+
+def main():
+    entry_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ENTRY_COUNT
+    server = start_stub_server({
+        "/PHIVOLCS": create_phivolcs_page(entry_count),
+        "/JMA": create_jma_payload(entry_count),
+    })
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{entry_count} entries per list")
+    print(f"{'source':<10}{'build (ms)':>12}{'snapshot (ms)':>15}{'speedup':>10}{'size (KB)':>11}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for source, url in SOURCE_URLS.items():
+            def fetch_from_stub(_url, source=source):
+                return get_session().get(f"{stub_url}/{source}")
+
+            path = os.path.join(directory, f"{source}.snapshot")
+
+            with mock.patch(f"eqdatatools.scraper.{source.lower()}.fetch", fetch_from_stub):
+                EarthquakeList(url).save_snapshot(path)
+                build_time = measure(lambda: EarthquakeList(url))
+
+            load_time = measure(lambda: EarthquakeList.load_snapshot(path))
+            size = os.path.getsize(path) / 1000
+            print(f"{source:<10}{build_time:>12.1f}{load_time:>15.1f}{build_time / load_time:>9.1f}x{size:>11.1f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
 from eqdatatools.eq_list import EarthquakeList
+from eqdatatools.merge import merge_eq_lists
+from eqdatatools.sources import Source, register_source
 
-__all__ = ["EarthquakeList"]
+__all__ = ["EarthquakeList", "merge_eq_lists", "Source", "register_source"]
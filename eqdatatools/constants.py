@@ -42,14 +42,63 @@ VALID_DATE_FORMATS: Dict[str, List[str]] = {
     ]
 }
 
+# Timezone of each source's dates. Entries are stored in UTC and converted
+# back to this timezone for display. Date strings without a UTC offset are
+# assumed to be in it.
 TIMEZONES: Dict[str, timezone] = {
     "PHIVOLCS": timezone(timedelta(hours=8)),
-    "JMA": None  # JMA dates are always in UTC time
+    "JMA": timezone(timedelta(hours=9))
 }
 
+# JMA seismic intensity (shindo) levels, from lowest to highest. Levels 5
+# and 6 are split into lower (-) and upper (+), so entries store the
+# position of their level in this list instead of the level itself.
+JMA_INTENSITY_LEVELS: List[str] = ["0", "1", "2", "3", "4", "5-", "5+", "6-", "6+", "7"]
+
 DATE_REGEX_PATTERN: Dict[str, str] = {
     "PHIVOLCS": r"((\d{2})\s+(\w+)\s+(\d{4})\s+-\s+(\d{2}:\d{2}\s+[AaPp][Mm]))"
 }
 
+# Pattern to quickly get the month and year from a raw, uncleaned date
+# string, e.g. "01 August 2024 - 07:30 AM" (which may contain non-printable
+# characters between words)
+RAW_MONTH_YEAR_PATTERN: Dict[str, str] = {
+    "PHIVOLCS": r"([A-Za-z]{3})[A-Za-z]*[^A-Za-z0-9]+(\d{4})"
+}
+
+MONTH_ABBREVIATIONS: Dict[str, int] = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12
+}
+
 # Pattern to match non-printable characters
 NON_PRINTABLE_CHAR_PATTERN = r"[^\x20-\x7E]"
+
+# Settings for fetching data from sources
+FETCH_CONNECT_TIMEOUT = 10  # seconds
+FETCH_READ_TIMEOUT = 30  # seconds
+FETCH_MAX_RETRIES = 3
+FETCH_BACKOFF_BASE = 0.5  # seconds
+FETCH_BACKOFF_MAX = 30  # seconds
+FETCH_RATE_LIMIT = 2.0  # requests per second, per host
+FETCH_RATE_BURST = 4
+FETCH_CIRCUIT_FAILURE_THRESHOLD = 5
+FETCH_CIRCUIT_RESET_TIMEOUT = 60  # seconds
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Settings for the connection pools of the shared session
+CONNECTION_POOL_HOSTS = 10  # Number of hosts to keep connection pools for
+CONNECTION_POOL_MAXSIZE = 16  # Connections kept alive per host
+
+# Set to "1" to record memory usage per stage when building earthquake lists
+PROFILE_ENV_VAR = "EQDATATOOLS_PROFILE"
+
+# Settings for downloading PHIVOLCS event details pages and graphics
+# The cache is kept per user (rather than in the shared temp directory) so
+# that other users can't replace the cached files
+ENRICHMENT_CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "eqdatatools"
+)
+ENRICHMENT_MAX_WORKERS = 8
+ENRICHMENT_RATE_LIMIT = 20.0  # requests per second, per host
@@ -1,5 +1,6 @@
+from ._base import DisplayEQData
 from .jma import JMADisplayEQData
 from .phivolcs import PHIVOLCSDisplayEQData
 
 
-__all__ = ["JMADisplayEQData", "PHIVOLCSDisplayEQData"]
+__all__ = ["DisplayEQData", "JMADisplayEQData", "PHIVOLCSDisplayEQData"]
@@ -1,12 +1,16 @@
-from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from eqdatatools.sources import registry
 
 
-class DisplayEQData(ABC):
-    def __init__(self, eq_list: List[Dict[str, Any]], eq_stats: Dict[str, Any]) -> None:
+class DisplayEQData:
+    # Name of the source, used to display dates in the source's local time
+    SOURCE: str = None
+
+    def __init__(self, eq_list: List[Dict[str, Any]], eq_stats: Dict[str, Any], source: Optional[str] = None) -> None:
         self._eq_list = eq_list
         self._eq_stats = eq_stats
+        self._source = source or self.SOURCE
 
     def display_overview(self) -> None:
         month_and_year = self._get_month_and_year()
@@ -33,9 +37,31 @@ Total Recorded  : {total_recorded}
 
         print(result)
 
-    @abstractmethod
-    def display_all_entries(self) -> None:
-        pass
+    def display_all_entries(self,
+                            location: bool = True,
+                            date: bool = True,
+                            magnitude: bool = True,
+                            link: bool = True,
+                            ) -> None:
+
+        attributes_to_display = []
+
+        if location:
+            attributes_to_display.append(["Location", "location"])
+        if date:
+            attributes_to_display.append(["Date", "date"])
+        if magnitude:
+            attributes_to_display.append(["Magnitude", "magnitude"])
+        if link:
+            attributes_to_display.append(["EQ Details Link", "event_details_url"])
+
+        for every_entry in self._eq_list:
+            for attribute in attributes_to_display:
+                if attribute[0] != "Date":
+                    print(f"{attribute[0]}: {every_entry[attribute[1]]}")
+                else:
+                    print(f"{attribute[0]}: {self._to_local_time(every_entry[attribute[1]])}")
+            print()
 
     def _get_strongest_eq_location(self) -> str:
         return self._eq_stats["strongest"]["location"]
@@ -65,8 +91,8 @@ Total Recorded  : {total_recorded}
         return self._eq_stats["recorded_eqs"]["total_per_magnitude"]["below_m4_0"]
 
     def _get_month_and_year(self) -> str:
-        start_date: datetime = self._eq_stats["date_range"]["start_date"]
-        end_date: datetime = self._eq_stats["date_range"]["end_date"]
+        start_date = self._to_local_time(self._eq_stats["date_range"]["start_date"])
+        end_date = self._to_local_time(self._eq_stats["date_range"]["end_date"])
 
         if start_date.month == end_date.month:
             return start_date.strftime("%B %Y")
@@ -75,3 +101,10 @@ Total Recorded  : {total_recorded}
                 return start_date.strftime("%B") + "–" + end_date.strftime("%B %Y")
             else:
                 return start_date.strftime("%B %Y") + "–" + end_date.strftime("%B %Y")
+
+    def _to_local_time(self, date: datetime) -> datetime:
+        """
+        Entry dates are stored in UTC. This converts them to the timezone of
+        the source so they are displayed as the source does.
+        """
+        return date.astimezone(registry.get_timezone(self._source))
@@ -2,11 +2,7 @@ from ._base import DisplayEQData
 
 
 class JMADisplayEQData(DisplayEQData):
-    def _get_strongest_eq_location(self) -> str:
-        return self._eq_stats["strongest"]["location"]["location_en"]
-
-    def _get_weakest_eq_location(self) -> str:
-        return self._eq_stats["weakest"]["location"]["location_en"]
+    SOURCE = "JMA"
 
     def display_all_entries(self,
                             location: bool = True,
@@ -31,6 +27,6 @@ class JMADisplayEQData(DisplayEQData):
                 if attribute[0] != "Date":
                     print(f"{attribute[0]}: {every_entry[attribute[1]]}")
                 else:
-                    print(f"Issuance Date: {every_entry[attribute[1]]['issuance_date']}")
-                    print(f"Observed Date: {every_entry[attribute[1]]['observed_date']}")
+                    print(f"Issuance Date: {self._to_local_time(every_entry['issuance_date'])}")
+                    print(f"Observed Date: {self._to_local_time(every_entry['date'])}")
             print()
@@ -2,6 +2,8 @@ from ._base import DisplayEQData
 
 
 class PHIVOLCSDisplayEQData(DisplayEQData):
+    SOURCE = "PHIVOLCS"
+
     def display_all_entries(self,
                             location: bool = True,
                             date: bool = True,
@@ -31,5 +33,8 @@ class PHIVOLCSDisplayEQData(DisplayEQData):
 
         for every_entry in self._eq_list:
             for attribute in attributes_to_display:
-                print(f"{attribute[0]}: {every_entry[attribute[1]]}")
+                if attribute[0] != "Date":
+                    print(f"{attribute[0]}: {every_entry[attribute[1]]}")
+                else:
+                    print(f"{attribute[0]}: {self._to_local_time(every_entry[attribute[1]])}")
             print()
@@ -1,4 +1,10 @@
 from . import jma
 from . import phivolcs
+from ._approximate import ApproximateStats
+from ._base import StatsGenerator
+from ._histogram import Histogram, DEPTH_EDGES, JMA_INTENSITY_EDGES, JMA_INTENSITY_LABELS, get_jma_intensity_histogram
+from ._time_buckets import TimeBucketAggregator
+from ._top_k import TopK, DEFAULT_TOP_K
 
-__all__ = ["jma", "phivolcs"]
+__all__ = ["jma", "phivolcs", "StatsGenerator", "ApproximateStats", "Histogram", "DEPTH_EDGES", "JMA_INTENSITY_EDGES",
+           "JMA_INTENSITY_LABELS", "get_jma_intensity_histogram", "TimeBucketAggregator", "TopK", "DEFAULT_TOP_K"]
@@ -0,0 +1,623 @@
+import hashlib
+import math
+import random
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from eqdatatools.schema import to_utc
+from ._histogram import get_magnitude_label
+
+# Number of entries kept in the random sample
+DEFAULT_SAMPLE_SIZE = 1000
+
+# Count-min sketch size. Counts are overestimated by at most
+# e / width * total with probability 1 - e^-depth.
+DEFAULT_SKETCH_WIDTH = 2048
+DEFAULT_SKETCH_DEPTH = 5
+
+# HyperLogLog registers are 2^precision bytes, with a relative standard
+# error of 1.04 / sqrt(2^precision) (about 1.6% for precision 12)
+DEFAULT_HLL_PRECISION = 12
+
+# Higher compression keeps more t-digest centroids and gives more accurate
+# quantiles. The number of centroids stays below about `compression`.
+DEFAULT_COMPRESSION = 100
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+# Number of regions with the highest estimated counts that are reported
+DEFAULT_TOP_REGIONS = 20
+
+
+def _hash_key(key: str, digest_size: int = 8) -> bytes:
+    """
+    Hashes a key with BLAKE2b. Unlike hash(), the result is the same in every
+    process, so sketches built by different workers can be merged.
+    """
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=digest_size).digest()
+
+
+class ReservoirSample:
+    """
+    Keeps a uniform random sample of at most `size` entries from a stream of
+    unknown length (reservoir sampling, Algorithm R).
+    """
+
+    def __init__(self, size: int = DEFAULT_SAMPLE_SIZE, seed: Optional[int] = None) -> None:
+        if size < 1:
+            raise ValueError("Sample size must be a positive number.")
+
+        self.size = size
+        self.seen = 0
+        self._items: List[Any] = []
+        self._random = random.Random(seed)
+
+    def add(self, item: Any) -> None:
+        self.seen += 1
+
+        if len(self._items) < self.size:
+            self._items.append(item)
+            return
+
+        index = self._random.randrange(self.seen)
+
+        if index < self.size:
+            self._items[index] = item
+
+    def merge(self, other: "ReservoirSample") -> None:
+        """
+        Combines the samples so the result is a sample of both streams. Each
+        item is drawn from one of the samples with a probability proportional
+        to the number of items that sample still represents.
+        """
+        items, other_items = list(self._items), list(other._items)
+        remaining, other_remaining = self.seen, other.seen
+        merged_items = []
+
+        while len(merged_items) < self.size and (items or other_items):
+            total_remaining = remaining + other_remaining
+
+            if other_items and (not items or self._random.random() * total_remaining >= remaining):
+                merged_items.append(other_items.pop(self._random.randrange(len(other_items))))
+                other_remaining -= 1
+            else:
+                merged_items.append(items.pop(self._random.randrange(len(items))))
+                remaining -= 1
+
+        self._items = merged_items
+        self.seen += other.seen
+
+    def get_sample(self) -> List[Any]:
+        return list(self._items)
+
+    def get_sampling_rate(self) -> float:
+        return len(self._items) / self.seen if self.seen else 0.0
+
+
+class CountMinSketch:
+    """
+    Estimates how many times each key was added using a depth x width table
+    of counters. Estimates are never too low, and are too high by at most
+    epsilon * total with probability 1 - delta.
+
+    Keys can't be listed from the table itself, so the `top_capacity` keys
+    with the highest estimates are tracked alongside it.
+    """
+
+    def __init__(self,
+                 width: int = DEFAULT_SKETCH_WIDTH,
+                 depth: int = DEFAULT_SKETCH_DEPTH,
+                 top_capacity: int = DEFAULT_TOP_REGIONS
+                 ) -> None:
+        if width < 1 or depth < 1:
+            raise ValueError("Sketch width and depth must be positive numbers.")
+
+        self.width = width
+        self.depth = depth
+        self.top_capacity = top_capacity
+        self.total = 0
+        self._table = [array("Q", bytes(8 * width)) for _ in range(depth)]
+        self._top: Dict[str, int] = {}
+        self._top_floor = 0
+
+    def add(self, key: str, count: int = 1) -> None:
+        estimate = None
+
+        for row, index in zip(self._table, self._get_indices(key)):
+            row[index] += count
+
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+
+        self.total += count
+        self._track(key, estimate)
+
+    def estimate(self, key: str) -> int:
+        return min(row[index] for row, index in zip(self._table, self._get_indices(key)))
+
+    def merge(self, other: "CountMinSketch") -> None:
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge count-min sketches with different widths or depths.")
+
+        for row, other_row in zip(self._table, other._table):
+            for index, count in enumerate(other_row):
+                if count:
+                    row[index] += count
+
+        self.total += other.total
+        keys = set(self._top) | set(other._top)
+        self._top = {}
+        self._top_floor = 0
+
+        for key in keys:
+            self._track(key, self.estimate(key))
+
+    def get_top(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Returns the tracked keys and their estimates, highest first."""
+        top = sorted(self._top, key=self.estimate, reverse=True)[:n]
+
+        return [(key, self.estimate(key)) for key in top]
+
+    def get_error_bounds(self) -> Dict[str, float]:
+        epsilon = math.e / self.width
+
+        return {
+            "epsilon": epsilon,
+            "delta": math.exp(-self.depth),
+            "max_overestimate": epsilon * self.total,
+        }
+
+    def _track(self, key: str, estimate: int) -> None:
+        """
+        Updates the tracked keys. _top_floor is the lowest estimate among the
+        tracked keys when it was last computed. Estimates only grow, so it is
+        a lower bound and keys at or below it can be skipped right away.
+        """
+        if self.top_capacity < 1:
+            return
+
+        if key in self._top or len(self._top) < self.top_capacity:
+            self._top[key] = estimate
+            return
+
+        if estimate <= self._top_floor:
+            return
+
+        lowest_key = min(self._top, key=self._top.get)
+
+        if estimate > self._top[lowest_key]:
+            del self._top[lowest_key]
+            self._top[key] = estimate
+
+        self._top_floor = min(self._top.values())
+
+    def _get_indices(self, key: str) -> List[int]:
+        """
+        Derives one index per row from a single 128-bit hash using double
+        hashing (h1 + i * h2).
+        """
+        digest = _hash_key(key, 16)
+        first_hash = int.from_bytes(digest[:8], "big")
+        second_hash = int.from_bytes(digest[8:], "big") | 1
+
+        return [(first_hash + row * second_hash) % self.width for row in range(self.depth)]
+
+
+class HyperLogLog:
+    """
+    Estimates the number of distinct keys added, using 2^precision one-byte
+    registers regardless of how many keys there are.
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION) -> None:
+        if not 4 <= precision <= 16:
+            raise ValueError("HyperLogLog precision must be between 4 and 16.")
+
+        self.precision = precision
+        self._register_count = 1 << precision
+        self._registers = bytearray(self._register_count)
+
+    def add(self, key: str) -> None:
+        key_hash = int.from_bytes(_hash_key(key), "big")
+        remaining_bits = 64 - self.precision
+        index = key_hash >> remaining_bits
+        remainder = key_hash & ((1 << remaining_bits) - 1)
+
+        # Position of the leftmost 1 bit in the remaining bits
+        rank = remaining_bits - remainder.bit_length() + 1
+
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def estimate(self) -> int:
+        """
+        Estimates the count with the improved estimator of Ertl ("New
+        cardinality estimation algorithms for HyperLogLog sketches", 2017).
+        Unlike switching from linear counting to the raw estimate at 2.5 *
+        register count, which is biased by a few percent around the switch,
+        it is unbiased from small to very large counts.
+        """
+        register_count = self._register_count
+        max_rank = 64 - self.precision + 1
+        rank_counts = [0] * (max_rank + 1)
+
+        for register in self._registers:
+            rank_counts[register] += 1
+
+        total = register_count * self._tau(1 - rank_counts[max_rank] / register_count)
+
+        for rank in range(max_rank - 1, 0, -1):
+            total = 0.5 * (total + rank_counts[rank])
+
+        total += register_count * self._sigma(rank_counts[0] / register_count)
+
+        if math.isinf(total):
+            return 0
+
+        return round(register_count ** 2 / (2 * math.log(2) * total))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precisions.")
+
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def get_error_bounds(self) -> Dict[str, float]:
+        """Returns the relative standard error and a ~95% confidence interval."""
+        estimate = self.estimate()
+        relative_error = 1.04 / math.sqrt(self._register_count)
+
+        return {
+            "relative_standard_error": relative_error,
+            "lower_bound": max(0.0, estimate * (1 - 2 * relative_error)),
+            "upper_bound": estimate * (1 + 2 * relative_error),
+        }
+
+    @staticmethod
+    def _sigma(x: float) -> float:
+        """Correction for empty registers, x being their share of all registers."""
+        if x == 1:
+            return math.inf
+
+        y, z = 1.0, x
+
+        while True:
+            x *= x
+            previous_z = z
+            z += x * y
+            y += y
+
+            if z == previous_z:
+                return z
+
+    @staticmethod
+    def _tau(x: float) -> float:
+        """Correction for registers at the highest possible rank."""
+        if x == 0 or x == 1:
+            return 0.0
+
+        y, z = 1.0, 1 - x
+
+        while True:
+            x = math.sqrt(x)
+            previous_z = z
+            y *= 0.5
+            z -= (1 - x) ** 2 * y
+
+            if z == previous_z:
+                return z / 3
+
+
+class TDigest:
+    """
+    Estimates quantiles of a stream of values with a merging t-digest. Values
+    are grouped into centroids (mean and weight), which are kept small near
+    the tails so extreme quantiles such as p99 stay accurate.
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION) -> None:
+        if compression < 10:
+            raise ValueError("Compression must be at least 10.")
+
+        self.compression = compression
+        self.count = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._centroids: List[Tuple[float, float]] = []
+        self._buffer: List[Tuple[float, float]] = []
+        self._buffer_limit = 5 * compression
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        self._buffer.append((value, weight))
+        self.count += weight
+
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> None:
+        if other.count == 0:
+            return
+
+        self._buffer.extend(other._centroids)
+        self._buffer.extend(other._buffer)
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the estimated value at quantile q (0 to 1), interpolating
+        between the centers of neighbouring centroids.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+
+        self._compress()
+
+        if not self._centroids:
+            return None
+
+        target = q * self.count
+        previous_center, previous_mean = 0.0, self.min
+        cumulative_weight = 0.0
+
+        for mean, weight in self._centroids:
+            center = cumulative_weight + weight / 2
+
+            if target <= center:
+                return self._interpolate(target, previous_center, previous_mean, center, mean)
+
+            previous_center, previous_mean = center, mean
+            cumulative_weight += weight
+
+        return self._interpolate(target, previous_center, previous_mean, self.count, self.max)
+
+    def get_rank_error(self, q: float) -> float:
+        """
+        Returns the largest possible difference between q and the true
+        quantile of the estimate, i.e. half the weight of the centroids the
+        estimate was interpolated between, relative to the count.
+        """
+        self._compress()
+
+        if not self._centroids:
+            return 0.0
+
+        target = q * self.count
+        cumulative_weight = 0.0
+        previous_weight = 0.0
+
+        for _, weight in self._centroids:
+            if target <= cumulative_weight + weight / 2:
+                break
+
+            previous_weight = weight
+            cumulative_weight += weight
+        else:
+            weight = 0.0
+
+        return (previous_weight + weight) / (2 * self.count)
+
+    def get_centroid_count(self) -> int:
+        self._compress()
+
+        return len(self._centroids)
+
+    def _compress(self) -> None:
+        """
+        Merges the buffered values into the centroids. Neighbouring centroids
+        are combined as long as the result stays within the size allowed at
+        its quantile by the k1 scale function.
+        """
+        if not self._buffer:
+            return
+
+        items = sorted(self._centroids + self._buffer)
+        self._buffer = []
+        centroids = []
+        weight_so_far = 0.0
+        current_mean, current_weight = items[0]
+        weight_limit = self.count * self._get_quantile_limit(0.0)
+
+        for mean, weight in items[1:]:
+            if weight_so_far + current_weight + weight <= weight_limit:
+                current_weight += weight
+                current_mean += (mean - current_mean) * weight / current_weight
+            else:
+                weight_so_far += current_weight
+                centroids.append((current_mean, current_weight))
+                weight_limit = self.count * self._get_quantile_limit(weight_so_far / self.count)
+                current_mean, current_weight = mean, weight
+
+        centroids.append((current_mean, current_weight))
+        self._centroids = centroids
+
+    def _get_quantile_limit(self, q: float) -> float:
+        """
+        Returns the highest quantile a centroid starting at q may reach, one
+        unit further along k(q) = compression / (2 * pi) * asin(2q - 1).
+        """
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+
+        if k >= self.compression / 4:
+            return 1.0
+
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    def _interpolate(self, target: float, left_rank: float, left_value: float, right_rank: float, right_value: float) -> float:
+        if right_rank <= left_rank:
+            return right_value
+
+        return left_value + (right_value - left_value) * (target - left_rank) / (right_rank - left_rank)
+
+
+class ApproximateStats:
+    """
+    Summarizes a stream of earthquake entries in constant memory, for
+    catalogs too large to keep or scan exactly. Keeps:
+
+    - exact totals (overall and per magnitude range) and the date range
+    - the number of distinct events, estimated with a HyperLogLog sketch,
+      since merged catalogs may contain the same event more than once
+    - per-region counts, estimated with a count-min sketch. Regions are
+      given by region_key (a function of an entry), and default to the
+      entry's location.
+    - magnitude and depth quantiles, estimated with t-digests
+    - a uniform random sample of the entries
+
+    Stats built separately (e.g. by worker processes, after pickling them)
+    can be combined with merge(), as long as they use the same sketch sizes.
+    """
+
+    def __init__(self,
+                 eq_list: Iterable[Dict[str, Any]] = (),
+                 sample_size: int = DEFAULT_SAMPLE_SIZE,
+                 sketch_width: int = DEFAULT_SKETCH_WIDTH,
+                 sketch_depth: int = DEFAULT_SKETCH_DEPTH,
+                 hll_precision: int = DEFAULT_HLL_PRECISION,
+                 compression: int = DEFAULT_COMPRESSION,
+                 quantiles: Sequence[float] = DEFAULT_QUANTILES,
+                 top_regions: int = DEFAULT_TOP_REGIONS,
+                 seed: Optional[int] = None,
+                 region_key: Optional[Callable[[Dict[str, Any]], str]] = None
+                 ) -> None:
+        self.quantiles = tuple(quantiles)
+        self.region_key = region_key
+        self.total = 0
+        self.start_date: Optional[datetime] = None
+        self.end_date: Optional[datetime] = None
+        self._total_per_magnitude = {
+            "unspecified": 0,
+            "m8_0_or_greater": 0,
+            "m6_to_7_9": 0,
+            "m4_0_to_5_9": 0,
+            "below_m4_0": 0,
+        }
+        self._sample = ReservoirSample(sample_size, seed)
+        self._regions = CountMinSketch(sketch_width, sketch_depth, top_regions)
+        self._distinct_events = HyperLogLog(hll_precision)
+        self._magnitudes = TDigest(compression)
+        self._depths = TDigest(compression)
+
+        self.update(eq_list)
+
+    def update(self, eq_list: Iterable[Dict[str, Any]]) -> None:
+        for entry in eq_list:
+            self.add(entry)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        date = to_utc(entry["date"])
+
+        self.total += 1
+        self._total_per_magnitude[get_magnitude_label(entry["magnitude"])] += 1
+
+        if self.start_date is None or date < self.start_date:
+            self.start_date = date
+        if self.end_date is None or date > self.end_date:
+            self.end_date = date
+
+        self._regions.add(self._get_region(entry))
+        self._distinct_events.add(self._get_event_key(entry, date))
+
+        if entry["magnitude"] is not None:
+            self._magnitudes.add(entry["magnitude"])
+        if entry["depth"] is not None:
+            self._depths.add(entry["depth"])
+
+        self._sample.add(entry)
+
+    def merge(self, other: "ApproximateStats") -> None:
+        self._regions.merge(other._regions)
+        self._distinct_events.merge(other._distinct_events)
+        self._magnitudes.merge(other._magnitudes)
+        self._depths.merge(other._depths)
+        self._sample.merge(other._sample)
+
+        self.total += other.total
+
+        for label, count in other._total_per_magnitude.items():
+            self._total_per_magnitude[label] += count
+
+        if other.start_date is not None and (self.start_date is None or other.start_date < self.start_date):
+            self.start_date = other.start_date
+        if other.end_date is not None and (self.end_date is None or other.end_date > self.end_date):
+            self.end_date = other.end_date
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns the summary. Estimated values are reported together with
+        their error bounds.
+        """
+        region_error_bounds = self._regions.get_error_bounds()
+
+        return {
+            "date_range": {
+                "start_date": self.start_date,
+                "end_date": self.end_date,
+            },
+            "recorded_eqs": {
+                "total": self.total,
+                "total_per_magnitude": dict(self._total_per_magnitude),
+                "distinct": {
+                    "estimate": self._distinct_events.estimate(),
+                    "error_bounds": self._distinct_events.get_error_bounds(),
+                },
+            },
+            "regions": {
+                "top": [
+                    {
+                        "region": region,
+                        "estimate": estimate,
+                        "lower_bound": max(0, math.ceil(estimate - region_error_bounds["max_overestimate"])),
+                        "upper_bound": estimate,
+                    }
+                    for region, estimate in self._regions.get_top()
+                ],
+                "error_bounds": region_error_bounds,
+            },
+            "magnitude": self._get_distribution(self._magnitudes),
+            "depth": self._get_distribution(self._depths),
+            "sample": {
+                "entries": self._sample.get_sample(),
+                "sampling_rate": self._sample.get_sampling_rate(),
+            },
+        }
+
+    def get_region_count(self, region: str) -> int:
+        """Returns the estimated number of entries in the region."""
+        return self._regions.estimate(region)
+
+    def _get_distribution(self, digest: TDigest) -> Dict[str, Any]:
+        return {
+            "count": int(digest.count),
+            "min": digest.min,
+            "max": digest.max,
+            "quantiles": {
+                f"p{q * 100:g}": {
+                    "estimate": digest.quantile(q),
+                    "rank_error": digest.get_rank_error(q),
+                }
+                for q in self.quantiles
+            },
+        }
+
+    def _get_event_key(self, entry: Dict[str, Any], date: datetime) -> str:
+        """
+        Identifies an event by its source, UTC date and coordinates, so the
+        same event appearing in several lists is only counted once.
+        """
+        coordinates = entry["coordinates"] or {}
+
+        return f"{entry['source']}|{date.isoformat()}|{coordinates.get('latitude')}|{coordinates.get('longitude')}"
+
+    def _get_region(self, entry: Dict[str, Any]) -> str:
+        if self.region_key is not None:
+            return self.region_key(entry)
+
+        return entry["location"]
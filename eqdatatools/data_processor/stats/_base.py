@@ -1,32 +1,103 @@
-from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Optional
+from eqdatatools.schema import EarthquakeEvent
+from ._histogram import Histogram, get_depth_histogram, get_magnitude_histogram
+from ._top_k import TopK
+
+
+class StatsGenerator:
+    def __new__(cls,
+                eq_list: Iterable[EarthquakeEvent],
+                histograms: Optional[Dict[str, Histogram]] = None,
+                top_k: Optional[Dict[str, TopK]] = None
+                ) -> Dict[str, Any]:
+        instance = super(StatsGenerator, cls).__new__(cls)
+        eq_list_overview = instance.get_stats(eq_list, histograms, top_k)
 
+        return eq_list_overview
 
-class StatsGenerator(ABC):
-    def __new__(cls, eq_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @classmethod
+    def update(cls,
+               eq_list_overview: Dict[str, Any],
+               eq_list: Iterable[EarthquakeEvent],
+               top_k: Optional[Dict[str, TopK]] = None
+               ) -> Dict[str, Any]:
+        """
+        Adds more entries to an overview made by StatsGenerator, in a single
+        pass over only the new entries. The overview is updated in place and
+        returned. Its histograms keep their bins, and top_k should be the
+        trackers the overview was filled with, so "top" covers every entry.
+        """
         instance = super(StatsGenerator, cls).__new__(cls)
-        eq_list_overview = instance.get_stats(eq_list)
+        histograms = {
+            name: Histogram.from_bins(histogram["bins"], histogram["field"])
+            for name, histogram in eq_list_overview["histograms"].items()
+        }
+        instance._add_entries(eq_list, eq_list_overview, histograms, top_k or {})
 
         return eq_list_overview
 
-    def get_stats(self, eq_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_stats(self,
+                  eq_list: Iterable[EarthquakeEvent],
+                  histograms: Optional[Dict[str, Histogram]] = None,
+                  top_k: Optional[Dict[str, TopK]] = None
+                  ) -> Dict[str, Any]:
+        """
+        Generates the overview in a single pass over eq_list. A depth
+        histogram and any additional histograms given (e.g. for
+        max_seismic_intensity) are filled in the same pass and included in
+        the overview under "histograms". The given histograms only define the
+        bins and are not modified, so they can be reused for other lists.
+        Top-k trackers are filled in the same pass as well, and their entries
+        are included under "top".
+        """
         eq_list_overview = self._get_eq_list_overview_dict()
+        histograms = self._get_empty_histograms(histograms)
+        self._add_entries(eq_list, eq_list_overview, histograms, top_k or {})
 
-        self._set_date_range(eq_list, eq_list_overview)
+        return eq_list_overview
+
+    def _add_entries(self,
+                     eq_list: Iterable[EarthquakeEvent],
+                     eq_list_overview: Dict[str, Any],
+                     histograms: Dict[str, Histogram],
+                     top_k: Dict[str, TopK]
+                     ) -> None:
+        """
+        Adds the entries to the overview in a single pass. The histograms
+        must be empty, and their counts are added to the ones already in the
+        overview.
+        """
+        magnitude_histogram = get_magnitude_histogram()
 
         for entry in eq_list:
+            self._set_date_range(entry, eq_list_overview)
+
             if self._eq_is_stronger_than_current_strongest(entry["magnitude"], eq_list_overview):
                 self._set_as_strongest_eq(entry, eq_list_overview)
 
             if self._eq_is_weaker_than_current_weakest(entry["magnitude"], eq_list_overview):
                 self._set_as_weakest_eq(entry, eq_list_overview)
 
-            self._set_total_recorded_eqs(entry, eq_list_overview)
+            magnitude_histogram.add(entry)
 
-        return eq_list_overview
+            for histogram in histograms.values():
+                histogram.add(entry)
+
+            for top_k_tracker in top_k.values():
+                top_k_tracker.add(entry)
+
+        self._set_total_recorded_eqs(magnitude_histogram, eq_list_overview)
+        self._set_histograms(histograms, eq_list_overview)
+        self._set_top_k(top_k, eq_list_overview)
+
+    def _get_empty_histograms(self, histograms: Optional[Dict[str, Histogram]]) -> Dict[str, Histogram]:
+        empty_histograms = {"depth": get_depth_histogram()}
+
+        for name, histogram in (histograms or {}).items():
+            empty_histograms[name] = histogram.copy_empty()
+
+        return empty_histograms
 
-    @abstractmethod
     def _get_eq_list_overview_dict(self) -> Dict[str, Any]:
         """Returns a dict containing eq details such as strongest, weakest, and
         total recorded eqs."""
@@ -36,20 +107,8 @@ class StatsGenerator(ABC):
                 "start_date": None,
                 "end_date": None,
             },
-            "strongest": {
-                "date": None,
-                "location": None,
-                "magnitude": None,
-                "coordinates": None,
-                "depth": None,
-            },
-            "weakest": {
-                "date": None,
-                "location": None,
-                "magnitude": None,
-                "coordinates": None,
-                "depth": None,
-            },
+            "strongest": dict.fromkeys(EarthquakeEvent.__annotations__),
+            "weakest": dict.fromkeys(EarthquakeEvent.__annotations__),
             "recorded_eqs": {
                 "total": 0,
                 "total_per_magnitude": {
@@ -59,71 +118,79 @@ class StatsGenerator(ABC):
                     "m4_0_to_5_9": 0,
                     "below_m4_0": 0,
                 }
-            }
+            },
+            "histograms": {},
+            "top": {},
         }
 
         return eq_list_overview
 
-    @abstractmethod
-    def _set_date_range(self, start_date: datetime, end_date: datetime, eq_list_overview: Dict[str, Any]) -> None:
+    def _set_date_range(self, entry: EarthquakeEvent, eq_list_overview: Dict[str, Any]) -> None:
         """
-        Gets the date range from the list of earthquake entries by retrieving
-        the date of first recorded earthquake, which will become the start date
-        and also by retrieving the date of last recorded earthquake, which will
-        become the end date. Thus, this will set the date range for the
-        eq_list_overview
+        Widens the date range of the eq_list_overview so it includes the date
+        of the entry. The start date ends up being the date of the first
+        recorded earthquake and the end date the date of the last one. This
+        is done during the pass, so eq_list can be any iterable (such as a
+        stream of merged entries) and doesn't need to be sorted.
         """
+        date_range = eq_list_overview["date_range"]
 
-        eq_list_overview["date_range"]["start_date"] = start_date
-        eq_list_overview["date_range"]["end_date"] = end_date
+        if date_range["start_date"] is None or entry["date"] < date_range["start_date"]:
+            date_range["start_date"] = entry["date"]
+        if date_range["end_date"] is None or entry["date"] > date_range["end_date"]:
+            date_range["end_date"] = entry["date"]
 
-    @abstractmethod
-    def _set_as_strongest_eq(self, entry: Dict[str, Any], eq_list_overview: Dict[str, Any]) -> None:
+    def _set_as_strongest_eq(self, entry: EarthquakeEvent, eq_list_overview: Dict[str, Any]) -> None:
         """
         Checks if the earthquake being checked is the strongest. If true,
         then it will be set as a strongest earthquake.
         """
+        eq_list_overview["strongest"].update(entry)
 
-        eq_list_overview["strongest"]["date"] = entry["date"]
-        eq_list_overview["strongest"]["location"] = entry["location"]
-        eq_list_overview["strongest"]["magnitude"] = entry["magnitude"]
-        eq_list_overview["strongest"]["coordinates"] = entry["coordinates"]
-        eq_list_overview["strongest"]["depth"] = entry["depth"]
-
-    @abstractmethod
-    def _set_as_weakest_eq(self, entry: Dict[str, Any], eq_list_overview: Dict[str, Any]) -> None:
+    def _set_as_weakest_eq(self, entry: EarthquakeEvent, eq_list_overview: Dict[str, Any]) -> None:
         """
         Checks if the earthquake being checked is the weakest. If true,
         then it will be set as a weakest earthquake.
         """
-        eq_list_overview["weakest"]["date"] = entry["date"]
-        eq_list_overview["weakest"]["location"] = entry["location"]
-        eq_list_overview["weakest"]["magnitude"] = entry["magnitude"]
-        eq_list_overview["weakest"]["coordinates"] = entry["coordinates"]
-        eq_list_overview["weakest"]["depth"] = entry["depth"]
+        eq_list_overview["weakest"].update(entry)
 
-    def _set_total_recorded_eqs(self, entry: Dict[str, Any], eq_list_overview: Dict[str, Any]) -> None:
-        magnitude = entry["magnitude"]
+    def _set_total_recorded_eqs(self, magnitude_histogram: Histogram, eq_list_overview: Dict[str, Any]) -> None:
+        total_per_magnitude = eq_list_overview["recorded_eqs"]["total_per_magnitude"]
+        total_per_magnitude["unspecified"] += magnitude_histogram.unspecified
 
-        self._set_total_recorded_eqs_by_mag(magnitude, eq_list_overview)
-        self._increment_total(eq_list_overview)
+        for label, count in magnitude_histogram.get_counts().items():
+            total_per_magnitude[label] += count
 
-    def _increment_total(self, eq_list_overview: Dict[str, Any]) -> None:
-        eq_list_overview["recorded_eqs"]["total"] += 1
+        eq_list_overview["recorded_eqs"]["total"] = sum(total_per_magnitude.values())
 
-    def _set_total_recorded_eqs_by_mag(self, magnitude: float, eq_list_overview: Dict[str, Any]) -> None:
-        if magnitude is None:
-            eq_list_overview["recorded_eqs"]["total_per_magnitude"]["unspecified"] += 1
-            return
-
-        if magnitude < 4.0:
-            eq_list_overview["recorded_eqs"]["total_per_magnitude"]["below_m4_0"] += 1
-        elif magnitude >= 4.0 and magnitude <= 5.9:
-            eq_list_overview["recorded_eqs"]["total_per_magnitude"]["m4_0_to_5_9"] += 1
-        elif magnitude >= 6.0 and magnitude <= 7.9:
-            eq_list_overview["recorded_eqs"]["total_per_magnitude"]["m6_to_7_9"] += 1
-        elif magnitude >= 8.0:
-            eq_list_overview["recorded_eqs"]["total_per_magnitude"]["m8_0_or_greater"] += 1
+    def _set_histograms(self, histograms: Dict[str, Histogram], eq_list_overview: Dict[str, Any]) -> None:
+        for name, histogram in histograms.items():
+            overview_histogram = eq_list_overview["histograms"].get(name)
+
+            if overview_histogram is None:
+                eq_list_overview["histograms"][name] = {
+                    "field": histogram.field,
+                    "unspecified": histogram.unspecified,
+                    "bins": histogram.get_bins(),
+                }
+                continue
+
+            overview_histogram["unspecified"] += histogram.unspecified
+
+            for overview_bin, histogram_bin in zip(overview_histogram["bins"], histogram.get_bins()):
+                if histogram_bin["count"] == 0:
+                    continue
+
+                if overview_bin["count"] == 0 or histogram_bin["min"] < overview_bin["min"]:
+                    overview_bin["min"] = histogram_bin["min"]
+                if overview_bin["count"] == 0 or histogram_bin["max"] > overview_bin["max"]:
+                    overview_bin["max"] = histogram_bin["max"]
+
+                overview_bin["count"] += histogram_bin["count"]
+
+    def _set_top_k(self, top_k: Dict[str, TopK], eq_list_overview: Dict[str, Any]) -> None:
+        for name, top_k_tracker in top_k.items():
+            eq_list_overview["top"][name] = top_k_tracker.get_top()
 
     def _eq_is_weaker_than_current_weakest(self, magnitude: float, eq_list_overview: Dict[str, Any]) -> bool:
         if not eq_list_overview["weakest"]["magnitude"]:
@@ -0,0 +1,124 @@
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence
+from eqdatatools.constants import JMA_INTENSITY_LEVELS
+
+# Bin edges used by the overview's total_per_magnitude breakdown
+MAGNITUDE_EDGES = (4.0, 6.0, 8.0)
+MAGNITUDE_LABELS = ("below_m4_0", "m4_0_to_5_9", "m6_to_7_9", "m8_0_or_greater")
+
+# One bin per level of the JMA seismic intensity scale (0 to 7, with 5 and
+# 6 split into lower and upper), for max_seismic_intensity. JMA entries
+# store the position of their level, so the edges are the positions.
+JMA_INTENSITY_EDGES = tuple(range(1, len(JMA_INTENSITY_LEVELS)))
+JMA_INTENSITY_LABELS = tuple(JMA_INTENSITY_LEVELS)
+
+# Shallow (< 70 km), intermediate (70 to 300 km) and deep (>= 300 km)
+# earthquakes, for depth
+DEPTH_EDGES = (70, 300)
+DEPTH_LABELS = ("shallow", "intermediate", "deep")
+
+
+class Histogram:
+    """
+    Counts values of an entry field (e.g. magnitude or depth) into bins
+    defined by sorted edges. Given n edges, there are n + 1 half-open bins:
+
+        (-inf, edges[0]), [edges[0], edges[1]), ..., [edges[-1], +inf)
+
+    so every value falls into exactly one bin. Bin lookup uses binary search
+    over the edges. Entries with no value for the field are counted as
+    unspecified.
+    """
+
+    def __init__(self, edges: Sequence[float], field: str = "magnitude", labels: Optional[Sequence[str]] = None) -> None:
+        edges = tuple(edges)
+
+        if not edges:
+            raise ValueError("Histogram needs at least one bin edge.")
+        if any(lower >= upper for lower, upper in zip(edges, edges[1:])):
+            raise ValueError("Histogram bin edges must be strictly increasing.")
+        if labels is not None and len(labels) != len(edges) + 1:
+            raise ValueError(f"Expected {len(edges) + 1} labels for {len(edges)} bin edges, got {len(labels)}.")
+
+        self.edges = edges
+        self.field = field
+        self.labels = tuple(labels) if labels is not None else self._get_default_labels(edges)
+        self.unspecified = 0
+        self._counts = [0] * (len(edges) + 1)
+        self._minimums: List[Optional[float]] = [None] * (len(edges) + 1)
+        self._maximums: List[Optional[float]] = [None] * (len(edges) + 1)
+
+    @classmethod
+    def from_bins(cls, bins: Sequence[Dict[str, Any]], field: str = "magnitude") -> "Histogram":
+        """Returns a histogram with the bins given by get_bins(), and no counts."""
+        return cls([histogram_bin["lower"] for histogram_bin in bins[1:]], field, [histogram_bin["label"] for histogram_bin in bins])
+
+    def copy_empty(self) -> "Histogram":
+        """Returns a histogram with the same bins and no counts."""
+        return Histogram(self.edges, self.field, self.labels)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.add_value(entry[self.field])
+
+    def add_value(self, value: Optional[float]) -> None:
+        if value is None:
+            self.unspecified += 1
+            return
+
+        index = bisect_right(self.edges, value)
+        self._counts[index] += 1
+
+        if self._minimums[index] is None or value < self._minimums[index]:
+            self._minimums[index] = value
+        if self._maximums[index] is None or value > self._maximums[index]:
+            self._maximums[index] = value
+
+    def get_counts(self) -> Dict[str, int]:
+        return dict(zip(self.labels, self._counts))
+
+    def get_bins(self) -> List[Dict[str, Any]]:
+        bins = []
+        lower_edges = (None,) + self.edges
+        upper_edges = self.edges + (None,)
+
+        for index, label in enumerate(self.labels):
+            bins.append({
+                "label": label,
+                "lower": lower_edges[index],
+                "upper": upper_edges[index],
+                "count": self._counts[index],
+                "min": self._minimums[index],
+                "max": self._maximums[index],
+            })
+
+        return bins
+
+    def _get_default_labels(self, edges: Sequence[float]) -> tuple:
+        labels = [f"below_{edges[0]}"]
+
+        for lower, upper in zip(edges, edges[1:]):
+            labels.append(f"{lower}_to_{upper}")
+
+        labels.append(f"{edges[-1]}_or_greater")
+
+        return tuple(labels)
+
+
+def get_magnitude_label(magnitude: Optional[float]) -> str:
+    """Returns the total_per_magnitude key that the magnitude is counted under."""
+    if magnitude is None:
+        return "unspecified"
+
+    return MAGNITUDE_LABELS[bisect_right(MAGNITUDE_EDGES, magnitude)]
+
+
+def get_magnitude_histogram() -> Histogram:
+    return Histogram(MAGNITUDE_EDGES, field="magnitude", labels=MAGNITUDE_LABELS)
+
+
+def get_depth_histogram() -> Histogram:
+    return Histogram(DEPTH_EDGES, field="depth", labels=DEPTH_LABELS)
+
+
+def get_jma_intensity_histogram() -> Histogram:
+    return Histogram(JMA_INTENSITY_EDGES, field="max_seismic_intensity", labels=JMA_INTENSITY_LABELS)
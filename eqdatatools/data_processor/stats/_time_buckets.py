@@ -0,0 +1,213 @@
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterable, List, Optional
+from ._histogram import get_magnitude_label
+
+VALID_INTERVALS = ("hour", "day", "week", "month")
+
+
+def get_seismic_energy(magnitude: float) -> float:
+    """
+    Returns the approximate radiated seismic energy (in joules) of an
+    earthquake using the Gutenberg-Richter energy relation:
+    log10(E) = 1.5M + 4.8
+    """
+    return 10 ** (1.5 * magnitude + 4.8)
+
+
+class TimeBucketAggregator:
+    """
+    Groups earthquake entries into fixed time buckets (hourly, daily, weekly
+    or monthly) and keeps per-bucket counts, max magnitude and seismic energy.
+
+    Entries can be added incrementally through update(), so refreshing a
+    series only costs the new entries. When a window is given, only the
+    last `window` intervals up to and including the newest bucket are kept
+    (e.g. window=7 with daily buckets keeps the last 7 days), and entries
+    older than that are ignored.
+
+    Buckets follow the calendar of tz, so e.g. daily buckets start at
+    midnight in that timezone. Earthquake lists pass the timezone of their
+    source, and entries of several sources are bucketed in UTC by default.
+    """
+
+    def __init__(self,
+                 eq_list: Iterable[Dict[str, Any]] = (),
+                 interval: str = "day",
+                 window: Optional[int] = None,
+                 tz: tzinfo = timezone.utc
+                 ) -> None:
+        if interval not in VALID_INTERVALS:
+            raise ValueError(f"Invalid interval '{interval}'. Valid intervals are: {', '.join(VALID_INTERVALS)}")
+        if window is not None and window < 1:
+            raise ValueError("Window must be a positive number of buckets.")
+
+        self.interval = interval
+        self.window = window
+        self.tz = tz
+        self._buckets: Dict[datetime, Dict[str, Any]] = {}
+        self._bucket_keys: List[datetime] = []
+
+        self.update(eq_list)
+
+    def update(self, eq_list: Iterable[Dict[str, Any]]) -> None:
+        for entry in eq_list:
+            self.add(entry)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        date = self._get_date(entry)
+
+        if date is None:
+            return
+
+        bucket_key = self._get_bucket_start(date)
+        bucket = self._buckets.get(bucket_key)
+
+        if bucket is None:
+            if self._is_outside_window(bucket_key):
+                return
+            bucket = self._create_bucket(bucket_key)
+
+        self._add_to_bucket(entry, bucket)
+
+    def get_series(self, fill_empty: bool = True) -> List[Dict[str, Any]]:
+        """
+        Returns the buckets ordered from oldest to newest. Each bucket also
+        contains the cumulative seismic energy up to and including itself.
+        Intervals without entries, between the oldest bucket (or the start of
+        the window) and the newest one, are included as empty buckets unless
+        fill_empty is False.
+        """
+        series = []
+        cumulative_energy = 0.0
+
+        for bucket_key in self._get_series_keys(fill_empty):
+            bucket = self._buckets.get(bucket_key) or self._get_empty_bucket(bucket_key)
+            cumulative_energy += bucket["energy"]
+
+            series_entry = dict(bucket)
+            series_entry["total_per_magnitude"] = dict(bucket["total_per_magnitude"])
+            series_entry["cumulative_energy"] = cumulative_energy
+            series.append(series_entry)
+
+        return series
+
+    def get_bucket(self, date: datetime) -> Optional[Dict[str, Any]]:
+        return self._buckets.get(self._get_bucket_start(date))
+
+    def _get_series_keys(self, fill_empty: bool) -> List[datetime]:
+        if not fill_empty or not self._bucket_keys:
+            return self._bucket_keys
+
+        bucket_keys = []
+        bucket_key = self._bucket_keys[0]
+
+        # A windowed series always covers the whole window
+        if self.window is not None:
+            bucket_key = self._get_window_start(self._bucket_keys[-1])
+
+        while bucket_key <= self._bucket_keys[-1]:
+            bucket_keys.append(bucket_key)
+            bucket_key = self._shift_bucket_start(bucket_key, 1)
+
+        return bucket_keys
+
+    def _create_bucket(self, bucket_key: datetime) -> Dict[str, Any]:
+        bucket = self._get_empty_bucket(bucket_key)
+        self._buckets[bucket_key] = bucket
+
+        # Entries usually come in chronological (or reverse chronological)
+        # order, so the insertion is almost always at either end of the list
+        insort(self._bucket_keys, bucket_key)
+        self._evict_old_buckets()
+
+        return bucket
+
+    def _get_empty_bucket(self, bucket_key: datetime) -> Dict[str, Any]:
+        return {
+            "start": bucket_key,
+            "total": 0,
+            "total_per_magnitude": {
+                "unspecified": 0,
+                "m8_0_or_greater": 0,
+                "m6_to_7_9": 0,
+                "m4_0_to_5_9": 0,
+                "below_m4_0": 0,
+            },
+            "max_magnitude": None,
+            "energy": 0.0,
+        }
+
+    def _add_to_bucket(self, entry: Dict[str, Any], bucket: Dict[str, Any]) -> None:
+        magnitude = entry["magnitude"]
+
+        bucket["total"] += 1
+        bucket["total_per_magnitude"][get_magnitude_label(magnitude)] += 1
+
+        if magnitude is None:
+            return
+
+        if bucket["max_magnitude"] is None or magnitude > bucket["max_magnitude"]:
+            bucket["max_magnitude"] = magnitude
+
+        bucket["energy"] += get_seismic_energy(magnitude)
+
+    def _is_outside_window(self, bucket_key: datetime) -> bool:
+        if self.window is None or not self._bucket_keys:
+            return False
+
+        return bucket_key < self._get_window_start(self._bucket_keys[-1])
+
+    def _evict_old_buckets(self) -> None:
+        if self.window is None:
+            return
+
+        window_start = self._get_window_start(self._bucket_keys[-1])
+        eviction_count = bisect_left(self._bucket_keys, window_start)
+
+        for bucket_key in self._bucket_keys[:eviction_count]:
+            del self._buckets[bucket_key]
+
+        del self._bucket_keys[:eviction_count]
+
+    def _get_window_start(self, newest_bucket_key: datetime) -> datetime:
+        """Returns the start of the oldest bucket that is inside the window."""
+        return self._shift_bucket_start(newest_bucket_key, 1 - self.window)
+
+    def _shift_bucket_start(self, bucket_key: datetime, intervals: int) -> datetime:
+        """
+        Moves a bucket start by a number of intervals. Months differ in
+        length, so monthly buckets are moved by calendar month.
+        """
+        if self.interval == "hour":
+            return bucket_key + timedelta(hours=intervals)
+        if self.interval == "day":
+            return bucket_key + timedelta(days=intervals)
+        if self.interval == "week":
+            return bucket_key + timedelta(weeks=intervals)
+
+        month_index = bucket_key.year * 12 + bucket_key.month - 1 + intervals
+
+        return bucket_key.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+    def _get_bucket_start(self, date: datetime) -> datetime:
+        """
+        Truncates the date to the start of its bucket, in the calendar of
+        the aggregator's timezone.
+        """
+        date = date.astimezone(self.tz)
+
+        if self.interval == "hour":
+            return date.replace(minute=0, second=0, microsecond=0)
+
+        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        if self.interval == "day":
+            return day_start
+        if self.interval == "week":
+            return day_start - timedelta(days=day_start.weekday())
+
+        return day_start.replace(day=1)
+
+    def _get_date(self, entry: Dict[str, Any]) -> datetime:
+        return entry["date"]
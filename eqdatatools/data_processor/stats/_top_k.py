@@ -0,0 +1,115 @@
+from datetime import datetime, timezone, tzinfo
+from heapq import heappush, heappushpop
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+VALID_TOP_K_FIELDS: Dict[str, str] = {
+    "magnitude": "magnitude",
+    "intensity": "max_seismic_intensity",
+    "depth": "depth",
+}
+
+VALID_GROUPS = ("month", "region")
+
+# Number of strongest and weakest entries kept during the stats pass
+DEFAULT_TOP_K = 10
+
+
+class TopK:
+    """
+    Keeps the k entries with the largest (or smallest) value of a field,
+    optionally per group, using a bounded heap for each group. Each entry
+    costs O(log k), so no full sort of the list is needed, and entries can
+    keep being added after the initial pass.
+
+    group_by can be "month", "region" or a function that takes an entry and
+    returns its group key. Regions are given by region_key (a function of an
+    entry), and default to the entry's location. Months are the (year,
+    month) of the entry's date in tz, which earthquake lists set to the
+    timezone of their source.
+    """
+
+    def __init__(self,
+                 k: int,
+                 by: str = "magnitude",
+                 group_by: Optional[Union[str, Callable[[Dict[str, Any]], Hashable]]] = None,
+                 smallest: bool = False,
+                 region_key: Optional[Callable[[Dict[str, Any]], Hashable]] = None,
+                 tz: tzinfo = timezone.utc
+                 ) -> None:
+        if k < 1:
+            raise ValueError("k must be a positive number.")
+        if by not in VALID_TOP_K_FIELDS:
+            raise ValueError(f"Invalid field '{by}'. Valid fields are: {', '.join(VALID_TOP_K_FIELDS)}")
+        if isinstance(group_by, str) and group_by not in VALID_GROUPS:
+            raise ValueError(f"Invalid group '{group_by}'. Valid groups are: {', '.join(VALID_GROUPS)}")
+
+        self.k = k
+        self.by = by
+        self.group_by = group_by
+        self.smallest = smallest
+        self.region_key = region_key
+        self.tz = tz
+        self._field = VALID_TOP_K_FIELDS[by]
+        self._heaps: Dict[Hashable, List[Tuple[float, int, Dict[str, Any]]]] = {}
+        self._counter = count()
+
+    def update(self, eq_list: Iterable[Dict[str, Any]]) -> None:
+        for entry in eq_list:
+            self.add(entry)
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        value = entry.get(self._field)
+
+        if value is None:
+            return
+
+        # The heap is a min-heap, so the root is always the entry that gets
+        # replaced first. Negating the value turns it into a "smallest k" heap.
+        score = -value if self.smallest else value
+        heap_item = (score, next(self._counter), entry)
+        heap = self._heaps.setdefault(self._get_group(entry), [])
+
+        if len(heap) < self.k:
+            heappush(heap, heap_item)
+        elif score > heap[0][0]:
+            heappushpop(heap, heap_item)
+
+    def get_top(self, n: Optional[int] = None) -> Union[List[Dict[str, Any]], Dict[Hashable, List[Dict[str, Any]]]]:
+        """
+        Returns up to n entries (all kept entries if n is not given), ordered
+        from strongest to weakest (or the reverse when smallest is set). When
+        grouped, returns a dict of group key to its list of entries.
+        """
+        if n is not None and n > self.k:
+            raise ValueError(f"Cannot get top {n} entries when only {self.k} are kept.")
+
+        if self.group_by is None:
+            return self._get_sorted_entries(self._heaps.get(None, []), n)
+
+        return {group: self._get_sorted_entries(heap, n) for group, heap in self._heaps.items()}
+
+    def _get_sorted_entries(self, heap: List[Tuple[float, int, Dict[str, Any]]], n: Optional[int]) -> List[Dict[str, Any]]:
+        sorted_heap = sorted(heap, key=lambda heap_item: (-heap_item[0], heap_item[1]))
+
+        return [heap_item[2] for heap_item in sorted_heap[:n]]
+
+    def _get_group(self, entry: Dict[str, Any]) -> Hashable:
+        if self.group_by is None:
+            return None
+        if self.group_by == "month":
+            date = self._get_date(entry)
+            return (date.year, date.month)
+        if self.group_by == "region":
+            return self._get_region(entry)
+
+        return self.group_by(entry)
+
+    def _get_date(self, entry: Dict[str, Any]) -> datetime:
+        return entry["date"].astimezone(self.tz)
+
+    def _get_region(self, entry: Dict[str, Any]) -> Hashable:
+        if self.region_key is not None:
+            return self.region_key(entry)
+
+        return entry["location"]
@@ -1,35 +1,15 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+from eqdatatools.schema import EarthquakeEvent
 from ._base import StatsGenerator
+from ._histogram import Histogram
+from ._top_k import TopK
 
 
-class JMAStatsGenerator(StatsGenerator):
-    def _get_eq_list_overview_dict(self) -> Dict[str, Any]:
-        eq_list_overview = super()._get_eq_list_overview_dict()
-        eq_list_overview["strongest"]["max_seismic_intensity"] = None
-        eq_list_overview["strongest"]["event_details_url"] = None
-        eq_list_overview["weakest"]["max_seismic_intensity"] = None
-        eq_list_overview["weakest"]["event_details_url"] = None
-
-        return eq_list_overview
-
-    def _set_date_range(self, eq_list: List[Dict[str, Any]], eq_list_overview: Dict[str, Any]) -> None:
-        start_date = eq_list[-1]["date"]["observed_date"]
-        end_date = eq_list[0]["date"]["observed_date"]
-
-        super()._set_date_range(start_date, end_date, eq_list_overview)
-
-    def _set_as_strongest_eq(self, entry: Dict[str, Any], eq_list_overview: Dict[str, Any]) -> None:
-        super()._set_as_strongest_eq(entry, eq_list_overview)
-        eq_list_overview["strongest"]["max_seismic_intensity"] = entry["max_seismic_intensity"]
-        eq_list_overview["strongest"]["event_details_url"] = entry["event_details_url"]
-
-    def _set_as_weakest_eq(self, entry: Dict[str, Any], eq_list_overview: Dict[str, Any]) -> None:
-        super()._set_as_weakest_eq(entry, eq_list_overview)
-        eq_list_overview["weakest"]["max_seismic_intensity"] = entry["max_seismic_intensity"]
-        eq_list_overview["weakest"]["event_details_url"] = entry["event_details_url"]
-
-
-def get_stats(eq_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    eq_list_overview = JMAStatsGenerator(eq_list)
+def get_stats(eq_list: List[EarthquakeEvent],
+              histograms: Optional[Dict[str, Histogram]] = None,
+              top_k: Optional[Dict[str, TopK]] = None
+              ) -> Dict[str, Any]:
+    eq_list_overview = StatsGenerator(eq_list, histograms, top_k)
 
     return eq_list_overview
+
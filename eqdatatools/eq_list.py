@@ -1,41 +1,132 @@
-from abc import ABC, abstractmethod
-import re
-from typing import Dict, List, Any, Iterator
-from eqdatatools import scraper
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Sequence, Tuple
+from eqdatatools import profiling, scraper, snapshot
 from eqdatatools.data_processor import display
 from eqdatatools.data_processor import stats
-from eqdatatools.constants import VALID_URL_FORMATS
-from eqdatatools.exceptions import InvalidURLError
+from eqdatatools.constants import VALID_URL_FORMATS, VALID_DATE_FORMATS, TIMEZONES
+from eqdatatools.exceptions import InvalidSnapshotError
+from eqdatatools.sources import Source, register_source, registry
+
+_list_class_lock = threading.Lock()
 
 
 class EarthquakeList:
-    def __new__(cls, url: str, start_date: str = None):
-        url_source = cls._identify_url_source(url)
+    def __new__(cls,
+                url: str,
+                start_date: str = None,
+                histograms: Optional[Dict[str, stats.Histogram]] = None,
+                profile: bool = False):
+        source = registry.get_source_for_url(url)
+
+        return get_earthquake_list_class(source)(url, start_date, histograms, profile)
+
+    @staticmethod
+    def from_urls(urls: Sequence[str],
+                  start_date: str = None,
+                  max_workers: Optional[int] = None,
+                  histograms: Optional[Dict[str, stats.Histogram]] = None,
+                  profile: bool = False
+                  ) -> List["BaseEarthquakeList"]:
+        """
+        Creates an earthquake list for each URL, which may belong to different
+        sources. The lists are fetched and processed concurrently, and are
+        returned in the same order as the URLs. histograms and profile are
+        passed to every list.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda url: EarthquakeList(url, start_date, histograms, profile), urls))
+
+    @staticmethod
+    def load_snapshot(path: str) -> "BaseEarthquakeList":
+        """
+        Restores an earthquake list saved with save_snapshot(). Raises
+        InvalidSnapshotError if the file is not a snapshot or was saved by an
+        incompatible version.
+        """
+        source_name, eq_list, eq_stats = snapshot.load_snapshot(path)
 
-        if url_source == "JMA":
-            return JMAEarthquakeList(url, start_date)
-        elif url_source == "PHIVOLCS":
-            return PHIVOLCSEarthquakeList(url, start_date)
-        else:
-            raise InvalidURLError(url)
+        try:
+            source = registry.get_source(source_name)
+        except KeyError:
+            raise InvalidSnapshotError(path, f"the source '{source_name}' is not registered") from None
+
+        return get_earthquake_list_class(source)._from_snapshot(eq_list, eq_stats)
 
     @staticmethod
     def _identify_url_source(url: str) -> str:
-        for pattern in VALID_URL_FORMATS["JMA"]:
-            if re.match(pattern, url):
-                return "JMA"
+        return registry.get_source_for_url(url).name
+
+
+class BaseEarthquakeList:
+    # Name of the source in the source registry
+    SOURCE: str = None
+
+    # Keys of the top-k trackers that are filled during the stats pass
+    _DEFAULT_TOP_K_KEYS: Dict[str, Tuple[str, Any, bool]] = {
+        "strongest": ("magnitude", None, False),
+        "weakest": ("magnitude", None, True),
+    }
+
+    def __init__(self,
+                 url: str,
+                 start_date: str,
+                 histograms: Optional[Dict[str, stats.Histogram]] = None,
+                 profile: bool = False
+                 ) -> None:
+        self._init_attributes(histograms)
+        self._top_k.update({
+            top_k_key: self._get_top_k(stats.DEFAULT_TOP_K, *top_k_key)
+            for top_k_key in self._DEFAULT_TOP_K_KEYS.values()
+        })
+
+        profiler = None
 
-        for pattern in VALID_URL_FORMATS["PHIVOLCS"]:
-            if re.match(pattern, url):
-                return "PHIVOLCS"
+        if profile or profiling.is_profiling_enabled_by_env():
+            profiler = profiling.MemoryProfiler()
+            profiler.start()
 
-        raise InvalidURLError(url)
+        try:
+            self._eq_list = self._get_earthquake_entries(url, start_date)
 
+            with profiling.stage("stats"):
+                self._eq_stats = self._get_stats()
 
-class BaseEarthquakeList(ABC):
-    def __init__(self, url: str, start_date: str) -> None:
-        self._eq_list = self._get_earthquake_entries(url, start_date)
-        self._eq_stats = self._get_stats()
+            with profiling.stage("display"):
+                self.eq_display = self._get_display()
+        finally:
+            if profiler:
+                profiler.stop()
+
+        if profiler:
+            self._memory_profile = profiler.get_report(len(self._eq_list))
+
+    @classmethod
+    def _from_snapshot(cls, eq_list: List[Dict[str, Any]], eq_stats: Dict[str, Any]) -> "BaseEarthquakeList":
+        """
+        Creates the earthquake list from previously saved entries and stats
+        instead of scraping them. Top-k trackers are rebuilt from the
+        entries on first use.
+        """
+        instance = cls.__new__(cls)
+        instance._init_attributes()
+        instance._eq_list = eq_list
+        instance._eq_stats = eq_stats
+        instance.eq_display = instance._get_display()
+
+        return instance
+
+    def _init_attributes(self, histograms: Optional[Dict[str, stats.Histogram]] = None) -> None:
+        """
+        Sets up the attributes of the list, whether it is built from the
+        source or restored from a snapshot.
+        """
+        self._histograms = histograms
+        self._top_k: Dict[Any, stats.TopK] = {}
+        self._memory_profile = None
+        self._eq_list: List[Dict[str, Any]] = []
+        self._eq_stats: Dict[str, Any] = {}
+        self.eq_display = None
 
     def __iter__(self) -> Iterator[Any]:
         return iter(self._eq_list)
@@ -46,58 +137,183 @@ class BaseEarthquakeList(ABC):
     def get_raw_eq_stats(self) -> Dict[str, Any]:
         return self._eq_stats
 
-    @abstractmethod
-    def display_overview(self) -> None:
-        pass
+    def get_memory_profile(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the memory usage recorded per stage (fetch, parse, extract,
+        stats and display) while building the list, along with the bytes
+        retained per entry. Only available when the list was created with
+        profile=True or with the EQDATATOOLS_PROFILE environment variable set.
+        """
+        return self._memory_profile
 
-    @abstractmethod
-    def display_all_entries(self) -> None:
-        pass
+    def save_snapshot(self, path: str) -> None:
+        """
+        Saves the entries and stats to a file, so that the list can be
+        restored later with EarthquakeList.load_snapshot() without scraping
+        the source again.
+        """
+        snapshot.save_snapshot(path, self.SOURCE, self._eq_list, self._eq_stats)
 
-    @abstractmethod
-    def _get_earthquake_entries(self, url: str, start_date: str) -> List[Dict[str, Any]]:
-        pass
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Adds an entry to the list. See extend()."""
+        self.extend([entry])
 
-    @abstractmethod
-    def _get_stats(self) -> Dict[str, Any]:
-        pass
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """
+        Adds entries (normalized events, e.g. from a newer page of the same
+        source) to the list. The stats and every top-k tracker are updated
+        with only the new entries, so top() and the overview keep covering
+        the whole list without scanning it again.
+        """
+        entries = list(entries)
+        default_top_k = self._get_default_top_k()
+        default_top_k_keys = set(self._DEFAULT_TOP_K_KEYS.values())
 
+        for top_k_key, top_k in self._top_k.items():
+            if top_k_key not in default_top_k_keys:
+                top_k.update(entries)
 
-class PHIVOLCSEarthquakeList(BaseEarthquakeList):
-    def __init__(self, url: str, start_date: str):
-        super().__init__(url, start_date)
-        self.eq_display = display.PHIVOLCSDisplayEQData(self._eq_list, self._eq_stats)
+        self._eq_list.extend(entries)
+        stats.StatsGenerator.update(self._eq_stats, entries, default_top_k)
+
+    def top(self, n: int, by: str = "magnitude", group_by: Any = None, smallest: bool = False) -> Any:
+        """
+        Returns the n entries with the largest value of `by` ("magnitude",
+        "intensity" or "depth"), or the smallest if `smallest` is set. When
+        group_by ("month", "region" or a function of an entry) is given,
+        returns a dict of group key to its top entries.
+
+        Trackers are kept per query, so repeated queries with the same or a
+        smaller n reuse the heaps filled during the stats pass (or the first
+        query) instead of scanning the list again. Trackers grouped by a
+        function are not kept, since each new function would add one.
+        """
+        return self._get_top_k_tracker(n, by, group_by, smallest).get_top(n)
+
+    def _get_top_k_tracker(self, k: int, by: str, group_by: Any, smallest: bool) -> stats.TopK:
+        """
+        Returns the kept tracker for the query if it keeps at least k
+        entries, otherwise fills a new one from the list.
+        """
+        top_k_key = (by, group_by, smallest)
+        top_k = self._top_k.get(top_k_key)
+
+        if top_k is None or top_k.k < k:
+            top_k = self._get_top_k(k, by, group_by, smallest)
+            top_k.update(self._eq_list)
+
+            if not callable(group_by):
+                self._top_k[top_k_key] = top_k
+
+        return top_k
+
+    def _get_default_top_k(self) -> Dict[str, Any]:
+        """Returns the top-k trackers that are filled during the stats pass."""
+        return {
+            name: self._get_top_k_tracker(stats.DEFAULT_TOP_K, *top_k_key)
+            for name, top_k_key in self._DEFAULT_TOP_K_KEYS.items()
+        }
 
     def display_overview(self) -> None:
         self.eq_display.display_overview()
 
-    def display_all_entries(self) -> None:
-        self.eq_display.display_all_entries()
+    def display_all_entries(self, **kwargs: bool) -> None:
+        self.eq_display.display_all_entries(**kwargs)
+
+    def aggregate_by_time(self, interval: str = "day", window: Optional[int] = None) -> stats.TimeBucketAggregator:
+        """
+        Groups the entries into time buckets (see stats.TimeBucketAggregator)
+        that follow the calendar of the source's timezone.
+        """
+        return stats.TimeBucketAggregator(self._eq_list, interval, window, tz=self._get_source().tzinfo)
+
+    def get_approximate_stats(self, **kwargs: Any) -> stats.ApproximateStats:
+        """
+        Returns constant-memory approximate stats of the entries (distinct
+        events, per-region counts, magnitude and depth quantiles and a random
+        sample) with their error bounds. Accepts the options of
+        stats.ApproximateStats (sample_size, sketch_width, sketch_depth,
+        hll_precision, compression, quantiles, top_regions, seed), and uses
+        the region key of the source unless region_key is given. The result
+        can be merged with the approximate stats of other lists.
+        """
+        kwargs.setdefault("region_key", self._get_source().region_key)
+
+        return stats.ApproximateStats(self._eq_list, **kwargs)
+
+    def _get_source(self) -> Source:
+        return registry.get_source(self.SOURCE)
 
     def _get_earthquake_entries(self, url: str, start_date: str) -> List[Dict[str, Any]]:
-        eq_list = scraper.phivolcs.scrape_data(url, start_date)
+        eq_list = self._get_source().scraper(url, start_date)
         return eq_list
 
     def _get_stats(self) -> Dict[str, Any]:
-        eq_stats = stats.phivolcs.get_stats(self._eq_list)
+        eq_stats = stats.StatsGenerator(self._eq_list, self._histograms, self._get_default_top_k())
         return eq_stats
 
+    def _get_top_k(self, k: int, by: str, group_by: Any, smallest: bool) -> stats.TopK:
+        source = self._get_source()
+
+        return stats.TopK(k, by, group_by, smallest, region_key=source.region_key, tz=source.tzinfo)
+
+    def _get_display(self) -> display.DisplayEQData:
+        display_class = self._get_source().display_class or display.DisplayEQData
+
+        return display_class(self._eq_list, self._eq_stats, self.SOURCE)
+
+
+class PHIVOLCSEarthquakeList(BaseEarthquakeList):
+    SOURCE = "PHIVOLCS"
+
+    def enrich(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Downloads the event details page and graphic of every entry
+        concurrently, adding the parsed details as entry["details"] and the
+        local path of the graphic as entry["graphic_path"]. Downloads are
+        cached, so enriching again only fetches what is missing. Accepts the
+        options of PHIVOLCSEventEnricher (cache_dir, max_workers,
+        fetch_graphics, fetcher, on_progress, rate_limit) and returns its
+        metrics.
+        """
+        return scraper.phivolcs_enrichment.enrich_data(self._eq_list, **kwargs)
+
 
 class JMAEarthquakeList(BaseEarthquakeList):
-    def __init__(self, url: str, start_date: str):
-        super().__init__(url, start_date)
-        self.eq_display = display.JMADisplayEQData(self._eq_list, self._eq_stats)
+    SOURCE = "JMA"
 
-    def display_overview(self) -> None:
-        self.eq_display.display_overview()
 
-    def display_all_entries(self) -> None:
-        self.eq_display.display_all_entries()
+def get_earthquake_list_class(source: Source) -> type:
+    """
+    Returns the earthquake list class of the source, creating a plain
+    BaseEarthquakeList subclass for sources that don't provide one.
+    """
+    with _list_class_lock:
+        if source.earthquake_list_class is None:
+            class_name = f"{source.name}EarthquakeList"
+            source.earthquake_list_class = type(class_name, (BaseEarthquakeList,), {"SOURCE": source.name})
 
-    def _get_earthquake_entries(self, url: str, start_date: str) -> List[Dict[str, Any]]:
-        eq_list = scraper.jma.scrape_data(url, start_date)
-        return eq_list
+        return source.earthquake_list_class
 
-    def _get_stats(self) -> Dict[str, Any]:
-        eq_stats = stats.jma.get_stats(self._eq_list)
-        return eq_stats
+
+register_source(Source(
+    "JMA",
+    hosts=["www.jma.go.jp"],
+    url_patterns=VALID_URL_FORMATS["JMA"],
+    scraper=scraper.jma.scrape_data,
+    display_class=display.JMADisplayEQData,
+    date_formats=VALID_DATE_FORMATS["JMA"],
+    tzinfo=TIMEZONES["JMA"],
+    earthquake_list_class=JMAEarthquakeList
+))
+register_source(Source(
+    "PHIVOLCS",
+    hosts=["earthquake.phivolcs.dost.gov.ph"],
+    url_patterns=VALID_URL_FORMATS["PHIVOLCS"],
+    scraper=scraper.phivolcs.scrape_data,
+    region_key=stats.phivolcs.get_region,
+    display_class=display.PHIVOLCSDisplayEQData,
+    date_formats=VALID_DATE_FORMATS["PHIVOLCS"],
+    tzinfo=TIMEZONES["PHIVOLCS"],
+    earthquake_list_class=PHIVOLCSEarthquakeList
+))
@@ -6,6 +6,14 @@ class InvalidURLError(Exception):
         super().__init__(self.message)
 
 
+class DuplicateSourceError(Exception):
+    """Custom exception for registering a source name more than once."""
+
+    def __init__(self, name: str) -> None:
+        self.message = f"A source named '{name}' is already registered."
+        super().__init__(self.message)
+
+
 class InvalidDateFormat(Exception):
     """Custom exception for invalid date formats."""
 
@@ -28,3 +36,42 @@ class InvalidDepthFormat(Exception):
     def __init__(self, entry: str, pattern: str) -> None:
         self.message = f"Invalid depth format detected. Check if the pattern matches the source properly\n\n\tentry: {entry}\n\tpattern: {pattern}"
         super().__init__(self.message)
+
+
+class InvalidIntensityFormat(Exception):
+    """Custom exception for seismic intensities that aren't on the source's scale."""
+
+    def __init__(self, intensity: str, levels: list) -> None:
+        self.message = f"Invalid seismic intensity '{intensity}' detected. Valid levels are: {', '.join(levels)}"
+        super().__init__(self.message)
+
+
+class DataTableNotFoundError(Exception):
+    """Custom exception for pages without the earthquake table the scraper expects."""
+
+    def __init__(self, url: str) -> None:
+        self.message = f"No earthquake table was found on '{url}'."
+        super().__init__(self.message)
+
+
+class FetchError(Exception):
+    """Custom exception for failed requests to a data source."""
+
+    def __init__(self, url: str, reason: str) -> None:
+        self.message = f"Failed to fetch data from '{url}': {reason}"
+        super().__init__(self.message)
+
+
+class CircuitOpenError(FetchError):
+    """Custom exception for requests rejected because the host keeps failing."""
+
+    def __init__(self, url: str, host: str) -> None:
+        super().__init__(url, f"too many recent failures from '{host}', requests are paused")
+
+
+class InvalidSnapshotError(Exception):
+    """Custom exception for snapshot files that can't be restored."""
+
+    def __init__(self, path: str, reason: str) -> None:
+        self.message = f"The snapshot '{path}' can't be loaded: {reason}"
+        super().__init__(self.message)
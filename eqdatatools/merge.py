@@ -0,0 +1,26 @@
+from heapq import merge
+from typing import Any, Iterable, Iterator
+from eqdatatools.schema import EarthquakeEvent, to_utc
+
+
+def merge_eq_lists(*eq_lists: Iterable[EarthquakeEvent]) -> Iterator[EarthquakeEvent]:
+    """
+    Merges earthquake lists (e.g. one per month, or from different sources)
+    into a single stream of entries ordered from newest to oldest, the same
+    order the scrapers return them in.
+
+    Each list must already be sorted from newest to oldest. Since only the
+    first remaining entry of each list is compared, merging m lists with n
+    entries in total takes O(n log m) time, and entries are yielded one at a
+    time instead of building and sorting a combined list.
+
+    The stream can be passed directly to StatsGenerator to get the stats of
+    the merged catalog.
+    """
+    return merge(*eq_lists, key=_get_sort_key, reverse=True)
+
+
+def _get_sort_key(entry: EarthquakeEvent) -> Any:
+    # Entry dates are already in UTC, but converting again keeps entries
+    # created outside the scrapers comparable as well
+    return to_utc(entry["date"])
@@ -0,0 +1,115 @@
+import os
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+from eqdatatools.constants import PROFILE_ENV_VAR
+
+# Number of lines with the largest allocation growth reported per stage
+TOP_ALLOCATIONS_PER_STAGE = 5
+
+_active_profiler: ContextVar[Optional["MemoryProfiler"]] = ContextVar("active_profiler", default=None)
+
+# tracemalloc and its peak are global to the process, so only one profiler
+# can measure at a time. Lists built concurrently with profiling enabled
+# (e.g. with EarthquakeList.from_urls()) wait for each other here.
+_profiling_lock = threading.RLock()
+
+
+class MemoryProfiler:
+    """
+    Records memory usage of each stage of building an earthquake list
+    (fetch, parse, extract, stats and display) using tracemalloc. For every
+    stage, it records the memory still allocated after the stage, the peak
+    during the stage, and the lines that allocated the most.
+    """
+
+    def __init__(self) -> None:
+        self.stages: List[Dict[str, Any]] = []
+        self._started_tracing = False
+        self._holds_lock = False
+        self._token = None
+
+    def start(self) -> None:
+        """
+        Starts profiling. This waits until any other profiler has stopped,
+        so stages of different lists are never measured at the same time.
+        """
+        _profiling_lock.acquire()
+        self._holds_lock = True
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        self._token = _active_profiler.set(self)
+
+    def stop(self) -> None:
+        if self._token is not None:
+            _active_profiler.reset(self._token)
+            self._token = None
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        if self._holds_lock:
+            self._holds_lock = False
+            _profiling_lock.release()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        # The snapshot is taken before measuring, so the memory it uses is
+        # counted in both measurements and cancels out
+        snapshot_before = tracemalloc.take_snapshot()
+        memory_before, _ = tracemalloc.get_traced_memory()
+
+        # reset_peak() is only available from Python 3.9. Without it, the
+        # peak is the highest usage since tracing started.
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+        try:
+            yield
+        finally:
+            memory_after, peak_memory = tracemalloc.get_traced_memory()
+            snapshot_after = tracemalloc.take_snapshot()
+            top_allocations = snapshot_after.compare_to(snapshot_before, "lineno")[:TOP_ALLOCATIONS_PER_STAGE]
+
+            self.stages.append({
+                "stage": name,
+                "retained_bytes": memory_after - memory_before,
+                "peak_bytes": peak_memory - memory_before,
+                "top_allocations": [str(statistic) for statistic in top_allocations],
+            })
+
+    def get_report(self, entry_count: int) -> Dict[str, Any]:
+        total_retained_bytes = sum(stage["retained_bytes"] for stage in self.stages)
+
+        report = {
+            "entries": entry_count,
+            "total_retained_bytes": total_retained_bytes,
+            "bytes_per_entry": total_retained_bytes / entry_count if entry_count else None,
+            "peak_bytes": max((stage["peak_bytes"] for stage in self.stages), default=0),
+            "stages": self.stages,
+        }
+
+        return report
+
+
+def stage(name: str) -> ContextManager[None]:
+    """
+    Marks a stage for the active profiler of the current context. This does
+    nothing when profiling is not enabled.
+    """
+    profiler = _active_profiler.get()
+
+    if profiler is None:
+        return nullcontext()
+
+    return profiler.stage(name)
+
+
+def is_profiling_enabled_by_env() -> bool:
+    return os.environ.get(PROFILE_ENV_VAR, "").lower() in ("1", "true", "yes")
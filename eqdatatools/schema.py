@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+from typing import Dict, Optional, TypedDict
+
+
+class Coordinates(TypedDict):
+    latitude: Optional[float]
+    longitude: Optional[float]
+
+
+class EarthquakeEvent(TypedDict):
+    """
+    Normalized earthquake entry produced by every scraper. All dates are
+    timezone-aware and in UTC, so entries from different sources can be
+    merged, sorted and processed together. Fields that a source doesn't
+    provide are set to None.
+    """
+
+    source: str
+    date: datetime  # Observed date
+    issuance_date: Optional[datetime]
+    location: str  # English location
+    location_local: Optional[str]  # Location in the source's own language
+    magnitude: Optional[float]
+    max_seismic_intensity: Optional[int]  # Position on the source's intensity scale
+    coordinates: Coordinates
+    depth: Optional[int]
+    event_details_url: Optional[str]
+    graphic_url: Optional[str]
+    details: Optional[Dict[str, str]]  # Fields from the event details page, if fetched
+    graphic_path: Optional[str]  # Local path of the downloaded graphic, if fetched
+
+
+def to_utc(date: Optional[datetime]) -> Optional[datetime]:
+    """Converts the date to UTC. Naive dates are assumed to be in UTC already."""
+    if date is None:
+        return None
+
+    if date.tzinfo is None:
+        return date.replace(tzinfo=timezone.utc)
+
+    return date.astimezone(timezone.utc)
+
+
+def create_event(source: str,
+                 date: datetime,
+                 location: str,
+                 magnitude: Optional[float],
+                 latitude: Optional[float],
+                 longitude: Optional[float],
+                 depth: Optional[int],
+                 event_details_url: Optional[str] = None,
+                 issuance_date: Optional[datetime] = None,
+                 location_local: Optional[str] = None,
+                 max_seismic_intensity: Optional[int] = None,
+                 graphic_url: Optional[str] = None
+                 ) -> EarthquakeEvent:
+    event: EarthquakeEvent = {
+        "source": source,
+        "date": to_utc(date),
+        "issuance_date": to_utc(issuance_date),
+        "location": location,
+        "location_local": location_local,
+        "magnitude": magnitude,
+        "max_seismic_intensity": max_seismic_intensity,
+        "coordinates": {
+            "latitude": latitude,
+            "longitude": longitude
+        },
+        "depth": depth,
+        "event_details_url": event_details_url,
+        "graphic_url": graphic_url,
+        "details": None,
+        "graphic_path": None,
+    }
+
+    return event
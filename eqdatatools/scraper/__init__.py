@@ -1,4 +1,7 @@
 from . import jma
 from . import phivolcs
+from . import phivolcs_enrichment
+from ._fetcher import Fetcher, default_fetcher, get_fetch_metrics
+from ._session import get_session, set_session, mount_adapters
 
-__all__ = ["jma", "phivolcs"]
+__all__ = ["jma", "phivolcs", "phivolcs_enrichment", "Fetcher", "default_fetcher", "get_fetch_metrics", "get_session", "set_session", "mount_adapters"]
@@ -12,7 +12,7 @@ class DataScraper(ABC):
 
     def __init__(self, url, start_date):
         self.eq_list = []
-        self._scrape_data(url, start_date)
+        self._scrape_data(url, self._parse_start_date(start_date))
 
     def __iter__(self):
         return iter(self.eq_list)
@@ -25,11 +25,19 @@ class DataScraper(ABC):
         date and time will not be processed.
         """
 
-        start_date = datetime.strptime(start_date, VALID_DATE_FORMATS["DEFAULT"][0])
-
         if retrieve_date < start_date:
             return True
 
+    def _parse_start_date(self, start_date):
+        """
+        Converts the start date string to a datetime object once, instead of
+        for every entry being checked.
+        """
+        if not start_date:
+            return None
+
+        return datetime.strptime(start_date, VALID_DATE_FORMATS["DEFAULT"][0])
+
     @abstractmethod
     def _scrape_data(self, url, cutoff_date):
         pass
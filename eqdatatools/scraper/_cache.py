@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+
+class ContentCache:
+    """
+    Local cache of downloaded files. Files are stored under the SHA-256 hash
+    of their content, so identical files are only stored once, and an index
+    maps each URL to the hash of its content.
+    """
+
+    INDEX_FILE_NAME = "index.json"
+    OBJECTS_DIR_NAME = "objects"
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+        self._objects_dir = os.path.join(cache_dir, self.OBJECTS_DIR_NAME)
+        self._index_path = os.path.join(cache_dir, self.INDEX_FILE_NAME)
+        self._lock = threading.Lock()
+
+        os.makedirs(self._objects_dir, exist_ok=True)
+        self._index = self._load_index()
+
+    def get_path(self, url: str) -> Optional[str]:
+        """Returns the path of the cached file for the URL, if there is one."""
+        cached = self._read(url)
+
+        return cached[0] if cached else None
+
+    def get(self, url: str) -> Optional[bytes]:
+        cached = self._read(url)
+
+        return cached[1] if cached else None
+
+    def put(self, url: str, content: bytes) -> str:
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self._get_object_path(content_hash)
+
+        if not os.path.exists(path):
+            self._write_atomically(path, content)
+
+        with self._lock:
+            self._index[url] = content_hash
+
+        return path
+
+    def save_index(self) -> None:
+        with self._lock:
+            encoded_index = json.dumps(self._index).encode("utf-8")
+
+        self._write_atomically(self._index_path, encoded_index)
+
+    def _load_index(self) -> Dict[str, str]:
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _read(self, url: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Returns the path and content of the cached file for the URL. Files
+        whose content no longer matches their hash (e.g. because they were
+        modified or truncated) are treated as missing and removed, so they
+        are downloaded again.
+        """
+        with self._lock:
+            content_hash = self._index.get(url)
+
+        if content_hash is None:
+            return None
+
+        path = self._get_object_path(content_hash)
+
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+        except FileNotFoundError:
+            return None
+
+        if hashlib.sha256(content).hexdigest() != content_hash:
+            self._remove_object(path)
+
+            return None
+
+        return path, content
+
+    def _remove_object(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _get_object_path(self, content_hash: str) -> str:
+        return os.path.join(self._objects_dir, content_hash)
+
+    def _write_atomically(self, path: str, content: bytes) -> None:
+        """
+        Writes to a temporary file first, so that other threads or processes
+        never read a partially written file.
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir)
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(content)
+
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
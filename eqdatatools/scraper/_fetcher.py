@@ -0,0 +1,314 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlsplit
+import requests
+from eqdatatools.constants import (
+    FETCH_CONNECT_TIMEOUT,
+    FETCH_READ_TIMEOUT,
+    FETCH_MAX_RETRIES,
+    FETCH_BACKOFF_BASE,
+    FETCH_BACKOFF_MAX,
+    FETCH_RATE_LIMIT,
+    FETCH_RATE_BURST,
+    FETCH_CIRCUIT_FAILURE_THRESHOLD,
+    FETCH_CIRCUIT_RESET_TIMEOUT,
+    RETRYABLE_STATUS_CODES
+)
+from eqdatatools.exceptions import FetchError, CircuitOpenError
+from eqdatatools.scraper._session import get_session, mount_adapters as _mount_adapters
+
+
+class TokenBucket:
+    """
+    Rate limiter that allows `rate` requests per second on average, with
+    bursts of up to `capacity` requests.
+    """
+
+    def __init__(self, rate: float, capacity: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how many seconds the caller has to wait
+        before using it. The token is reserved right away so that concurrent
+        callers queue up behind each other instead of all waking up at once.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a host after `failure_threshold` consecutive
+    failures. After `reset_timeout` seconds, a single trial request is let
+    through: if it succeeds the circuit closes again, otherwise it stays open
+    for another `reset_timeout` seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class Fetcher:
+    """
+    Fetches data from sources with connect/read timeouts, retries with
+    jittered exponential backoff, a per-host rate limit and a per-host
+    circuit breaker. A single instance can be shared between threads.
+
+    The clock, sleep and random functions can be replaced, which makes the
+    retry and rate limiting behavior testable without waiting in real time.
+    Requests are sent with the given session, or the process-wide shared
+    session if none is given. The PHIVOLCS adapter is mounted on a given
+    session, unless mount_adapters is False.
+    """
+
+    def __init__(self,
+                 connect_timeout: float = FETCH_CONNECT_TIMEOUT,
+                 read_timeout: float = FETCH_READ_TIMEOUT,
+                 max_retries: int = FETCH_MAX_RETRIES,
+                 backoff_base: float = FETCH_BACKOFF_BASE,
+                 backoff_max: float = FETCH_BACKOFF_MAX,
+                 rate_limit: Optional[float] = FETCH_RATE_LIMIT,
+                 rate_burst: int = FETCH_RATE_BURST,
+                 failure_threshold: int = FETCH_CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = FETCH_CIRCUIT_RESET_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 random_func: Callable[[], float] = random.random,
+                 session: Optional[requests.Session] = None,
+                 mount_adapters: bool = True
+                 ) -> None:
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._sleep = sleep
+        self._random = random_func
+        self._session = session
+
+        if session is not None and mount_adapters:
+            _mount_adapters(session)
+        self._rate_limiters: Dict[str, TokenBucket] = {}
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Sends a GET request and returns the response once it has a 200 status
+        code. Raises FetchError when all attempts fail, and CircuitOpenError
+        when the host is currently being skipped due to repeated failures.
+        """
+        host = urlsplit(url).netloc
+        rate_limiter, circuit_breaker, metrics = self._get_host_state(host)
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._session or get_session()
+        reason = None
+
+        for attempt in range(self.max_retries + 1):
+            if not circuit_breaker.allow_request():
+                self._increment_metric(metrics, "rejected")
+                raise CircuitOpenError(url, host)
+
+            if attempt > 0:
+                self._increment_metric(metrics, "retries")
+
+            self._wait_for_rate_limit(rate_limiter, metrics)
+
+            started_at = self._clock()
+            self._increment_metric(metrics, "requests")
+
+            try:
+                response = self._send(session, url, circuit_breaker, kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                reason = f"{type(e).__name__}: {e}"
+                retry_after = None
+            except requests.RequestException:
+                self._increment_metric(metrics, "failures")
+                raise
+            else:
+                self._record_latency(metrics, self._clock() - started_at)
+
+                if response.status_code == 200:
+                    self._increment_metric(metrics, "successes")
+                    return response
+
+                reason = f"status code {response.status_code}"
+
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self._increment_metric(metrics, "failures")
+                    raise FetchError(url, reason)
+
+                retry_after = self._get_retry_after(response)
+
+            self._increment_metric(metrics, "failures")
+
+            if attempt < self.max_retries:
+                self._sleep(self._get_backoff_delay(attempt, retry_after))
+
+        raise FetchError(url, f"{reason} (after {self.max_retries + 1} attempts)")
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Returns a snapshot of the request metrics, per host."""
+        with self._lock:
+            metrics = {}
+
+            for host, host_metrics in self._metrics.items():
+                metrics[host] = dict(host_metrics)
+                metrics[host]["circuit_state"] = self._circuit_breakers[host].state
+
+            return metrics
+
+    def _send(self, session: requests.Session, url: str, circuit_breaker: CircuitBreaker, kwargs: Dict[str, Any]) -> requests.Response:
+        """
+        Sends a single request and records its outcome on the circuit
+        breaker, whatever happens. Otherwise a trial request in the half-open
+        state could leave the circuit half-open, rejecting every request to
+        the host from then on.
+
+        Client errors (4xx other than 429) mean the host is answering, so
+        they close the circuit. Server errors, 429 and exceptions count as
+        failures.
+        """
+        host_answered = False
+
+        try:
+            response = session.get(url, **kwargs)
+            host_answered = response.status_code < 500 and response.status_code != 429
+        finally:
+            if host_answered:
+                circuit_breaker.record_success()
+            else:
+                circuit_breaker.record_failure()
+
+        return response
+
+    def _get_host_state(self, host: str) -> tuple:
+        with self._lock:
+            if host not in self._metrics:
+                rate_limiter = None
+
+                if self.rate_limit:
+                    rate_limiter = TokenBucket(self.rate_limit, self.rate_burst, self._clock)
+
+                self._rate_limiters[host] = rate_limiter
+                self._circuit_breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout, self._clock)
+                self._metrics[host] = {
+                    "requests": 0,
+                    "successes": 0,
+                    "failures": 0,
+                    "retries": 0,
+                    "rejected": 0,
+                    "rate_limited_seconds": 0.0,
+                    "total_latency": 0.0,
+                    "max_latency": 0.0,
+                }
+
+            return self._rate_limiters[host], self._circuit_breakers[host], self._metrics[host]
+
+    def _wait_for_rate_limit(self, rate_limiter: Optional[TokenBucket], metrics: Dict[str, Any]) -> None:
+        if rate_limiter is None:
+            return
+
+        wait_time = rate_limiter.reserve()
+
+        if wait_time > 0:
+            self._increment_metric(metrics, "rate_limited_seconds", wait_time)
+            self._sleep(wait_time)
+
+    def _get_backoff_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """
+        Returns a random delay between zero and an exponentially growing cap
+        ("full jitter"), so that parallel workers retrying the same host
+        spread out instead of retrying in lockstep.
+        """
+        delay = self._random() * min(self.backoff_max, self.backoff_base * (2 ** attempt))
+
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+
+        return delay
+
+    def _get_retry_after(self, response: requests.Response) -> Optional[float]:
+        retry_after = response.headers.get("Retry-After")
+
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+    def _record_latency(self, metrics: Dict[str, Any], latency: float) -> None:
+        with self._lock:
+            metrics["total_latency"] += latency
+            metrics["max_latency"] = max(metrics["max_latency"], latency)
+
+    def _increment_metric(self, metrics: Dict[str, Any], name: str, amount: float = 1) -> None:
+        with self._lock:
+            metrics[name] += amount
+
+
+# Shared by all scrapers so that rate limits and circuit breakers apply
+# across every EarthquakeList created in the process
+default_fetcher = Fetcher()
+
+
+def fetch(url: str, **kwargs: Any) -> requests.Response:
+    return default_fetcher.get(url, **kwargs)
+
+
+def get_fetch_metrics() -> Dict[str, Dict[str, Any]]:
+    return default_fetcher.get_metrics()
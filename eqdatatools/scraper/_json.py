@@ -0,0 +1,87 @@
+import json
+from typing import List, NamedTuple, Sequence
+
+# Faster JSON libraries are used when installed (through the "fast-json"
+# extra), falling back to the standard library otherwise.
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# The fields of a JMA list.json entry that are used by the scraper
+JMA_SOURCE_FIELDS = ("at", "rdt", "anm", "en_anm", "mag", "maxi", "cod", "ctt")
+
+if msgspec:
+    class JMASourceEntry(msgspec.Struct, frozen=True, gc=False):
+        """
+        The fields of a JMA list.json entry that are used by the scraper.
+        msgspec decodes straight into this struct and skips every other key
+        of the entry instead of building it. Entries only hold strings, so
+        they don't need to be tracked by the garbage collector.
+        """
+
+        at: str = ""  # Observed date
+        rdt: str = ""  # Issuance date
+        anm: str = ""  # Location in Japanese
+        en_anm: str = ""  # Location in English
+        mag: str = ""
+        maxi: str = ""  # Max seismic intensity
+        cod: str = ""  # Coordinates and depth
+        ctt: str = ""  # Event ID
+
+    _jma_list_decoder = msgspec.json.Decoder(List[JMASourceEntry])
+else:
+    class JMASourceEntry(NamedTuple):
+        """The fields of a JMA list.json entry that are used by the scraper."""
+
+        at: str = ""  # Observed date
+        rdt: str = ""  # Issuance date
+        anm: str = ""  # Location in Japanese
+        en_anm: str = ""  # Location in English
+        mag: str = ""
+        maxi: str = ""  # Max seismic intensity
+        cod: str = ""  # Coordinates and depth
+        ctt: str = ""  # Event ID
+
+
+def get_json_backend() -> str:
+    if msgspec:
+        return "msgspec"
+    if orjson:
+        return "orjson"
+
+    return "json"
+
+
+def decode_jma_entries(content: bytes, backend: str = None) -> Sequence[JMASourceEntry]:
+    """
+    Decodes the raw bytes of JMA's list.json into entries holding only the
+    fields in JMA_SOURCE_FIELDS, read as attributes. Every backend returns
+    JMASourceEntry. With msgspec or orjson, the bytes are parsed directly, so
+    no decoded str copy of the whole payload is made.
+    """
+    backend = backend or get_json_backend()
+
+    if (backend == "msgspec" and not msgspec) or (backend == "orjson" and not orjson):
+        raise ValueError(f"JSON backend '{backend}' is not installed.")
+
+    if backend == "msgspec":
+        return _jma_list_decoder.decode(content)
+
+    if backend == "orjson":
+        data = orjson.loads(content)
+    else:
+        data = json.loads(content)
+
+    return [_select_jma_fields(entry) for entry in data]
+
+
+def _select_jma_fields(entry: dict) -> JMASourceEntry:
+    return JMASourceEntry(*[entry.get(field, "") for field in JMA_SOURCE_FIELDS])
+
@@ -0,0 +1,132 @@
+import ssl
+import threading
+from typing import Any, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from eqdatatools.constants import (
+    PHIVOLCS_CA_CERT_PATH,
+    PHIVOLCS_HOME_URL,
+    CONNECTION_POOL_HOSTS,
+    CONNECTION_POOL_MAXSIZE
+)
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """
+    HTTP adapter that verifies certificates with a prebuilt SSL context.
+
+    By default, requests passes the path of a CA bundle with every new
+    connection, which makes urllib3 load and parse the bundle each time. Here
+    the CA certificates are loaded into the context once, and the bundle path
+    is cleared from the connections.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs: Any) -> None:
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    @classmethod
+    def from_ca_file(cls, ca_file: str, **kwargs: Any) -> "SSLContextAdapter":
+        """Creates an adapter that trusts only the CA certificates in the file."""
+        return cls(ssl.create_default_context(cafile=ca_file), **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        super().cert_verify(conn, url, verify, cert)
+
+        if verify is True:
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+
+class ConnectionManager:
+    """
+    Provides one requests.Session for the whole process, so connections are
+    kept alive and reused across scrapers, threads and EarthquakeList
+    instances instead of doing a new TCP and TLS handshake for every request.
+
+    Requests to PHIVOLCS are verified with an SSL context built once from the
+    bundled CA chain (or from `ca_file` for requests to `ca_url`). Callers
+    can provide their own session with set_session(), e.g. to configure
+    proxies.
+    """
+
+    def __init__(self, ca_file: str = PHIVOLCS_CA_CERT_PATH, ca_url: str = PHIVOLCS_HOME_URL) -> None:
+        self.ca_file = ca_file
+        self.ca_url = ca_url
+        self._session: Optional[requests.Session] = None
+        self._phivolcs_ssl_context: Optional[ssl.SSLContext] = None
+        self._lock = threading.Lock()
+        self._ssl_context_lock = threading.Lock()
+
+    def get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+
+            return self._session
+
+    def set_session(self, session: requests.Session, mount_adapters: bool = True) -> None:
+        """
+        Uses the given session for all requests. Unless mount_adapters is
+        False, the PHIVOLCS adapter is mounted on the session so PHIVOLCS
+        certificates can still be verified.
+        """
+        if mount_adapters:
+            self.mount_adapters(session)
+
+        with self._lock:
+            self._session = session
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def mount_adapters(self, session: requests.Session) -> None:
+        """
+        Mounts the adapter that verifies PHIVOLCS certificates with the
+        prebuilt SSL context. Requests to PHIVOLCS fail verification on
+        sessions without it, since its CA chain isn't in the default bundle.
+        """
+        adapter = SSLContextAdapter(
+            self._get_phivolcs_ssl_context(),
+            pool_connections=CONNECTION_POOL_HOSTS,
+            pool_maxsize=CONNECTION_POOL_MAXSIZE
+        )
+        session.mount(self.ca_url, adapter)
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=CONNECTION_POOL_HOSTS, pool_maxsize=CONNECTION_POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self.mount_adapters(session)
+
+        return session
+
+    def _get_phivolcs_ssl_context(self) -> ssl.SSLContext:
+        with self._ssl_context_lock:
+            if self._phivolcs_ssl_context is None:
+                self._phivolcs_ssl_context = ssl.create_default_context(cafile=self.ca_file)
+
+            return self._phivolcs_ssl_context
+
+
+connection_manager = ConnectionManager()
+
+
+def get_session() -> requests.Session:
+    return connection_manager.get_session()
+
+
+def set_session(session: requests.Session, mount_adapters: bool = True) -> None:
+    connection_manager.set_session(session, mount_adapters)
+
+
+def mount_adapters(session: requests.Session) -> None:
+    connection_manager.mount_adapters(session)
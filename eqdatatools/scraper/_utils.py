@@ -1,17 +1,19 @@
 from datetime import datetime
-from eqdatatools.constants import VALID_DATE_FORMATS, TIMEZONES
+from typing import Any
 from eqdatatools.exceptions import InvalidDateFormat
+from eqdatatools.sources import registry
 
 
 def convert_to_datetime_obj(datetime_str: str, source: str) -> datetime:
-    valid_date_formats = VALID_DATE_FORMATS.get(source)
-    tzinfo = TIMEZONES.get(source)
+    valid_date_formats = registry.get_date_formats(source)
+    tzinfo = registry.get_timezone(source)
 
     for date_format in valid_date_formats:
         try:
             datetime_obj = datetime.strptime(datetime_str, date_format)
 
-            if tzinfo:
+            # Dates that include a UTC offset (e.g. JMA's) keep it
+            if datetime_obj.tzinfo is None:
                 datetime_obj = datetime_obj.replace(tzinfo=tzinfo)
 
             return datetime_obj
@@ -19,3 +21,15 @@ def convert_to_datetime_obj(datetime_str: str, source: str) -> datetime:
             continue
 
     raise InvalidDateFormat(datetime_str)
+
+
+def decompose_webpage(webpage: Any) -> None:
+    """
+    Destroys a parsed BeautifulSoup webpage so its memory is freed right away.
+    Decomposing only the soup object leaves its children linked to it, so
+    each top-level element is decomposed as well.
+    """
+    for element in list(webpage.contents):
+        element.decompose()
+
+    webpage.decompose()
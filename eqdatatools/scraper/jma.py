@@ -1,7 +1,10 @@
-import json
 import re
-import requests
-from eqdatatools.exceptions import InvalidCoordinatesFormat, InvalidDepthFormat
+from eqdatatools import profiling
+from eqdatatools.constants import JMA_INTENSITY_LEVELS
+from eqdatatools.exceptions import InvalidCoordinatesFormat, InvalidDepthFormat, InvalidIntensityFormat
+from eqdatatools.schema import create_event
+from eqdatatools.scraper._fetcher import fetch
+from eqdatatools.scraper._json import decode_jma_entries
 from eqdatatools.scraper._utils import convert_to_datetime_obj
 from ._base import DataScraper
 
@@ -10,23 +13,23 @@ class JMAScraper(DataScraper):
     def _scrape_data(self, url, start_date):
         source_data = self._get_source_data(url)
 
-        for entry in source_data:
-            extracted_data = self._extract_data(entry, start_date)
+        with profiling.stage("extract"):
+            for entry in source_data:
+                extracted_data = self._extract_data(entry, start_date)
 
-            if not extracted_data or self._is_data_duplicate(extracted_data):
-                continue
+                if not extracted_data or self._is_data_duplicate(extracted_data):
+                    continue
 
-            self.eq_list.append(extracted_data)
+                self.eq_list.append(extracted_data)
 
     def _get_source_data(self, url):
-        response = requests.get(url)
+        with profiling.stage("fetch"):
+            response = fetch(url)
 
-        if response.status_code == 200:
-            data = json.loads(response.text)
-            return data
-        else:
-            print(f"Failed to fetch data. Status code: {response.status_code}")
-            return None
+        with profiling.stage("parse"):
+            data = decode_jma_entries(response.content)
+
+        return data
 
     def _extract_data(self, entry, start_date):
         eq_observed_date, eq_issuance_date = self._get_date(entry)
@@ -42,44 +45,39 @@ class JMAScraper(DataScraper):
         eq_depth = self._get_depth(entry)
         eq_event_details_url = self._get_event_details_url(entry)
 
-        eq_entry_details = {
-            "date": {
-                "observed_date": eq_observed_date,
-                "issuance_date": eq_issuance_date
-            },
-            "location": {
-                "location_en": eq_location_en,
-                "location_jpn": eq_location_jpn
-            },
-            "magnitude": eq_magnitude,
-            "max_seismic_intensity": eq_max_seismic_intensity,
-            "coordinates": {
-                "latitude": eq_latitude,
-                "longitude": eq_longitude
-            },
-            "depth": eq_depth,
-            "event_details_url": eq_event_details_url,
-        }
+        eq_entry_details = create_event(
+            source="JMA",
+            date=eq_observed_date,
+            issuance_date=eq_issuance_date,
+            location=eq_location_en,
+            location_local=eq_location_jpn,
+            magnitude=eq_magnitude,
+            max_seismic_intensity=eq_max_seismic_intensity,
+            latitude=eq_latitude,
+            longitude=eq_longitude,
+            depth=eq_depth,
+            event_details_url=eq_event_details_url
+        )
 
         return eq_entry_details
 
     def _get_date(self, entry):
-        eq_observed_date = convert_to_datetime_obj(entry["at"], source="JMA")
-        eq_issuance_date = convert_to_datetime_obj(entry["rdt"], source="JMA")
+        eq_observed_date = convert_to_datetime_obj(entry.at, source="JMA")
+        eq_issuance_date = convert_to_datetime_obj(entry.rdt, source="JMA")
 
         return eq_observed_date, eq_issuance_date
 
     def _get_location(self, entry):
-        location_en = self._remove_extra_characters(entry["en_anm"])
-        location_jpn = entry["anm"]
+        location_en = self._remove_extra_characters(entry.en_anm)
+        location_jpn = entry.anm
 
         return location_en, location_jpn
 
     def _get_magnitude(self, entry):
-        if entry["mag"] == "":
+        if entry.mag == "":
             return None
 
-        magnitude = float(entry["mag"])
+        magnitude = float(entry.mag)
 
         if magnitude == "":
             return None
@@ -87,44 +85,51 @@ class JMAScraper(DataScraper):
         return magnitude
 
     def _get_max_seismic_intensity(self, entry):
-        if entry["maxi"] == "":
+        """
+        Returns the position of the intensity on JMA's 10-level scale (see
+        JMA_INTENSITY_LEVELS), since levels such as "5-" aren't numbers.
+        """
+        if entry.maxi == "":
             return None
 
-        max_seismic_intensity = int(entry["maxi"])
+        if entry.maxi not in JMA_INTENSITY_LEVELS:
+            raise InvalidIntensityFormat(entry.maxi, JMA_INTENSITY_LEVELS)
+
+        max_seismic_intensity = JMA_INTENSITY_LEVELS.index(entry.maxi)
 
         return max_seismic_intensity
 
     def _get_coordinates(self, entry):
         pattern = r'([+-]\d+\.\d+)([+-]\d+\.\d+)'
-        match = re.match(pattern, entry["cod"])
+        match = re.match(pattern, entry.cod)
 
         if match:
             latitude = float(match.group(1))
             longitude = float(match.group(2))
 
             return latitude, longitude
-        elif entry["cod"] == "":
+        elif entry.cod == "":
             return None, None
         else:
-            raise InvalidCoordinatesFormat(entry["cod"], pattern)
+            raise InvalidCoordinatesFormat(entry.cod, pattern)
 
     def _get_depth(self, entry):
         pattern = r'(?:[+-]\d+\.\d+)(?:[+-]\d+\.\d+)([-+]\d+)'
-        match = re.match(pattern, entry["cod"])
+        match = re.match(pattern, entry.cod)
 
         if match:
             depth = int(match.group(1))
             depth = int(abs(depth) / 1000)
 
             return depth
-        elif entry["cod"] == "":
+        elif entry.cod == "":
             return None
         else:
-            raise InvalidDepthFormat(entry["cod"], pattern)
+            raise InvalidDepthFormat(entry.cod, pattern)
 
     def _get_event_details_url(self, entry):
         BASE_URL = "https://www.data.jma.go.jp/multi/quake/quake_detail.html?eventID="
-        event_id = entry["ctt"]
+        event_id = entry.ctt
 
         return BASE_URL + event_id
 
@@ -143,8 +148,8 @@ class JMAScraper(DataScraper):
         if len(self.eq_list) == 0:
             return False
 
-        entry_to_be_appended = data['date']['observed_date']
-        last_appended_entry = self.eq_list[-1]['date']['observed_date']
+        entry_to_be_appended = data['date']
+        last_appended_entry = self.eq_list[-1]['date']
 
         if entry_to_be_appended == last_appended_entry:
             return True
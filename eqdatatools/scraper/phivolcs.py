@@ -1,36 +1,90 @@
 import re
-import requests
 from bs4 import BeautifulSoup
+from eqdatatools import profiling
 from eqdatatools.constants import (
-    PHIVOLCS_CA_CERT_PATH,
     DATE_REGEX_PATTERN,
-    NON_PRINTABLE_CHAR_PATTERN
+    MONTH_ABBREVIATIONS,
+    NON_PRINTABLE_CHAR_PATTERN,
+    RAW_MONTH_YEAR_PATTERN,
+    TIMEZONES
 )
-from eqdatatools.scraper._utils import convert_to_datetime_obj
+from eqdatatools.exceptions import DataTableNotFoundError
+from eqdatatools.schema import create_event
+from eqdatatools.scraper._fetcher import fetch
+from eqdatatools.scraper._utils import convert_to_datetime_obj, decompose_webpage
 from ._base import DataScraper
 
 
 class PHIVOLCSScraper(DataScraper):
+    _RAW_MONTH_YEAR_REGEX = re.compile(RAW_MONTH_YEAR_PATTERN["PHIVOLCS"])
+
     def _scrape_data(self, url, start_date):
         source_data = self._get_source_data(url)
+        self._has_reached_start_date = False
+        start_month = self._get_start_month(start_date)
+        has_eq_rows = False
+
+        with profiling.stage("extract"):
+            try:
+                for entry in source_data:
+                    raw_month = self._get_raw_month(entry)
+
+                    # Rows without a date are not earthquake entries
+                    if raw_month is None:
+                        continue
+
+                    has_eq_rows = True
+
+                    # Entries are ordered from newest to oldest, so every
+                    # row after one that is before the start date can be
+                    # skipped as well
+                    if start_month and raw_month < start_month:
+                        break
+
+                    extracted_data = self._extract_data(entry, start_date)
+
+                    if extracted_data:
+                        self.eq_list.append(extracted_data)
+                    elif self._has_reached_start_date:
+                        break
+
+                # A table without any earthquake rows is a different table on
+                # a page with another layout, unlike a table whose rows are
+                # all before the start date
+                if not has_eq_rows:
+                    raise DataTableNotFoundError(url)
+            finally:
+                self._release_webpage()
 
-        if not source_data:
-            return None
+    def _get_source_data(self, url):
+        with profiling.stage("fetch"):
+            response = fetch(url)
 
-        for entry in source_data:
-            extracted_data = self._extract_data(entry, start_date)
+        with profiling.stage("parse"):
+            webpage = BeautifulSoup(response.text, 'html.parser')
 
-            if extracted_data:
-                self.eq_list.append(extracted_data)
+            try:
+                source_data = self._get_eq_data_table(webpage)
+            except IndexError:
+                decompose_webpage(webpage)
+                raise DataTableNotFoundError(url)
 
-    def _get_source_data(self, url):
-        webpage = requests.get(url, verify=PHIVOLCS_CA_CERT_PATH)
-        webpage = BeautifulSoup(webpage.text, 'html.parser')
-
-        source_data = self._get_eq_data_table(webpage)
+            self._webpage = webpage
 
         return source_data
 
+    def _release_webpage(self):
+        """
+        Frees the parsed webpage once all rows have been extracted. The tree
+        has reference cycles between parent and child elements, so without
+        this it would stay in memory until the garbage collector runs.
+        """
+        webpage = getattr(self, "_webpage", None)
+
+        if webpage is not None:
+            decompose_webpage(webpage)
+            self._webpage = None
+
     def _get_eq_data_table(self, webpage):
         eq_data_table = webpage.find_all("table")[2]("tr")[1:]
         return eq_data_table
@@ -43,6 +97,7 @@ class PHIVOLCSScraper(DataScraper):
 
         if start_date:
             if self._is_date_before_start_date(eq_date, start_date):
+                self._has_reached_start_date = True
                 return None
 
         # Get all other necessary eq details
@@ -53,22 +108,57 @@ class PHIVOLCSScraper(DataScraper):
         eq_event_details_url = self._get_event_details_url(entry)
         eq_graphic_url = self._get_graphic_url(entry)
 
-        # Organize data into a dictionary object and return the object
-        eq_entry_details = {
-            "date": eq_date,
-            "location": eq_location,
-            "magnitude": eq_magnitude,
-            "coordinates": {
-                "latitude": eq_latitude,
-                "longitude": eq_longitude
-            },
-            "depth": eq_depth,
-            "event_details_url": eq_event_details_url,
-            "graphic_url": eq_graphic_url,
-        }
+        # Organize data into a normalized event and return it
+        eq_entry_details = create_event(
+            source="PHIVOLCS",
+            date=eq_date,
+            location=eq_location,
+            magnitude=eq_magnitude,
+            latitude=eq_latitude,
+            longitude=eq_longitude,
+            depth=eq_depth,
+            event_details_url=eq_event_details_url,
+            graphic_url=eq_graphic_url
+        )
 
         return eq_entry_details 
 
+    def _get_raw_month(self, entry):
+        """
+        Returns the (year, month) of the entry using only a regex search on
+        the raw text of its date cell. This is much cheaper than fully parsing
+        the date, so rows can be rejected before any other processing.
+        Returns None if the row has no date.
+        """
+        date_cell = entry.find("td")
+
+        if date_cell is None:
+            return None
+
+        match = self._RAW_MONTH_YEAR_REGEX.search(date_cell.text)
+
+        if not match:
+            return None
+
+        month = MONTH_ABBREVIATIONS.get(match.group(1).lower())
+
+        if month is None:
+            return None
+
+        return int(match.group(2)), month
+
+    def _get_start_month(self, start_date):
+        """
+        Returns the (year, month) of the start date in PHIVOLCS' timezone, to
+        be compared with the (year, month) of the rows.
+        """
+        if not start_date:
+            return None
+
+        start_date = start_date.astimezone(TIMEZONES["PHIVOLCS"])
+
+        return start_date.year, start_date.month
+
     def _get_date(self, entry):
         """
         Extracts the date from the entry and removes extra spaces around words,
@@ -175,16 +265,17 @@ def scrape_data(URL: str, start_date: str):
     for old pages since the main scraper doesn't work on them due to different HTML element
     structure of eq data. 
 
-    This function basically uses the main scraper to scrape data. If it doesn't work, it will
-    use another scraper. If scraping works, eq_list must contain all the data that are scraped,
-    thus returning the eq_list data 
+    This function basically uses the main scraper to scrape data. If the earthquake table
+    isn't found on the page, it will use another scraper. If the table is found, eq_list
+    contains all the data that are scraped (or none if every entry is before the start
+    date), thus returning the eq_list data
     """
     scrapers = [PHIVOLCSScraper, PHIVOLCSScraperAlt2, PHIVOLCSScraperAlt3]
 
     for scraper in scrapers:
-        eq_list = scraper(URL, start_date)
-
-        if eq_list:
-            break
+        try:
+            return scraper(URL, start_date)
+        except DataTableNotFoundError:
+            continue
 
-    return eq_list
+    return []
@@ -0,0 +1,193 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from bs4 import BeautifulSoup
+from eqdatatools.constants import ENRICHMENT_CACHE_DIR, ENRICHMENT_MAX_WORKERS, ENRICHMENT_RATE_LIMIT
+from eqdatatools.schema import EarthquakeEvent
+from eqdatatools.scraper._cache import ContentCache
+from eqdatatools.scraper._fetcher import Fetcher
+from eqdatatools.scraper._utils import decompose_webpage
+
+
+class PHIVOLCSEventEnricher:
+    """
+    Downloads the event details page and graphic of each PHIVOLCS entry
+    concurrently, with at most `max_workers` downloads at a time. Files that
+    are already in the cache are not downloaded again.
+
+    The details page is parsed into entry["details"], a dict of the fields
+    listed on the page (e.g. "origin", "reported_intensities",
+    "expecting_damage"), and entry["graphic_path"] is set to the cached
+    graphic. Entries whose files can't be fetched, cached or parsed are left
+    unchanged and counted as failed.
+
+    Unless a fetcher is given, downloads use their own fetcher limited to
+    `rate_limit` requests per second (with bursts of up to `max_workers`),
+    rather than the scrapers' shared fetcher whose lower limit would keep
+    most workers waiting.
+    """
+
+    def __init__(self,
+                 cache_dir: str = ENRICHMENT_CACHE_DIR,
+                 max_workers: int = ENRICHMENT_MAX_WORKERS,
+                 fetch_graphics: bool = True,
+                 fetcher: Optional[Fetcher] = None,
+                 on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 rate_limit: Optional[float] = ENRICHMENT_RATE_LIMIT
+                 ) -> None:
+        self.cache = ContentCache(cache_dir)
+        self.max_workers = max_workers
+        self.fetch_graphics = fetch_graphics
+        self.fetcher = fetcher or Fetcher(rate_limit=rate_limit, rate_burst=max_workers)
+        self.on_progress = on_progress
+        self._lock = threading.Lock()
+        self._metrics = self._get_initial_metrics(0)
+
+    def enrich(self, eq_list: List[EarthquakeEvent]) -> Dict[str, Any]:
+        """Enriches the entries in place and returns the final metrics."""
+        tasks = []
+
+        for entry in eq_list:
+            if entry["event_details_url"]:
+                tasks.append((self._enrich_details, entry))
+            if self.fetch_graphics and entry["graphic_url"]:
+                tasks.append((self._enrich_graphic, entry))
+
+        self._metrics = self._get_initial_metrics(len(tasks))
+        started_at = time.monotonic()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for _ in executor.map(lambda task: self._run_task(*task, started_at), tasks):
+                    pass
+        finally:
+            self.cache.save_index()
+
+        return self.get_metrics()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._metrics)
+
+    def _run_task(self, task: Callable[[EarthquakeEvent], int], entry: EarthquakeEvent, started_at: float) -> None:
+        try:
+            fetched_bytes = task(entry)
+        except Exception:
+            # Fetch, cache write (OSError) and parsing errors only fail this
+            # entry, and the remaining ones are still enriched
+            self._update_metrics(started_at, failed=1)
+        else:
+            if fetched_bytes is None:
+                self._update_metrics(started_at, cached=1)
+            else:
+                self._update_metrics(started_at, fetched=1, bytes_fetched=fetched_bytes)
+
+    def _enrich_details(self, entry: EarthquakeEvent) -> Optional[int]:
+        content, fetched_bytes = self._get_content(entry["event_details_url"])
+        entry["details"] = parse_event_details(content)
+
+        return fetched_bytes
+
+    def _enrich_graphic(self, entry: EarthquakeEvent) -> Optional[int]:
+        url = entry["graphic_url"]
+        path = self.cache.get_path(url)
+        fetched_bytes = None
+
+        if path is None:
+            content = self.fetcher.get(url).content
+            path = self.cache.put(url, content)
+            fetched_bytes = len(content)
+
+        entry["graphic_path"] = path
+
+        return fetched_bytes
+
+    def _get_content(self, url: str) -> tuple:
+        """
+        Returns the content of the URL and the number of bytes downloaded,
+        which is None when the content came from the cache.
+        """
+        content = self.cache.get(url)
+
+        if content is not None:
+            return content, None
+
+        content = self.fetcher.get(url).content
+        self.cache.put(url, content)
+
+        return content, len(content)
+
+    def _update_metrics(self, started_at: float, **increments: int) -> None:
+        with self._lock:
+            for name, amount in increments.items():
+                self._metrics[name] += amount
+
+            self._metrics["completed"] += 1
+            self._metrics["elapsed_seconds"] = time.monotonic() - started_at
+
+            if self._metrics["elapsed_seconds"] > 0:
+                self._metrics["tasks_per_second"] = self._metrics["completed"] / self._metrics["elapsed_seconds"]
+                self._metrics["bytes_per_second"] = self._metrics["bytes_fetched"] / self._metrics["elapsed_seconds"]
+
+            metrics = dict(self._metrics)
+
+        if self.on_progress:
+            self.on_progress(metrics)
+
+    def _get_initial_metrics(self, total: int) -> Dict[str, Any]:
+        return {
+            "total": total,
+            "completed": 0,
+            "fetched": 0,
+            "cached": 0,
+            "failed": 0,
+            "bytes_fetched": 0,
+            "elapsed_seconds": 0.0,
+            "tasks_per_second": 0.0,
+            "bytes_per_second": 0.0,
+        }
+
+
+def parse_event_details(content: bytes) -> Dict[str, str]:
+    """
+    Parses a PHIVOLCS event details page. The page lists the details as
+    table rows with the label in the first cell and the value in the last,
+    e.g. "Reported Intensities" and "Intensity IV - Tagbilaran City". Labels
+    are converted to snake_case keys.
+    """
+    webpage = BeautifulSoup(content, "html.parser")
+    details = {}
+
+    try:
+        for row in webpage.find_all("tr"):
+            cells = row.find_all("td", recursive=False)
+
+            # Rows that wrap a nested table are only used for the layout
+            if len(cells) < 2 or row.find("table"):
+                continue
+
+            label = _clean_text(cells[0].get_text(" "))
+            value = _clean_text(cells[-1].get_text(" "))
+            key = re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+
+            if key and value and key not in details:
+                details[key] = value
+    finally:
+        decompose_webpage(webpage)
+
+    return details
+
+
+def _clean_text(text: str) -> str:
+    text = re.sub(r"Â+", "", text)
+    text = re.sub(r"\s+", " ", text)
+
+    return text.strip(" :")
+
+
+def enrich_data(eq_list: List[EarthquakeEvent], **kwargs: Any) -> Dict[str, Any]:
+    enricher = PHIVOLCSEventEnricher(**kwargs)
+
+    return enricher.enrich(eq_list)
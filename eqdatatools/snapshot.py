@@ -0,0 +1,73 @@
+import json
+import struct
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+from eqdatatools.exceptions import InvalidSnapshotError
+from eqdatatools.schema import EarthquakeEvent
+
+# A snapshot file is the magic bytes, followed by the format version as a
+# big-endian unsigned short, followed by the zlib-compressed JSON payload.
+SNAPSHOT_MAGIC = b"EQDTSNAP"
+# Version 2 stores JMA intensities as positions on the 10-level scale
+SNAPSHOT_VERSION = 2
+_HEADER = struct.Struct(f">{len(SNAPSHOT_MAGIC)}sH")
+
+# Snapshots saved with different entry fields are rejected, since the stats
+# and display code would fail on them
+SNAPSHOT_SCHEMA = sorted(EarthquakeEvent.__annotations__)
+
+_DATETIME_KEY = "$datetime"
+
+
+def save_snapshot(path: str, source: str, eq_list: List[EarthquakeEvent], eq_stats: Dict[str, Any]) -> None:
+    payload = {
+        "source": source,
+        "schema": SNAPSHOT_SCHEMA,
+        "eq_list": eq_list,
+        "eq_stats": eq_stats,
+    }
+    encoded_payload = json.dumps(payload, default=_encode_value, ensure_ascii=False, separators=(",", ":"))
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION))
+        file.write(zlib.compress(encoded_payload.encode("utf-8")))
+
+
+def load_snapshot(path: str) -> Tuple[str, List[EarthquakeEvent], Dict[str, Any]]:
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < _HEADER.size:
+        raise InvalidSnapshotError(path, "file is too short")
+
+    magic, version = _HEADER.unpack_from(data)
+
+    if magic != SNAPSHOT_MAGIC:
+        raise InvalidSnapshotError(path, "not a snapshot file")
+    if version != SNAPSHOT_VERSION:
+        raise InvalidSnapshotError(path, f"version {version} is not supported (expected {SNAPSHOT_VERSION})")
+
+    try:
+        payload = json.loads(zlib.decompress(data[_HEADER.size:]), object_hook=_decode_value)
+    except (zlib.error, ValueError) as e:
+        raise InvalidSnapshotError(path, f"corrupted payload ({e})")
+
+    if payload.get("schema") != SNAPSHOT_SCHEMA:
+        raise InvalidSnapshotError(path, "entries were saved with a different schema")
+
+    return payload["source"], payload["eq_list"], payload["eq_stats"]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {_DATETIME_KEY: value.isoformat()}
+
+    raise TypeError(f"Object of type {type(value).__name__} can't be saved in a snapshot")
+
+
+def _decode_value(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1 and _DATETIME_KEY in obj:
+        return datetime.fromisoformat(obj[_DATETIME_KEY])
+
+    return obj
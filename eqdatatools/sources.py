@@ -0,0 +1,168 @@
+import re
+import threading
+from datetime import timezone
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+from urllib.parse import urlsplit
+from eqdatatools.constants import VALID_DATE_FORMATS, TIMEZONES
+from eqdatatools.exceptions import InvalidURLError, DuplicateSourceError
+
+# Third-party packages can add sources by exposing a Source object under
+# this entry point group, e.g. in pyproject.toml:
+#
+#   [tool.poetry.plugins."eqdatatools.sources"]
+#   usgs = "eqdatatools_usgs:USGS_SOURCE"
+ENTRY_POINT_GROUP = "eqdatatools.sources"
+
+
+class Source:
+    """
+    Describes an earthquake data source. A source only has to provide:
+
+    - the URLs that belong to it (hosts and url_patterns)
+    - a scraper, a function taking (url, start_date) that fetches and parses
+      the source's data into a list of schema.EarthquakeEvent entries
+    - optionally, a region_key function returning the region of an entry
+      (used by top-k and approximate stats, defaults to the location)
+    - optionally, a display_class (a DisplayEQData subclass), the
+      date_formats of its date strings, and its tzinfo: the timezone its
+      dates are displayed in, and that date strings without a UTC offset
+      are in (UTC by default)
+
+    Stats, aggregation, top-k queries and snapshots work the same for every
+    source. An earthquake_list_class (a BaseEarthquakeList subclass whose
+    SOURCE is the source's name) is only needed to add source-specific
+    methods, and one is created otherwise.
+    """
+
+    def __init__(self,
+                 name: str,
+                 hosts: Sequence[str],
+                 url_patterns: Sequence[str],
+                 scraper: Callable[[str, Optional[str]], List[Dict[str, Any]]],
+                 region_key: Optional[Callable[[Dict[str, Any]], Hashable]] = None,
+                 display_class: Any = None,
+                 date_formats: Optional[List[str]] = None,
+                 tzinfo: timezone = timezone.utc,
+                 earthquake_list_class: Any = None
+                 ) -> None:
+        self.name = name
+        self.hosts = tuple(host.lower() for host in hosts)
+        self.url_patterns = tuple(url_patterns)
+        self.scraper = scraper
+        self.region_key = region_key
+        self.display_class = display_class
+        self.date_formats = date_formats
+        self.tzinfo = tzinfo
+        self.earthquake_list_class = earthquake_list_class
+        self._url_regex = re.compile("|".join(f"(?:{pattern})" for pattern in url_patterns))
+
+    def matches(self, url: str) -> bool:
+        return self._url_regex.match(url) is not None
+
+
+class SourceRegistry:
+    """
+    Keeps the registered sources, indexed by host. Looking up the source of
+    a URL only checks the patterns of the sources registered for its host,
+    so the cost doesn't grow with the number of sources.
+    """
+
+    def __init__(self) -> None:
+        self._sources: Dict[str, Source] = {}
+        self._sources_by_host: Dict[str, List[Source]] = {}
+        self._entry_points_loaded = False
+        self._loading_entry_points = False
+        self._lock = threading.Lock()
+        self._entry_points_lock = threading.RLock()
+
+    def register(self, source: Source) -> None:
+        with self._lock:
+            if source.name in self._sources:
+                raise DuplicateSourceError(source.name)
+
+            self._sources[source.name] = source
+
+            for host in source.hosts:
+                self._sources_by_host.setdefault(host, []).append(source)
+
+    def get_source(self, name: str) -> Source:
+        self._load_entry_points()
+
+        return self._sources[name]
+
+    def get_source_names(self) -> List[str]:
+        self._load_entry_points()
+
+        return list(self._sources)
+
+    def get_date_formats(self, name: str) -> List[str]:
+        source = self._sources.get(name)
+
+        if source and source.date_formats:
+            return source.date_formats
+
+        return VALID_DATE_FORMATS.get(name, VALID_DATE_FORMATS["DEFAULT"])
+
+    def get_timezone(self, name: str) -> timezone:
+        source = self._sources.get(name)
+
+        if source:
+            return source.tzinfo
+
+        return TIMEZONES.get(name, timezone.utc)
+
+    def get_source_for_url(self, url: str) -> Source:
+        self._load_entry_points()
+
+        host = urlsplit(url).netloc.lower()
+
+        for source in self._sources_by_host.get(host, ()):
+            if source.matches(url):
+                return source
+
+        raise InvalidURLError(url)
+
+    def _load_entry_points(self) -> None:
+        """
+        Registers the sources of installed plugins on first use. The loaded
+        flag is only set once every plugin is registered, so other threads
+        wait here instead of looking up a source that isn't registered yet.
+        """
+        if self._entry_points_loaded:
+            return
+
+        with self._entry_points_lock:
+            # A plugin that looks up sources while being imported gets here
+            # again from the same thread, and only sees the sources so far
+            if self._entry_points_loaded or self._loading_entry_points:
+                return
+
+            self._loading_entry_points = True
+
+            try:
+                for entry_point in self._get_entry_points():
+                    source = entry_point.load()
+
+                    if source.name not in self._sources:
+                        self.register(source)
+
+                self._entry_points_loaded = True
+            finally:
+                self._loading_entry_points = False
+
+    def _get_entry_points(self) -> list:
+        all_entry_points = entry_points()
+
+        # entry_points() only supports selecting by group from Python 3.10
+        if hasattr(all_entry_points, "select"):
+            return list(all_entry_points.select(group=ENTRY_POINT_GROUP))
+
+        return list(all_entry_points.get(ENTRY_POINT_GROUP, []))
+
+
+registry = SourceRegistry()
+
+
+def register_source(source: Source) -> None:
+    registry.register(source)
@@ -0,0 +1,238 @@
+import bisect
+import pickle
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+from eqdatatools.data_processor.stats import ApproximateStats
+from eqdatatools.data_processor.stats._approximate import CountMinSketch, HyperLogLog, ReservoirSample, TDigest
+from eqdatatools.schema import create_event
+
+TRIALS = 20
+
+
+def create_test_events(count, offset=0):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    return [
+        create_event(
+            source="PHIVOLCS",
+            date=start + timedelta(minutes=offset + index),
+            location=f"Region {(offset + index) % 7}",
+            magnitude=1 + (offset + index) % 60 / 10,
+            latitude=12.0,
+            longitude=121.0,
+            depth=(offset + index) % 300
+        )
+        for index in range(count)
+    ]
+
+
+def create_hyperloglog(count, trial=0):
+    sketch = HyperLogLog()
+
+    for index in range(count):
+        sketch.add(f"{trial}|event-{index}")
+
+    return sketch
+
+
+def get_rank(sorted_values, value):
+    return bisect.bisect_right(sorted_values, value) / len(sorted_values)
+
+
+def round_trip(sketch):
+    return pickle.loads(pickle.dumps(sketch))
+
+
+class HyperLogLogTest(unittest.TestCase):
+    def test_error_bounds_cover_the_true_count(self) -> None:
+        for count in (1000, 10240, 20000):
+            with self.subTest(count=count):
+                covered = 0
+
+                for trial in range(TRIALS):
+                    error_bounds = create_hyperloglog(count, trial).get_error_bounds()
+                    covered += error_bounds["lower_bound"] <= count <= error_bounds["upper_bound"]
+
+                self.assertGreaterEqual(covered / TRIALS, 0.9)
+
+    def test_estimates_are_unbiased_around_the_linear_counting_range(self) -> None:
+        # 2.5 times the register count, where a switch from linear counting
+        # to the raw estimate would be biased by about 3%
+        count = 10240
+        mean_estimate = sum(create_hyperloglog(count, trial).estimate() for trial in range(TRIALS)) / TRIALS
+
+        self.assertAlmostEqual(mean_estimate / count, 1, delta=0.01)
+
+    def test_small_counts_are_nearly_exact(self) -> None:
+        self.assertEqual(HyperLogLog().estimate(), 0)
+        self.assertEqual(create_hyperloglog(10).estimate(), 10)
+
+    def test_merge_after_pickling_matches_a_single_sketch(self) -> None:
+        first_sketch, second_sketch = HyperLogLog(), HyperLogLog()
+
+        for index in range(6000):
+            (first_sketch if index % 2 else second_sketch).add(f"0|event-{index}")
+            # Keys seen by both workers are only counted once
+            if index < 1000:
+                second_sketch.add(f"0|event-{index}")
+
+        merged_sketch = round_trip(first_sketch)
+        merged_sketch.merge(round_trip(second_sketch))
+
+        self.assertEqual(merged_sketch.estimate(), create_hyperloglog(6000).estimate())
+
+    def test_sketches_with_other_precisions_are_not_merged(self) -> None:
+        with self.assertRaises(ValueError):
+            HyperLogLog(12).merge(HyperLogLog(10))
+
+
+class CountMinSketchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.counts = {f"region-{index}": index % 50 + 1 for index in range(3000)}
+        self.sketch = CountMinSketch(width=512, depth=4, top_capacity=5)
+
+        for key, count in self.counts.items():
+            self.sketch.add(key, count)
+
+    def test_estimates_are_within_the_error_bounds(self) -> None:
+        max_overestimate = self.sketch.get_error_bounds()["max_overestimate"]
+        overestimates = [self.sketch.estimate(key) - count for key, count in self.counts.items()]
+
+        self.assertGreaterEqual(min(overestimates), 0)
+        self.assertLessEqual(sum(overestimate > max_overestimate for overestimate in overestimates) / len(overestimates), 0.05)
+
+    def test_top_keys_have_the_highest_estimates(self) -> None:
+        sketch = CountMinSketch(top_capacity=2)
+
+        for key, count in [("Bohol", 5), ("Cebu", 1), ("Davao", 8), ("Leyte", 2)]:
+            sketch.add(key, count)
+
+        self.assertEqual(sketch.get_top(), [("Davao", 8), ("Bohol", 5)])
+
+    def test_merge_after_pickling_matches_a_single_sketch(self) -> None:
+        first_sketch = CountMinSketch(width=512, depth=4, top_capacity=5)
+        second_sketch = CountMinSketch(width=512, depth=4, top_capacity=5)
+
+        for index, (key, count) in enumerate(self.counts.items()):
+            (first_sketch if index % 2 else second_sketch).add(key, count)
+
+        merged_sketch = round_trip(first_sketch)
+        merged_sketch.merge(round_trip(second_sketch))
+
+        self.assertEqual(merged_sketch.total, self.sketch.total)
+        self.assertEqual([merged_sketch.estimate(key) for key in self.counts], [self.sketch.estimate(key) for key in self.counts])
+
+    def test_sketches_with_other_sizes_are_not_merged(self) -> None:
+        with self.assertRaises(ValueError):
+            self.sketch.merge(CountMinSketch(width=256, depth=4))
+
+
+class TDigestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        generator = random.Random(42)
+        self.values = [generator.lognormvariate(0, 1) for _ in range(50000)]
+        self.sorted_values = sorted(self.values)
+
+    def assert_quantiles_are_accurate(self, digest) -> None:
+        for q, max_rank_error in [(0.01, 0.002), (0.1, 0.01), (0.5, 0.01), (0.9, 0.01), (0.99, 0.002), (0.999, 0.001)]:
+            with self.subTest(q=q):
+                self.assertAlmostEqual(get_rank(self.sorted_values, digest.quantile(q)), q, delta=max_rank_error)
+
+    def test_quantiles_are_accurate(self) -> None:
+        digest = TDigest()
+
+        for value in self.values:
+            digest.add(value)
+
+        self.assert_quantiles_are_accurate(digest)
+        self.assertEqual((digest.quantile(0), digest.quantile(1)), (self.sorted_values[0], self.sorted_values[-1]))
+        self.assertLessEqual(digest.get_centroid_count(), digest.compression)
+
+    def test_merged_digests_after_pickling_are_accurate(self) -> None:
+        digests = [TDigest() for _ in range(4)]
+
+        for index, value in enumerate(self.values):
+            digests[index % 4].add(value)
+
+        merged_digest = TDigest()
+
+        for digest in digests:
+            merged_digest.merge(round_trip(digest))
+
+        self.assertEqual(merged_digest.count, len(self.values))
+        self.assert_quantiles_are_accurate(merged_digest)
+
+    def test_reported_rank_error_covers_the_actual_error(self) -> None:
+        digest = TDigest()
+
+        for value in self.values:
+            digest.add(value)
+
+        for q in (0.5, 0.9, 0.99):
+            with self.subTest(q=q):
+                actual_error = abs(get_rank(self.sorted_values, digest.quantile(q)) - q)
+                self.assertLessEqual(actual_error, digest.get_rank_error(q) + 1 / len(self.values))
+
+    def test_empty_digest_and_invalid_quantiles(self) -> None:
+        self.assertIsNone(TDigest().quantile(0.5))
+
+        with self.assertRaises(ValueError):
+            TDigest().quantile(1.5)
+
+
+class ReservoirSampleTest(unittest.TestCase):
+    def test_sample_size_is_bounded(self) -> None:
+        sample = ReservoirSample(size=100, seed=1)
+
+        for index in range(10000):
+            sample.add(index)
+
+        self.assertEqual(len(sample.get_sample()), 100)
+        self.assertEqual(sample.get_sampling_rate(), 0.01)
+
+    def test_merged_sample_is_proportional_to_each_stream(self) -> None:
+        first_sample, second_sample = ReservoirSample(size=1000, seed=1), ReservoirSample(size=1000, seed=2)
+
+        for index in range(9000):
+            first_sample.add(("first", index))
+        for index in range(1000):
+            second_sample.add(("second", index))
+
+        merged_sample = round_trip(first_sample)
+        merged_sample.merge(round_trip(second_sample))
+        items = merged_sample.get_sample()
+
+        self.assertEqual((len(items), merged_sample.seen), (1000, 10000))
+        self.assertEqual(len(set(items)), 1000)
+        self.assertAlmostEqual(sum(stream == "second" for stream, _ in items) / len(items), 0.1, delta=0.03)
+
+
+class ApproximateStatsTest(unittest.TestCase):
+    def test_merge_after_pickling_matches_stats_of_the_whole_list(self) -> None:
+        eq_list = create_test_events(4000)
+        first_stats = ApproximateStats(eq_list[:2500], seed=1)
+        # Entries in both lists are only counted once as distinct events
+        second_stats = ApproximateStats(eq_list[2000:], seed=2)
+
+        merged_stats = round_trip(first_stats)
+        merged_stats.merge(round_trip(second_stats))
+        expected_stats = ApproximateStats(eq_list, seed=1)
+
+        self.assertEqual(merged_stats.total, 4500)
+        self.assertEqual(merged_stats.get_stats()["recorded_eqs"]["distinct"], expected_stats.get_stats()["recorded_eqs"]["distinct"])
+        self.assertEqual(merged_stats.get_region_count("Region 0"), ApproximateStats(eq_list[:2500] + eq_list[2000:]).get_region_count("Region 0"))
+        self.assertEqual(merged_stats.start_date, eq_list[0]["date"])
+        self.assertEqual(merged_stats.end_date, eq_list[-1]["date"])
+
+    def test_regions_use_the_region_key(self) -> None:
+        approximate_stats = ApproximateStats(create_test_events(700), region_key=lambda entry: entry["location"].upper())
+
+        top_regions = approximate_stats.get_stats()["regions"]["top"]
+
+        self.assertEqual(approximate_stats.get_region_count("REGION 3"), 100)
+        self.assertEqual({region["region"] for region in top_regions}, {f"REGION {index}" for index in range(7)})
+
+
+if __name__ == "__main__":
+    unittest.main()
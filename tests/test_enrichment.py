@@ -0,0 +1,165 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from eqdatatools.scraper._cache import ContentCache
+from eqdatatools.scraper._fetcher import Fetcher
+from eqdatatools.scraper.phivolcs_enrichment import PHIVOLCSEventEnricher, parse_event_details
+from eqdatatools.schema import create_event
+
+DETAILS_PAGE = (
+    "<html><table><tr><td><table>"
+    "<tr><td>Origin :</td><td>Tectonic</td></tr>"
+    "<tr><td>Reported Intensities</td><td>Intensity IV - Tagbilaran City</td></tr>"
+    "<tr><td>Expecting Damage</td><td>NO</td></tr>"
+    "</table></td></tr></table></html>"
+).encode("utf-8")
+GRAPHIC = b"\xff\xd8\xff\xe0 graphic"
+
+
+class StubServer:
+    """Local HTTP server that serves the given pages and records each request."""
+
+    def __init__(self, pages) -> None:
+        self.pages = pages
+        self.requests = []
+        stub = self
+
+        class StubHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests.append(self.path)
+                body = stub.pages.get(self.path)
+
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def create_test_event(details_url, graphic_url=None):
+    return create_event(
+        source="PHIVOLCS",
+        date=datetime(2024, 8, 1, tzinfo=timezone.utc),
+        location="010 km N of Town (Bohol)",
+        magnitude=4.2,
+        latitude=12.1,
+        longitude=121.5,
+        depth=10,
+        event_details_url=details_url,
+        graphic_url=graphic_url
+    )
+
+
+class ParseEventDetailsTest(unittest.TestCase):
+    def test_labels_are_converted_to_keys(self) -> None:
+        details = parse_event_details(DETAILS_PAGE)
+
+        self.assertEqual(details, {
+            "origin": "Tectonic",
+            "reported_intensities": "Intensity IV - Tagbilaran City",
+            "expecting_damage": "NO",
+        })
+
+    def test_whitespace_and_empty_values_are_dropped(self) -> None:
+        page = b"<table><tr><td>Depth of Focus (Km) :</td><td>\n  010 </td></tr><tr><td>Remarks</td><td> </td></tr></table>"
+
+        self.assertEqual(parse_event_details(page), {"depth_of_focus_km": "010"})
+
+
+class PHIVOLCSEventEnricherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer({"/event.html": DETAILS_PAGE, "/event.jpg": GRAPHIC})
+        self.addCleanup(self.server.close)
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def create_enricher(self) -> PHIVOLCSEventEnricher:
+        return PHIVOLCSEventEnricher(cache_dir=self.cache_dir, max_workers=2, fetcher=Fetcher(max_retries=0, rate_limit=None))
+
+    def test_details_and_graphics_are_fetched_then_cached(self) -> None:
+        entry = create_test_event(f"{self.server.url}/event.html", f"{self.server.url}/event.jpg")
+
+        metrics = self.create_enricher().enrich([entry])
+        cached_metrics = self.create_enricher().enrich([entry])
+
+        self.assertEqual(entry["details"]["origin"], "Tectonic")
+        with open(entry["graphic_path"], "rb") as file:
+            self.assertEqual(file.read(), GRAPHIC)
+        self.assertEqual((metrics["fetched"], metrics["bytes_fetched"]), (2, len(DETAILS_PAGE) + len(GRAPHIC)))
+        self.assertEqual((cached_metrics["cached"], cached_metrics["fetched"]), (2, 0))
+        self.assertEqual(sorted(self.server.requests), ["/event.html", "/event.jpg"])
+
+    def test_failed_downloads_leave_the_entry_unchanged(self) -> None:
+        entries = [create_test_event(f"{self.server.url}/missing.html"), create_test_event(f"{self.server.url}/event.html")]
+
+        metrics = self.create_enricher().enrich(entries)
+
+        self.assertIsNone(entries[0]["details"])
+        self.assertEqual(entries[1]["details"]["expecting_damage"], "NO")
+        self.assertEqual((metrics["failed"], metrics["fetched"], metrics["completed"]), (1, 1, 2))
+
+    def test_modified_cache_files_are_downloaded_again(self) -> None:
+        entry = create_test_event(f"{self.server.url}/event.html")
+        self.create_enricher().enrich([entry])
+        path = ContentCache(self.cache_dir).put("unused", DETAILS_PAGE)
+
+        with open(path, "wb") as file:
+            file.write(b"<table><tr><td>Origin</td><td>Replaced</td></tr></table>")
+
+        metrics = self.create_enricher().enrich([entry])
+
+        self.assertEqual(entry["details"]["origin"], "Tectonic")
+        self.assertEqual(metrics["fetched"], 1)
+        self.assertEqual(self.server.requests, ["/event.html", "/event.html"])
+
+
+class ContentCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.cache = ContentCache(self.cache_dir)
+
+    def test_index_is_saved_and_identical_content_is_stored_once(self) -> None:
+        first_path = self.cache.put("https://example.com/a", b"content")
+        second_path = self.cache.put("https://example.com/b", b"content")
+        self.cache.save_index()
+
+        reloaded_cache = ContentCache(self.cache_dir)
+
+        self.assertEqual(first_path, second_path)
+        self.assertEqual(reloaded_cache.get("https://example.com/b"), b"content")
+        self.assertIsNone(reloaded_cache.get("https://example.com/c"))
+
+    def test_files_that_do_not_match_their_hash_are_misses(self) -> None:
+        path = self.cache.put("https://example.com/a", b"content")
+
+        with open(path, "wb") as file:
+            file.write(b"tampered")
+
+        self.assertIsNone(self.cache.get("https://example.com/a"))
+        self.assertIsNone(self.cache.get_path("https://example.com/a"))
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
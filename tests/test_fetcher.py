@@ -0,0 +1,223 @@
+import unittest
+import requests
+from eqdatatools.exceptions import CircuitOpenError, FetchError
+from eqdatatools.scraper._fetcher import CircuitBreaker, Fetcher
+
+URL = "https://example.com/list.json"
+
+
+class FakeClock:
+    """Clock that only moves forward when sleep() is called."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FaultInjectingSession:
+    """
+    Session stub that returns (or raises) the queued outcomes in order. An
+    outcome is either a status code or an exception to raise.
+    """
+
+    def __init__(self, *outcomes) -> None:
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def queue(self, *outcomes) -> None:
+        self.outcomes.extend(outcomes)
+
+    def get(self, url, **kwargs):
+        self.requests.append((url, kwargs))
+        outcome = self.outcomes.pop(0)
+
+        if isinstance(outcome, Exception):
+            raise outcome
+
+        status_code, headers = outcome if isinstance(outcome, tuple) else (outcome, {})
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers)
+
+        return response
+
+
+def create_fetcher(session, clock, **kwargs):
+    options = {
+        "max_retries": 3,
+        "backoff_base": 0.5,
+        "backoff_max": 30,
+        "rate_limit": None,
+        "failure_threshold": 2,
+        "reset_timeout": 60,
+    }
+    options.update(kwargs)
+
+    return Fetcher(clock=clock, sleep=clock.sleep, random_func=lambda: 1.0, session=session, mount_adapters=False, **options)
+
+
+class FetcherRetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+
+    def test_retries_retryable_statuses_with_exponential_backoff(self) -> None:
+        session = FaultInjectingSession(503, 502, 200)
+        fetcher = create_fetcher(session, self.clock, failure_threshold=10)
+
+        response = fetcher.get(URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0])
+        metrics = fetcher.get_metrics()["example.com"]
+        self.assertEqual(metrics["requests"], 3)
+        self.assertEqual(metrics["retries"], 2)
+        self.assertEqual(metrics["failures"], 2)
+        self.assertEqual(metrics["successes"], 1)
+
+    def test_backoff_is_capped_and_respects_retry_after(self) -> None:
+        session = FaultInjectingSession(500, (429, {"Retry-After": "5"}), 500, 200)
+        fetcher = create_fetcher(session, self.clock, backoff_max=2, failure_threshold=10)
+
+        fetcher.get(URL)
+
+        self.assertEqual(self.clock.sleeps, [0.5, 2, 2])
+
+    def test_uses_connect_and_read_timeouts(self) -> None:
+        session = FaultInjectingSession(200)
+        fetcher = create_fetcher(session, self.clock, connect_timeout=3, read_timeout=7)
+
+        fetcher.get(URL)
+
+        self.assertEqual(session.requests[0][1]["timeout"], (3, 7))
+
+    def test_connection_errors_are_retried_until_attempts_run_out(self) -> None:
+        session = FaultInjectingSession(*[requests.ConnectionError("refused")] * 4)
+        fetcher = create_fetcher(session, self.clock, failure_threshold=10)
+
+        with self.assertRaises(FetchError):
+            fetcher.get(URL)
+
+        self.assertEqual(len(session.requests), 4)
+        self.assertEqual(len(self.clock.sleeps), 3)
+
+    def test_client_errors_are_not_retried(self) -> None:
+        session = FaultInjectingSession(404, 200)
+        fetcher = create_fetcher(session, self.clock)
+
+        with self.assertRaises(FetchError):
+            fetcher.get(URL)
+
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+
+class FetcherRateLimitTest(unittest.TestCase):
+    def test_requests_beyond_the_burst_wait_for_tokens(self) -> None:
+        clock = FakeClock()
+        session = FaultInjectingSession(200, 200, 200, 200)
+        fetcher = create_fetcher(session, clock, rate_limit=2.0, rate_burst=2)
+
+        for _ in range(4):
+            fetcher.get(URL)
+
+        self.assertEqual(clock.sleeps, [0.5, 0.5])
+        self.assertEqual(fetcher.get_metrics()["example.com"]["rate_limited_seconds"], 1.0)
+
+    def test_hosts_are_rate_limited_separately(self) -> None:
+        clock = FakeClock()
+        session = FaultInjectingSession(200, 200)
+        fetcher = create_fetcher(session, clock, rate_limit=1.0, rate_burst=1)
+
+        fetcher.get("https://a.example.com/")
+        fetcher.get("https://b.example.com/")
+
+        self.assertEqual(clock.sleeps, [])
+
+
+class FetcherCircuitBreakerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.session = FaultInjectingSession()
+        self.fetcher = create_fetcher(self.session, self.clock, max_retries=0)
+
+    def open_circuit(self) -> None:
+        self.session.queue(503, 503)
+
+        for _ in range(2):
+            with self.assertRaises(FetchError):
+                self.fetcher.get(URL)
+
+        self.assertEqual(self.get_circuit_state(), CircuitBreaker.OPEN)
+
+    def get_circuit_state(self) -> str:
+        return self.fetcher.get_metrics()["example.com"]["circuit_state"]
+
+    def test_open_circuit_rejects_requests_without_sending_them(self) -> None:
+        self.open_circuit()
+
+        with self.assertRaises(CircuitOpenError):
+            self.fetcher.get(URL)
+
+        self.assertEqual(len(self.session.requests), 2)
+        self.assertEqual(self.fetcher.get_metrics()["example.com"]["rejected"], 1)
+
+    def test_successful_trial_request_closes_the_circuit(self) -> None:
+        self.open_circuit()
+        self.clock.now += 60
+        self.session.queue(200)
+
+        self.fetcher.get(URL)
+
+        self.assertEqual(self.get_circuit_state(), CircuitBreaker.CLOSED)
+
+    def test_failed_trial_request_reopens_the_circuit(self) -> None:
+        self.open_circuit()
+        self.clock.now += 60
+        self.session.queue(503)
+
+        with self.assertRaises(FetchError):
+            self.fetcher.get(URL)
+
+        self.assertEqual(self.get_circuit_state(), CircuitBreaker.OPEN)
+
+        with self.assertRaises(CircuitOpenError):
+            self.fetcher.get(URL)
+
+    def test_client_error_on_trial_request_closes_the_circuit(self) -> None:
+        self.open_circuit()
+        self.clock.now += 60
+        self.session.queue(404, 200)
+
+        with self.assertRaises(FetchError):
+            self.fetcher.get(URL)
+
+        self.assertEqual(self.get_circuit_state(), CircuitBreaker.CLOSED)
+        self.assertEqual(self.fetcher.get_metrics()["example.com"]["rejected"], 0)
+        self.assertEqual(self.fetcher.get(URL).status_code, 200)
+
+    def test_unexpected_exception_on_trial_request_reopens_the_circuit(self) -> None:
+        self.open_circuit()
+        self.clock.now += 60
+        self.session.queue(requests.TooManyRedirects("loop"))
+
+        with self.assertRaises(requests.TooManyRedirects):
+            self.fetcher.get(URL)
+
+        self.assertEqual(self.get_circuit_state(), CircuitBreaker.OPEN)
+
+        self.clock.now += 60
+        self.session.queue(200)
+
+        self.assertEqual(self.fetcher.get(URL).status_code, 200)
+        self.assertEqual(self.get_circuit_state(), CircuitBreaker.CLOSED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from eqdatatools.constants import JMA_INTENSITY_LEVELS
+from eqdatatools.data_processor.stats import StatsGenerator, get_jma_intensity_histogram
+from eqdatatools.exceptions import InvalidIntensityFormat
+from eqdatatools.scraper import jma
+from eqdatatools.scraper._json import JMA_SOURCE_FIELDS, JMASourceEntry, decode_jma_entries, msgspec, orjson
+
+JMA_URL = "https://www.jma.go.jp/bosai/quake/data/list.json"
+
+
+def create_jma_entry(minute: int, max_intensity: str):
+    return {
+        "at": f"2024-08-10T02:{minute:02d}:00+09:00",
+        "rdt": f"2024-08-10T02:{minute:02d}:30+09:00",
+        "anm": "千葉県東方沖",
+        "en_anm": "Off the East Coast of Chiba",
+        "mag": "3.5",
+        "maxi": max_intensity,
+        "cod": "+35.1+139.2-10000/",
+        "ctt": f"2024081002{minute:02d}00",
+        "int": [],
+    }
+
+
+def scrape_jma_entries(*max_intensities):
+    entries = [create_jma_entry(minute, max_intensity) for minute, max_intensity in enumerate(max_intensities)]
+    response = SimpleNamespace(content=json.dumps(entries).encode())
+
+    with mock.patch("eqdatatools.scraper.jma.fetch", return_value=response):
+        return jma.scrape_data(JMA_URL, None)
+
+
+class JMAIntensityTest(unittest.TestCase):
+    def test_every_level_maps_to_its_position_on_the_scale(self) -> None:
+        eq_list = scrape_jma_entries(*JMA_INTENSITY_LEVELS, "")
+
+        self.assertEqual([entry["max_seismic_intensity"] for entry in eq_list], list(range(10)) + [None])
+
+    def test_split_levels_are_ordered(self) -> None:
+        eq_list = scrape_jma_entries("5+", "5-", "6-")
+        intensities = [entry["max_seismic_intensity"] for entry in eq_list]
+
+        self.assertLess(intensities[1], intensities[0])
+        self.assertLess(intensities[0], intensities[2])
+
+    def test_unknown_level_is_rejected(self) -> None:
+        with self.assertRaises(InvalidIntensityFormat):
+            scrape_jma_entries("8")
+
+    def test_intensity_histogram_has_a_bin_per_level(self) -> None:
+        eq_list = scrape_jma_entries("1", "5-", "5-", "5+", "6+", "7", "")
+
+        eq_stats = StatsGenerator(eq_list, {"intensity": get_jma_intensity_histogram()})
+        histogram = eq_stats["histograms"]["intensity"]
+        counts = {intensity_bin["label"]: intensity_bin["count"] for intensity_bin in histogram["bins"]}
+
+        self.assertEqual(list(counts), JMA_INTENSITY_LEVELS)
+        self.assertEqual(counts, {"0": 0, "1": 1, "2": 0, "3": 0, "4": 0, "5-": 2, "5+": 1, "6-": 0, "6+": 1, "7": 1})
+        self.assertEqual(histogram["unspecified"], 1)
+
+
+class DecodeJMAEntriesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        entries = [create_jma_entry(0, "5+"), {"at": "2024-08-10T02:34:00+09:00", "int": [{"code": "12"}]}]
+        self.content = json.dumps(entries, ensure_ascii=False).encode("utf-8")
+
+    def get_installed_backends(self):
+        return ["json"] + [backend for backend, module in (("orjson", orjson), ("msgspec", msgspec)) if module]
+
+    def test_only_the_used_fields_are_kept(self) -> None:
+        for backend in self.get_installed_backends():
+            with self.subTest(backend=backend):
+                entries = decode_jma_entries(self.content, backend)
+
+                self.assertTrue(all(isinstance(entry, JMASourceEntry) for entry in entries))
+                self.assertEqual(entries[0].maxi, "5+")
+                self.assertEqual(entries[0].anm, "千葉県東方沖")
+                self.assertEqual([getattr(entries[1], field) for field in JMA_SOURCE_FIELDS], ["2024-08-10T02:34:00+09:00"] + [""] * 7)
+                self.assertFalse(hasattr(entries[0], "int"))
+
+    def test_backends_return_the_same_entries(self) -> None:
+        expected_entries = decode_jma_entries(self.content, "json")
+
+        for backend in self.get_installed_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(decode_jma_entries(self.content, backend), expected_entries)
+
+    def test_backend_that_is_not_installed_is_rejected(self) -> None:
+        for backend, module in (("orjson", orjson), ("msgspec", msgspec)):
+            if module is None:
+                with self.assertRaises(ValueError):
+                    decode_jma_entries(self.content, backend)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from eqdatatools import merge_eq_lists
+from eqdatatools.data_processor.stats import StatsGenerator
+from eqdatatools.schema import create_event
+
+JAPAN_TIME = timezone(timedelta(hours=9))
+PHILIPPINE_TIME = timezone(timedelta(hours=8))
+
+
+def create_test_event(source, date, magnitude=4.0):
+    return create_event(
+        source=source,
+        date=date,
+        location="Somewhere",
+        magnitude=magnitude,
+        latitude=None,
+        longitude=None,
+        depth=None
+    )
+
+
+class MergeEqListsTest(unittest.TestCase):
+    def test_entries_are_ordered_by_instant_across_timezones(self) -> None:
+        jma_list = [
+            create_test_event("JMA", datetime(2024, 8, 1, 9, 30, tzinfo=JAPAN_TIME)),
+            create_test_event("JMA", datetime(2024, 8, 1, 8, 0, tzinfo=JAPAN_TIME)),
+        ]
+        phivolcs_list = [
+            create_test_event("PHIVOLCS", datetime(2024, 8, 1, 8, 0, tzinfo=PHILIPPINE_TIME)),
+            create_test_event("PHIVOLCS", datetime(2024, 8, 1, 7, 15, tzinfo=PHILIPPINE_TIME)),
+        ]
+
+        merged = list(merge_eq_lists(jma_list, phivolcs_list))
+
+        self.assertEqual([entry["source"] for entry in merged], ["JMA", "PHIVOLCS", "PHIVOLCS", "JMA"])
+        self.assertEqual([entry["date"] for entry in merged], sorted((entry["date"] for entry in merged), reverse=True))
+
+    def test_entries_created_with_local_dates_are_compared_in_utc(self) -> None:
+        local_entry = create_test_event("JMA", None)
+        local_entry["date"] = datetime(2024, 8, 1, 10, 0, tzinfo=JAPAN_TIME)
+        utc_entry = create_test_event("PHIVOLCS", datetime(2024, 8, 1, 2, 0, tzinfo=timezone.utc))
+
+        merged = list(merge_eq_lists([local_entry], [utc_entry]))
+
+        self.assertEqual([entry["source"] for entry in merged], ["PHIVOLCS", "JMA"])
+
+    def test_merge_is_lazy_and_handles_empty_lists(self) -> None:
+        eq_list = [create_test_event("JMA", datetime(2024, 8, 1, tzinfo=timezone.utc))]
+
+        merged = merge_eq_lists([], eq_list, [])
+
+        self.assertEqual(next(merged)["source"], "JMA")
+        self.assertEqual(list(merged), [])
+        self.assertEqual(list(merge_eq_lists()), [])
+
+    def test_merged_stream_can_be_summarized(self) -> None:
+        jma_list = [create_test_event("JMA", datetime(2024, 8, 2, tzinfo=timezone.utc), 6.2)]
+        phivolcs_list = [
+            create_test_event("PHIVOLCS", datetime(2024, 8, 3, tzinfo=timezone.utc), 2.1),
+            create_test_event("PHIVOLCS", datetime(2024, 8, 1, tzinfo=timezone.utc), 4.4),
+        ]
+
+        eq_stats = StatsGenerator(merge_eq_lists(jma_list, phivolcs_list))
+
+        self.assertEqual(eq_stats["recorded_eqs"]["total"], 3)
+        self.assertEqual(eq_stats["strongest"]["source"], "JMA")
+        self.assertEqual(eq_stats["date_range"]["start_date"], datetime(2024, 8, 1, tzinfo=timezone.utc))
+        self.assertEqual(eq_stats["date_range"]["end_date"], datetime(2024, 8, 3, tzinfo=timezone.utc))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from eqdatatools.scraper.phivolcs import scrape_data
+
+URL = "https://earthquake.phivolcs.dost.gov.ph/"
+ROWS = (
+    "<tr><td>01 August 2024 - 07:30 AM</td><td>12.1</td><td>121.5</td><td>10</td><td>4.2</td>"
+    "<td><a href='2024_Files/a.html'>010 km N of Town (Bohol)</a></td></tr>"
+    "<tr><td>31 July 2024 - 11:30 PM</td><td>9.8</td><td>125.1</td><td>320</td><td>2.1</td>"
+    "<td><a href='2024_Files/b.html'>005 km S of City (Cebu)</a></td></tr>"
+)
+CURRENT_PAGE = f"<html><table></table><table></table><table><tr><th>Date</th></tr>{ROWS}</table></html>"
+OLD_PAGE = f"<html><table></table><table>{ROWS}</table></html>"
+
+
+def scrape_page(page, start_date=None):
+    with mock.patch("eqdatatools.scraper.phivolcs.fetch", return_value=SimpleNamespace(text=page)) as fetch:
+        return scrape_data(URL, start_date), fetch.call_count
+
+
+class ScrapeDataTest(unittest.TestCase):
+    def test_entries_are_scraped_from_the_current_layout(self) -> None:
+        eq_list, fetch_count = scrape_page(CURRENT_PAGE)
+
+        self.assertEqual([entry["magnitude"] for entry in eq_list], [4.2, 2.1])
+        self.assertEqual(fetch_count, 1)
+
+    def test_old_layouts_fall_back_to_the_other_scrapers(self) -> None:
+        eq_list, fetch_count = scrape_page(OLD_PAGE)
+
+        self.assertEqual([entry["location"] for entry in eq_list], ["010 km N of Town (Bohol)", "005 km S of City (Cebu)"])
+        self.assertEqual(fetch_count, 2)
+
+    def test_tables_without_new_entries_do_not_fall_back(self) -> None:
+        eq_list, fetch_count = scrape_page(CURRENT_PAGE, start_date="2024-09-01T00:00:00+0800")
+
+        self.assertEqual(eq_list, [])
+        self.assertEqual(fetch_count, 1)
+
+    def test_entries_before_the_start_date_are_skipped(self) -> None:
+        eq_list, _ = scrape_page(CURRENT_PAGE, start_date="2024-08-01T00:00:00+0800")
+
+        self.assertEqual([entry["magnitude"] for entry in eq_list], [4.2])
+
+    def test_pages_without_the_table_return_no_entries(self) -> None:
+        eq_list, fetch_count = scrape_page("<html><p>Under maintenance</p></html>")
+
+        self.assertEqual(eq_list, [])
+        self.assertEqual(fetch_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
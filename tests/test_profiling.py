@@ -0,0 +1,58 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from eqdatatools import EarthquakeList
+
+PHIVOLCS_URLS = [
+    "https://earthquake.phivolcs.dost.gov.ph/",
+    "https://earthquake.phivolcs.dost.gov.ph/EQLatest-Monthly/2024/2024_August.html",
+]
+
+# Budget for the memory retained per entry of a built list. Entries take
+# about 1.4 KB each at the time of writing, so this leaves some headroom
+# while still catching e.g. parse trees being kept alive.
+MAX_BYTES_PER_ENTRY = 3000
+
+
+def create_phivolcs_page(row_count: int) -> str:
+    rows = "".join(
+        f"<tr><td>{1 + index % 28:02d} August 2024 - 07:30 AM</td><td>12.1</td><td>121.5</td><td>10</td>"
+        f"<td>4.2</td><td><a href='2024_Files/{index}.html'>010 km N 45° W of Town (Bohol)</a></td></tr>"
+        for index in range(row_count)
+    )
+
+    return f"<html><table></table><table></table><table><tr><th>Date</th></tr>{rows}</table></html>"
+
+
+class MemoryProfileTest(unittest.TestCase):
+    def setUp(self) -> None:
+        response = SimpleNamespace(text=create_phivolcs_page(1000))
+        patcher = mock.patch("eqdatatools.scraper.phivolcs.fetch", return_value=response)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_bytes_per_entry_stays_within_budget(self) -> None:
+        report = EarthquakeList(PHIVOLCS_URLS[0], profile=True).get_memory_profile()
+
+        self.assertEqual(report["entries"], 1000)
+        self.assertEqual([stage["stage"] for stage in report["stages"]], ["fetch", "parse", "extract", "stats", "display"])
+        self.assertLess(report["bytes_per_entry"], MAX_BYTES_PER_ENTRY)
+
+    def test_parse_tree_is_released_after_extraction(self) -> None:
+        report = EarthquakeList(PHIVOLCS_URLS[0], profile=True).get_memory_profile()
+        stages = {stage["stage"]: stage for stage in report["stages"]}
+        retained_after_extract = stages["parse"]["retained_bytes"] + stages["extract"]["retained_bytes"]
+
+        self.assertLess(retained_after_extract, stages["parse"]["retained_bytes"] * 0.25)
+
+    def test_lists_profiled_concurrently_are_measured_separately(self) -> None:
+        eq_lists = EarthquakeList.from_urls(PHIVOLCS_URLS, profile=True)
+
+        for eq_list in eq_lists:
+            report = eq_list.get_memory_profile()
+            self.assertEqual(len(report["stages"]), 5)
+            self.assertLess(report["bytes_per_entry"], MAX_BYTES_PER_ENTRY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+import requests
+from benchmarks.https_connections import create_test_certificates, start_https_server
+from eqdatatools.constants import PHIVOLCS_HOME_URL
+from eqdatatools.scraper._fetcher import Fetcher
+from eqdatatools.scraper._session import ConnectionManager, SSLContextAdapter, connection_manager
+
+PHIVOLCS_URL = PHIVOLCS_HOME_URL + "EQLatest-Monthly/2024/2024_August.html"
+
+
+class ConnectionManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = ConnectionManager()
+        self.addCleanup(self.manager.close)
+
+    def assert_uses_prebuilt_context(self, session: requests.Session, manager: ConnectionManager) -> None:
+        adapter = session.get_adapter(PHIVOLCS_URL)
+
+        self.assertIsInstance(adapter, SSLContextAdapter)
+        self.assertIs(adapter.poolmanager.connection_pool_kw["ssl_context"], manager._get_phivolcs_ssl_context())
+
+    def test_default_session_uses_prebuilt_context_for_phivolcs(self) -> None:
+        self.assert_uses_prebuilt_context(self.manager.get_session(), self.manager)
+
+    def test_other_hosts_use_the_default_adapter(self) -> None:
+        adapter = self.manager.get_session().get_adapter("https://www.jma.go.jp/bosai/quake/data/list.json")
+
+        self.assertNotIsInstance(adapter, SSLContextAdapter)
+
+    def test_session_is_shared(self) -> None:
+        self.assertIs(self.manager.get_session(), self.manager.get_session())
+
+    def test_set_session_mounts_adapter(self) -> None:
+        session = requests.Session()
+        self.manager.set_session(session)
+
+        self.assertIs(self.manager.get_session(), session)
+        self.assert_uses_prebuilt_context(session, self.manager)
+
+    def test_context_is_built_once(self) -> None:
+        first_session = self.manager.get_session()
+        self.manager.close()
+        second_session = self.manager.get_session()
+
+        self.assertIsNot(first_session, second_session)
+        self.assertIs(
+            first_session.get_adapter(PHIVOLCS_URL).ssl_context,
+            second_session.get_adapter(PHIVOLCS_URL).ssl_context
+        )
+
+    def test_ca_bundle_is_not_passed_to_connections(self) -> None:
+        adapter = self.manager.get_session().get_adapter(PHIVOLCS_URL)
+        connection_pool = SimpleNamespace()
+
+        adapter.cert_verify(connection_pool, PHIVOLCS_URL, True, None)
+
+        self.assertIsNone(connection_pool.ca_certs)
+        self.assertIsNone(connection_pool.ca_cert_dir)
+
+
+@unittest.skipUnless(shutil.which("openssl"), "needs the openssl command line tool")
+class TLSHandshakeTest(unittest.TestCase):
+    """Verifies real TLS connections to a local HTTPS server with a throwaway CA."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.directory = tempfile.mkdtemp()
+        cls.ca_file, cert_file, key_file = create_test_certificates(cls.directory)
+        cls.server = start_https_server(cert_file, key_file, {"/": b"ok"})
+        cls.url = f"https://127.0.0.1:{cls.server.server_address[1]}/"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+        shutil.rmtree(cls.directory)
+
+    def test_adapter_verifies_with_the_given_ca_file(self) -> None:
+        session = requests.Session()
+        self.addCleanup(session.close)
+        session.mount(self.url, SSLContextAdapter.from_ca_file(self.ca_file))
+
+        response = session.get(self.url)
+
+        self.assertEqual((response.status_code, response.content), (200, b"ok"))
+
+    def test_certificates_from_other_cas_are_rejected(self) -> None:
+        session = requests.Session()
+        self.addCleanup(session.close)
+
+        with self.assertRaises(requests.exceptions.SSLError):
+            session.get(self.url)
+
+    def test_shared_session_reuses_the_connection(self) -> None:
+        manager = ConnectionManager(ca_file=self.ca_file, ca_url=self.url)
+        self.addCleanup(manager.close)
+        connection_count = self.server.connection_count
+
+        for _ in range(3):
+            self.assertEqual(manager.get_session().get(self.url).content, b"ok")
+
+        self.assertEqual(self.server.connection_count - connection_count, 1)
+
+
+class FetcherSessionTest(unittest.TestCase):
+    def test_injected_session_uses_prebuilt_context_for_phivolcs(self) -> None:
+        session = requests.Session()
+        self.addCleanup(session.close)
+
+        Fetcher(session=session)
+
+        adapter = session.get_adapter(PHIVOLCS_URL)
+        self.assertIsInstance(adapter, SSLContextAdapter)
+        self.assertIs(adapter.ssl_context, connection_manager._get_phivolcs_ssl_context())
+
+    def test_injected_session_is_left_alone_when_asked(self) -> None:
+        session = requests.Session()
+        self.addCleanup(session.close)
+
+        Fetcher(session=session, mount_adapters=False)
+
+        self.assertNotIsInstance(session.get_adapter(PHIVOLCS_URL), SSLContextAdapter)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zlib
+from types import SimpleNamespace
+from unittest import mock
+from eqdatatools import EarthquakeList
+from eqdatatools.eq_list import PHIVOLCSEarthquakeList
+from eqdatatools.exceptions import InvalidSnapshotError
+from eqdatatools.snapshot import SNAPSHOT_MAGIC, SNAPSHOT_SCHEMA, SNAPSHOT_VERSION
+
+PHIVOLCS_URL = "https://earthquake.phivolcs.dost.gov.ph/"
+PHIVOLCS_PAGE = (
+    "<html><table></table><table></table><table><tr><th>Date</th></tr>"
+    "<tr><td>01 August 2024 - 07:30 AM</td><td>12.1</td><td>121.5</td><td>10</td><td>4.2</td>"
+    "<td><a href='2024_Files/a.html'>010 km N of Town (Bohol)</a></td></tr>"
+    "<tr><td>31 July 2024 - 11:30 PM</td><td>9.8</td><td>125.1</td><td>320</td><td>2.1</td>"
+    "<td><a href='2024_Files/b.html'>005 km S of City (Cebu)</a></td></tr>"
+    "</table></html>"
+)
+
+
+def write_snapshot(path, version=SNAPSHOT_VERSION, payload=None, magic=SNAPSHOT_MAGIC):
+    data = json.dumps(payload if payload is not None else {}).encode("utf-8")
+
+    with open(path, "wb") as file:
+        file.write(struct.pack(f">{len(magic)}sH", magic, version))
+        file.write(zlib.compress(data))
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "list.snapshot")
+
+        with mock.patch("eqdatatools.scraper.phivolcs.fetch", return_value=SimpleNamespace(text=PHIVOLCS_PAGE)):
+            self.eq_list = EarthquakeList(PHIVOLCS_URL)
+
+    def test_round_trip_restores_entries_and_stats(self) -> None:
+        self.eq_list.save_snapshot(self.path)
+
+        restored_list = EarthquakeList.load_snapshot(self.path)
+
+        self.assertIsInstance(restored_list, PHIVOLCSEarthquakeList)
+        self.assertEqual(restored_list.get_raw_eq_list(), self.eq_list.get_raw_eq_list())
+        self.assertEqual(restored_list.get_raw_eq_stats(), self.eq_list.get_raw_eq_stats())
+        self.assertEqual(restored_list.get_raw_eq_list()[0]["date"].utcoffset().total_seconds(), 0)
+
+    def test_restored_list_supports_queries_and_new_entries(self) -> None:
+        self.eq_list.save_snapshot(self.path)
+        restored_list = EarthquakeList.load_snapshot(self.path)
+
+        restored_list.extend([dict(self.eq_list.get_raw_eq_list()[0], magnitude=6.3)])
+
+        self.assertEqual(restored_list.top(1)[0]["magnitude"], 6.3)
+        self.assertEqual(restored_list.top(1, group_by="region")["Cebu"][0]["magnitude"], 2.1)
+        self.assertEqual(restored_list.get_raw_eq_stats()["recorded_eqs"]["total"], 3)
+
+    def test_files_that_are_not_snapshots_are_rejected(self) -> None:
+        with open(self.path, "wb") as file:
+            file.write(b"not a snapshot at all")
+
+        with self.assertRaisesRegex(InvalidSnapshotError, "not a snapshot"):
+            EarthquakeList.load_snapshot(self.path)
+
+    def test_truncated_files_are_rejected(self) -> None:
+        with open(self.path, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+
+        with self.assertRaisesRegex(InvalidSnapshotError, "too short"):
+            EarthquakeList.load_snapshot(self.path)
+
+    def test_other_versions_are_rejected(self) -> None:
+        write_snapshot(self.path, version=SNAPSHOT_VERSION - 1)
+
+        with self.assertRaisesRegex(InvalidSnapshotError, "version"):
+            EarthquakeList.load_snapshot(self.path)
+
+    def test_corrupted_payloads_are_rejected(self) -> None:
+        self.eq_list.save_snapshot(self.path)
+
+        with open(self.path, "r+b") as file:
+            file.seek(-8, os.SEEK_END)
+            file.write(b"\x00" * 8)
+
+        with self.assertRaisesRegex(InvalidSnapshotError, "corrupted"):
+            EarthquakeList.load_snapshot(self.path)
+
+    def test_other_schemas_are_rejected(self) -> None:
+        write_snapshot(self.path, payload={"source": "PHIVOLCS", "schema": SNAPSHOT_SCHEMA[:-1], "eq_list": [], "eq_stats": {}})
+
+        with self.assertRaisesRegex(InvalidSnapshotError, "schema"):
+            EarthquakeList.load_snapshot(self.path)
+
+    def test_unregistered_sources_are_rejected(self) -> None:
+        write_snapshot(self.path, payload={"source": "UNKNOWN", "schema": SNAPSHOT_SCHEMA, "eq_list": [], "eq_stats": {}})
+
+        with self.assertRaisesRegex(InvalidSnapshotError, "not registered"):
+            EarthquakeList.load_snapshot(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
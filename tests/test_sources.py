@@ -0,0 +1,183 @@
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+from eqdatatools import EarthquakeList
+from eqdatatools.constants import VALID_DATE_FORMATS
+from eqdatatools.eq_list import BaseEarthquakeList, JMAEarthquakeList, PHIVOLCSEarthquakeList
+from eqdatatools.exceptions import DuplicateSourceError, InvalidURLError
+from eqdatatools.schema import create_event
+from eqdatatools.sources import Source, SourceRegistry, register_source, registry
+
+PLUGIN_SOURCE_NAME = "EXAMPLE_PLUGIN"
+PLUGIN_URL = "https://quakes.example.com/feed.json"
+PLUGIN_TIMEZONE = timezone(timedelta(hours=-5))
+
+
+def scrape_plugin_data(url, start_date):
+    return [
+        create_event(
+            source=PLUGIN_SOURCE_NAME,
+            date=datetime(2024, 8, day, tzinfo=timezone.utc),
+            location=f"Near {region}",
+            magnitude=magnitude,
+            latitude=None,
+            longitude=None,
+            depth=10
+        )
+        for day, region, magnitude in ((1, "Alpha", 4.0), (2, "Alpha", 5.5), (3, "Beta", 3.1))
+    ]
+
+
+def create_source(name, hosts=("quakes.example.com",), url_patterns=(r"^https://quakes\.example\.com/feed\.json$",), **kwargs):
+    return Source(name, hosts=hosts, url_patterns=url_patterns, scraper=scrape_plugin_data, **kwargs)
+
+
+def create_entry_point(source):
+    return SimpleNamespace(load=mock.Mock(return_value=source))
+
+
+class SourceRegistryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = SourceRegistry()
+        self.registry._get_entry_points = lambda: []
+
+    def test_url_is_dispatched_by_host_and_pattern(self) -> None:
+        feed_source = create_source("FEED")
+        archive_source = create_source("ARCHIVE", url_patterns=[r"^https://quakes\.example\.com/archive/\d{4}$"])
+        self.registry.register(feed_source)
+        self.registry.register(archive_source)
+
+        self.assertIs(self.registry.get_source_for_url(PLUGIN_URL), feed_source)
+        self.assertIs(self.registry.get_source_for_url("https://quakes.example.com/archive/2024"), archive_source)
+
+    def test_hosts_are_registered_without_case(self) -> None:
+        source = create_source("FEED", hosts=["Quakes.Example.com"])
+        self.registry.register(source)
+
+        self.assertIs(self.registry.get_source_for_url(PLUGIN_URL), source)
+
+    def test_unknown_urls_are_rejected(self) -> None:
+        self.registry.register(create_source("FEED"))
+
+        for url in ("https://other.example.com/feed.json", "https://quakes.example.com/other.json"):
+            with self.subTest(url=url), self.assertRaises(InvalidURLError):
+                self.registry.get_source_for_url(url)
+
+    def test_names_must_be_unique(self) -> None:
+        self.registry.register(create_source("FEED"))
+
+        with self.assertRaises(DuplicateSourceError):
+            self.registry.register(create_source("FEED", hosts=["other.example.com"]))
+
+    def test_date_formats_and_timezone_fall_back_to_defaults(self) -> None:
+        self.registry.register(create_source("FEED", date_formats=["%Y"], tzinfo=PLUGIN_TIMEZONE))
+        self.registry.register(create_source("PLAIN", hosts=["plain.example.com"]))
+
+        self.assertEqual(self.registry.get_date_formats("FEED"), ["%Y"])
+        self.assertEqual(self.registry.get_date_formats("PLAIN"), VALID_DATE_FORMATS["DEFAULT"])
+        self.assertEqual(self.registry.get_timezone("FEED"), PLUGIN_TIMEZONE)
+        self.assertEqual(self.registry.get_timezone("UNKNOWN"), timezone.utc)
+
+
+class EntryPointLoadingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.registry = SourceRegistry()
+
+    def test_plugins_are_registered_once_on_first_lookup(self) -> None:
+        entry_point = create_entry_point(create_source("FEED"))
+        self.registry._get_entry_points = mock.Mock(return_value=[entry_point])
+
+        self.assertEqual(self.registry.get_source_for_url(PLUGIN_URL).name, "FEED")
+        self.assertEqual(self.registry.get_source_names(), ["FEED"])
+        self.assertEqual(entry_point.load.call_count, 1)
+        self.assertEqual(self.registry._get_entry_points.call_count, 1)
+
+    def test_plugins_for_registered_names_are_skipped(self) -> None:
+        source = create_source("FEED")
+        self.registry.register(source)
+        self.registry._get_entry_points = lambda: [create_entry_point(create_source("FEED"))]
+
+        self.assertIs(self.registry.get_source("FEED"), source)
+
+    def test_plugin_can_look_up_sources_while_loading(self) -> None:
+        self.registry.register(create_source("BUILTIN", hosts=["builtin.example.com"]))
+
+        def load_plugin():
+            self.registry.get_source("BUILTIN")
+            return create_source("FEED")
+
+        self.registry._get_entry_points = lambda: [SimpleNamespace(load=load_plugin)]
+
+        self.assertEqual(self.registry.get_source("FEED").name, "FEED")
+
+    def test_failed_loading_is_retried(self) -> None:
+        entry_point = SimpleNamespace(load=mock.Mock(side_effect=[ImportError("broken plugin"), create_source("FEED")]))
+        self.registry._get_entry_points = lambda: [entry_point]
+
+        with self.assertRaises(ImportError):
+            self.registry.get_source_names()
+
+        self.assertEqual(self.registry.get_source_names(), ["FEED"])
+
+    def test_concurrent_lookups_wait_for_every_plugin(self) -> None:
+        loading_started = threading.Event()
+        release_loading = threading.Event()
+
+        def load_plugin():
+            loading_started.set()
+            release_loading.wait(5)
+            return create_source("FEED")
+
+        self.registry._get_entry_points = lambda: [SimpleNamespace(load=load_plugin)]
+        loader = threading.Thread(target=self.registry.get_source_names)
+        loader.start()
+        loading_started.wait(5)
+        results = []
+        lookup = threading.Thread(target=lambda: results.append(self.registry.get_source_for_url(PLUGIN_URL).name))
+        lookup.start()
+        release_loading.set()
+        loader.join(5)
+        lookup.join(5)
+
+        self.assertEqual(results, ["FEED"])
+
+
+class PluginSourceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        if PLUGIN_SOURCE_NAME not in registry.get_source_names():
+            register_source(create_source(
+                PLUGIN_SOURCE_NAME,
+                region_key=lambda entry: entry["location"].split()[-1],
+                tzinfo=PLUGIN_TIMEZONE
+            ))
+
+    def test_builtin_urls_get_their_list_classes(self) -> None:
+        self.assertIs(registry.get_source_for_url("https://www.jma.go.jp/bosai/quake/data/list.json").earthquake_list_class, JMAEarthquakeList)
+        self.assertIs(registry.get_source_for_url("https://earthquake.phivolcs.dost.gov.ph/").earthquake_list_class, PHIVOLCSEarthquakeList)
+
+    def test_source_with_only_a_scraper_gets_a_list_class(self) -> None:
+        eq_list = EarthquakeList(PLUGIN_URL)
+
+        self.assertIsInstance(eq_list, BaseEarthquakeList)
+        self.assertEqual(type(eq_list).__name__, f"{PLUGIN_SOURCE_NAME}EarthquakeList")
+        self.assertIs(type(EarthquakeList(PLUGIN_URL)), type(eq_list))
+        self.assertEqual(eq_list.get_raw_eq_stats()["recorded_eqs"]["total"], 3)
+        self.assertEqual({region: entries[0]["magnitude"] for region, entries in eq_list.top(1, group_by="region").items()},
+                         {"Alpha": 5.5, "Beta": 3.1})
+        self.assertEqual(eq_list.eq_display._to_local_time(datetime(2024, 8, 1, tzinfo=timezone.utc)).utcoffset(), timedelta(hours=-5))
+
+    def test_from_urls_keeps_the_order_of_the_urls(self) -> None:
+        eq_lists = EarthquakeList.from_urls([PLUGIN_URL, PLUGIN_URL], max_workers=2)
+
+        self.assertEqual([len(eq_list.get_raw_eq_list()) for eq_list in eq_lists], [3, 3])
+
+    def test_unknown_url_is_rejected(self) -> None:
+        with self.assertRaises(InvalidURLError):
+            EarthquakeList("https://example.org/feed.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
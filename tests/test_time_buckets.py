@@ -0,0 +1,113 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from eqdatatools.data_processor.stats import TimeBucketAggregator
+from eqdatatools.schema import create_event
+
+
+def create_test_event(date: datetime, magnitude=4.0):
+    return create_event(
+        source="TEST",
+        date=date,
+        location="Somewhere",
+        magnitude=magnitude,
+        latitude=None,
+        longitude=None,
+        depth=None
+    )
+
+
+def utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TimeBucketAggregatorTest(unittest.TestCase):
+    def test_entries_are_grouped_into_daily_buckets(self) -> None:
+        aggregator = TimeBucketAggregator([
+            create_test_event(utc(2024, 10, 1, 3), 4.5),
+            create_test_event(utc(2024, 10, 1, 22), 6.1),
+            create_test_event(utc(2024, 10, 2, 5), None),
+        ])
+
+        series = aggregator.get_series()
+
+        self.assertEqual([bucket["start"] for bucket in series], [utc(2024, 10, 1), utc(2024, 10, 2)])
+        self.assertEqual([bucket["total"] for bucket in series], [2, 1])
+        self.assertEqual(series[0]["max_magnitude"], 6.1)
+        self.assertEqual(series[0]["total_per_magnitude"]["m6_to_7_9"], 1)
+        self.assertEqual(series[1]["total_per_magnitude"]["unspecified"], 1)
+        self.assertEqual(series[1]["energy"], 0.0)
+        self.assertEqual(series[1]["cumulative_energy"], series[0]["energy"])
+
+    def test_empty_intervals_are_filled_unless_disabled(self) -> None:
+        aggregator = TimeBucketAggregator([
+            create_test_event(utc(2024, 10, 1)),
+            create_test_event(utc(2024, 10, 4)),
+        ])
+
+        filled_series = aggregator.get_series()
+        sparse_series = aggregator.get_series(fill_empty=False)
+
+        self.assertEqual([bucket["total"] for bucket in filled_series], [1, 0, 0, 1])
+        self.assertEqual(filled_series[1]["start"], utc(2024, 10, 2))
+        self.assertEqual([bucket["start"] for bucket in sparse_series], [utc(2024, 10, 1), utc(2024, 10, 4)])
+
+    def test_window_keeps_only_the_last_intervals(self) -> None:
+        aggregator = TimeBucketAggregator(interval="day", window=2)
+
+        aggregator.update([
+            create_test_event(utc(2024, 10, 18)),
+            create_test_event(utc(2024, 10, 19)),
+            create_test_event(utc(2024, 10, 20)),
+        ])
+        aggregator.add(create_test_event(utc(2024, 10, 17)))
+
+        series = aggregator.get_series()
+
+        self.assertEqual([bucket["start"] for bucket in series], [utc(2024, 10, 19), utc(2024, 10, 20)])
+        self.assertIsNone(aggregator.get_bucket(utc(2024, 10, 18)))
+
+    def test_windowed_series_covers_the_whole_window(self) -> None:
+        aggregator = TimeBucketAggregator([create_test_event(utc(2024, 10, 20))], interval="day", window=3)
+
+        series = aggregator.get_series()
+
+        self.assertEqual([bucket["start"] for bucket in series], [utc(2024, 10, 18), utc(2024, 10, 19), utc(2024, 10, 20)])
+        self.assertEqual([bucket["total"] for bucket in series], [0, 0, 1])
+
+    def test_monthly_buckets_move_by_calendar_month(self) -> None:
+        aggregator = TimeBucketAggregator([
+            create_test_event(utc(2024, 11, 30)),
+            create_test_event(utc(2025, 1, 31)),
+            create_test_event(utc(2025, 3, 1)),
+        ], interval="month", window=3)
+
+        series = aggregator.get_series()
+
+        self.assertEqual([bucket["start"] for bucket in series], [utc(2025, 1, 1), utc(2025, 2, 1), utc(2025, 3, 1)])
+        self.assertEqual([bucket["total"] for bucket in series], [1, 0, 1])
+
+    def test_weekly_buckets_start_on_monday(self) -> None:
+        aggregator = TimeBucketAggregator([create_test_event(utc(2024, 10, 20, 12))], interval="week")
+
+        self.assertEqual(aggregator.get_series()[0]["start"], utc(2024, 10, 14))
+
+    def test_invalid_interval_and_window_are_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            TimeBucketAggregator(interval="year")
+        with self.assertRaises(ValueError):
+            TimeBucketAggregator(window=0)
+
+    def test_buckets_follow_the_calendar_of_the_timezone(self) -> None:
+        philippine_time = timezone(timedelta(hours=8))
+        eq_list = [create_test_event(utc(2024, 7, 31, 23, 30)), create_test_event(utc(2024, 8, 1, 1))]
+
+        daily_series = TimeBucketAggregator(eq_list, interval="day", tz=philippine_time).get_series()
+        monthly_series = TimeBucketAggregator(eq_list, interval="month", tz=philippine_time).get_series()
+
+        self.assertEqual([(bucket["start"], bucket["total"]) for bucket in daily_series], [(datetime(2024, 8, 1, tzinfo=philippine_time), 2)])
+        self.assertEqual([(bucket["start"].month, bucket["total"]) for bucket in monthly_series], [(8, 2)])
+        self.assertEqual([bucket["total"] for bucket in TimeBucketAggregator(eq_list).get_series()], [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+from eqdatatools import EarthquakeList
+from eqdatatools.data_processor.stats import TopK
+from eqdatatools.schema import create_event
+
+PHIVOLCS_URL = "https://earthquake.phivolcs.dost.gov.ph/"
+
+# Date, depth, magnitude and province of each row, newest first
+PHIVOLCS_ROWS = [
+    ("03 August 2024 - 07:30 AM", 10, 5.1, "Bohol"),
+    ("02 August 2024 - 06:30 AM", 120, 2.2, "Cebu"),
+    ("01 August 2024 - 11:30 PM", 5, 3.7, "Cebu"),
+]
+
+
+def create_phivolcs_page(rows) -> str:
+    table_rows = "".join(
+        f"<tr><td>{date}</td><td>12.1</td><td>121.5</td><td>{depth}</td><td>{magnitude}</td>"
+        f"<td><a href='2024_Files/{index}.html'>010 km N of Town ({province})</a></td></tr>"
+        for index, (date, depth, magnitude, province) in enumerate(rows)
+    )
+
+    return f"<html><table></table><table></table><table><tr><th>Date</th></tr>{table_rows}</table></html>"
+
+
+def create_test_event(magnitude, depth=10, province="Bohol", day=4):
+    return create_event(
+        source="PHIVOLCS",
+        date=datetime(2024, 8, day, tzinfo=timezone.utc),
+        location=f"010 km N of Town ({province})",
+        magnitude=magnitude,
+        latitude=12.1,
+        longitude=121.5,
+        depth=depth
+    )
+
+
+class TopKTest(unittest.TestCase):
+    def test_keeps_the_largest_entries_in_order(self) -> None:
+        top_k = TopK(2)
+        top_k.update(create_test_event(magnitude) for magnitude in (3.0, 5.0, None, 4.0, 1.0))
+
+        self.assertEqual([entry["magnitude"] for entry in top_k.get_top()], [5.0, 4.0])
+
+    def test_keeps_the_smallest_entries_when_asked(self) -> None:
+        top_k = TopK(2, by="depth", smallest=True)
+        top_k.update(create_test_event(4.0, depth) for depth in (30, 5, 700, 12))
+
+        self.assertEqual([entry["depth"] for entry in top_k.get_top()], [5, 12])
+
+    def test_groups_by_region_key(self) -> None:
+        top_k = TopK(1, group_by="region", region_key=lambda entry: entry["location"][-5:-1])
+        top_k.update([create_test_event(4.0, province="Cebu"), create_test_event(6.0, province="Cebu")])
+
+        self.assertEqual({region: entries[0]["magnitude"] for region, entries in top_k.get_top().items()}, {"Cebu": 6.0})
+
+    def test_rejects_more_entries_than_kept(self) -> None:
+        with self.assertRaises(ValueError):
+            TopK(2).get_top(3)
+
+
+class EarthquakeListTopTest(unittest.TestCase):
+    def setUp(self) -> None:
+        response = SimpleNamespace(text=create_phivolcs_page(PHIVOLCS_ROWS))
+
+        with mock.patch("eqdatatools.scraper.phivolcs.fetch", return_value=response):
+            self.eq_list = EarthquakeList(PHIVOLCS_URL)
+
+    def test_top_groups_by_province(self) -> None:
+        top = self.eq_list.top(1, group_by="region")
+
+        self.assertEqual({region: entries[0]["magnitude"] for region, entries in top.items()}, {"Bohol": 5.1, "Cebu": 3.7})
+
+    def test_months_follow_the_source_timezone(self) -> None:
+        rows = [("01 August 2024 - 07:30 AM", 10, 4.4, "Bohol"), ("31 July 2024 - 11:30 PM", 10, 2.0, "Bohol")]
+
+        with mock.patch("eqdatatools.scraper.phivolcs.fetch", return_value=SimpleNamespace(text=create_phivolcs_page(rows))):
+            eq_list = EarthquakeList(PHIVOLCS_URL)
+
+        top = eq_list.top(1, group_by="month")
+        series = eq_list.aggregate_by_time("day").get_series()
+
+        self.assertEqual({month: entries[0]["magnitude"] for month, entries in top.items()}, {(2024, 8): 4.4, (2024, 7): 2.0})
+        self.assertEqual([(bucket["start"].day, bucket["total"]) for bucket in series], [(31, 1), (1, 1)])
+
+    def test_appended_entries_reach_kept_trackers_and_stats(self) -> None:
+        self.assertEqual(self.eq_list.top(1)[0]["magnitude"], 5.1)
+        self.assertEqual(self.eq_list.top(1, by="depth")[0]["depth"], 120)
+
+        self.eq_list.append(create_test_event(7.0, depth=500, province="Cebu"))
+
+        eq_stats = self.eq_list.get_raw_eq_stats()
+        depth_bins = {depth_bin["label"]: depth_bin for depth_bin in eq_stats["histograms"]["depth"]["bins"]}
+        self.assertEqual(self.eq_list.top(1)[0]["magnitude"], 7.0)
+        self.assertEqual(self.eq_list.top(1, by="depth")[0]["depth"], 500)
+        self.assertEqual(self.eq_list.top(1, group_by="region")["Cebu"][0]["magnitude"], 7.0)
+        self.assertEqual(eq_stats["recorded_eqs"]["total"], 4)
+        self.assertEqual(eq_stats["recorded_eqs"]["total_per_magnitude"]["m6_to_7_9"], 1)
+        self.assertEqual(eq_stats["strongest"]["magnitude"], 7.0)
+        self.assertEqual(eq_stats["top"]["strongest"][0]["magnitude"], 7.0)
+        self.assertEqual((depth_bins["deep"]["count"], depth_bins["deep"]["min"]), (1, 500))
+        self.assertEqual(eq_stats["date_range"]["end_date"], datetime(2024, 8, 4, tzinfo=timezone.utc))
+
+    def test_extend_matches_building_the_stats_at_once(self) -> None:
+        new_entries = [create_test_event(1.2, day=5), create_test_event(6.4, depth=80, day=6)]
+
+        self.eq_list.extend(new_entries)
+
+        with mock.patch("eqdatatools.scraper.phivolcs.fetch", return_value=SimpleNamespace(text=create_phivolcs_page(PHIVOLCS_ROWS))):
+            expected_list = EarthquakeList(PHIVOLCS_URL)
+
+        expected_list.get_raw_eq_list().extend(new_entries)
+        expected_stats = expected_list._get_stats()
+        self.assertEqual(self.eq_list.get_raw_eq_stats()["recorded_eqs"], expected_stats["recorded_eqs"])
+        self.assertEqual(self.eq_list.get_raw_eq_stats()["histograms"], expected_stats["histograms"])
+        self.assertEqual(self.eq_list.get_raw_eq_stats()["weakest"]["magnitude"], 1.2)
+
+    def test_trackers_grouped_by_a_function_are_not_kept(self) -> None:
+        tracker_count = len(self.eq_list._top_k)
+
+        for _ in range(3):
+            self.eq_list.top(1, group_by=lambda entry: entry["depth"] > 50)
+
+        self.assertEqual(len(self.eq_list._top_k), tracker_count)
+
+
+if __name__ == "__main__":
+    unittest.main()